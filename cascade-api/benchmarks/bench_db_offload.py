@@ -0,0 +1,64 @@
+"""Benchmark: blocking Supabase calls vs. off-loop execution under concurrency.
+
+Simulates N concurrent webhook handlers, each doing a few sequential queries
+against a sync client with fixed latency (the Supabase SDK's behaviour), and
+compares wall-clock throughput of calling ``.execute()`` inline against
+awaiting ``cascade_api.db.client.execute``.
+
+    python benchmarks/bench_db_offload.py --webhooks 50 --queries 4 --latency-ms 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from cascade_api.db.client import execute
+
+
+class _SlowQuery:
+    """Stand-in for a PostgREST builder whose execute() blocks for a round trip."""
+
+    def __init__(self, latency_s: float):
+        self._latency_s = latency_s
+
+    def execute(self):
+        time.sleep(self._latency_s)
+        return {"data": []}
+
+
+async def _handler_blocking(queries: int, latency_s: float) -> None:
+    for _ in range(queries):
+        _SlowQuery(latency_s).execute()
+
+
+async def _handler_offloaded(queries: int, latency_s: float) -> None:
+    for _ in range(queries):
+        await execute(_SlowQuery(latency_s))
+
+
+async def _run(handler, webhooks: int, queries: int, latency_s: float) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(handler(queries, latency_s) for _ in range(webhooks)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--webhooks", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    args = parser.parse_args()
+
+    latency_s = args.latency_ms / 1000
+    for name, handler in (
+        ("blocking", _handler_blocking),
+        ("offloaded", _handler_offloaded),
+    ):
+        elapsed = asyncio.run(_run(handler, args.webhooks, args.queries, latency_s))
+        print(f"{name:>10}: {elapsed:6.2f}s  {args.webhooks / elapsed:7.1f} webhooks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Benchmark: one request per embed() vs. BatchingEmbedder against a fake server.
+
+Starts a local HTTP embedding server that behaves like a quota-limited
+API: each request costs a fixed round trip plus a little per text, and
+only a few requests are served at once (the rest queue). Callers arrive
+open-loop at ``--rate`` embed() calls per second, each with a distinct
+text, and the same load is run direct and through ``BatchingEmbedder``
+at each window. Reports caller p50/p99 latency, completed calls/s and
+upstream requests/s.
+
+    python benchmarks/bench_embed_batching.py --rate 200 --seconds 5 \\
+        --latency-ms 150 --server-concurrency 4 --windows 0.002 0.005 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import socket
+import statistics
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+from cascade_api.memory.embedders.batching import BatchingEmbedder
+
+DIMENSIONS = 8
+
+
+def _fake_server(latency_s: float, per_text_s: float, concurrency: int) -> tuple[FastAPI, dict]:
+    app = FastAPI()
+    slots = asyncio.Semaphore(concurrency)
+    stats = {"requests": 0}
+
+    @app.post("/embed")
+    async def embed(body: dict) -> dict:
+        texts = body["texts"]
+        stats["requests"] += 1
+        async with slots:
+            await asyncio.sleep(latency_s + per_text_s * len(texts))
+        return {"embeddings": [[float(len(t))] * DIMENSIONS for t in texts]}
+
+    return app, stats
+
+
+class HttpEmbedder:
+    """Embedder that calls the fake server; one HTTP request per call."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self._client = client
+
+    @property
+    def dimensions(self) -> int:
+        return DIMENSIONS
+
+    async def embed(self, text: str) -> list[float]:
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        response = await self._client.post("/embed", json={"texts": texts})
+        response.raise_for_status()
+        return response.json()["embeddings"]
+
+
+async def _load(embedder, rate: float, seconds: float) -> tuple[list[float], float]:
+    latencies: list[float] = []
+
+    async def call(i: int) -> None:
+        start = time.perf_counter()
+        await embedder.embed(f"query {i}")
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    tasks = []  # open loop: arrivals don't wait for earlier calls
+    i = 0
+    while (elapsed := time.perf_counter() - start) < seconds:
+        tasks.append(asyncio.create_task(call(i)))
+        i += 1
+        await asyncio.sleep(max(0.0, i / rate - elapsed) * random.uniform(0.5, 1.5))
+    await asyncio.gather(*tasks)
+    return latencies, time.perf_counter() - start
+
+
+def _pct(values: list[float], q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(q * len(values)))]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def main(args: argparse.Namespace) -> None:
+    app, server_stats = _fake_server(
+        args.latency_ms / 1000, args.per_text_ms / 1000, args.server_concurrency
+    )
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, port=port, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    limits = httpx.Limits(max_connections=1000, max_keepalive_connections=1000)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=120
+    ) as client:
+        base = HttpEmbedder(client)
+        modes = [("direct", base)] + [
+            (
+                f"batch {w * 1000:g}ms",
+                BatchingEmbedder(
+                    base,
+                    window_s=w,
+                    max_batch_size=args.max_batch,
+                    max_in_flight=args.server_concurrency,
+                ),
+            )
+            for w in args.windows
+        ]
+        print(
+            f"rate {args.rate:g}/s for {args.seconds:g}s, server {args.latency_ms:g}ms"
+            f" x{args.server_concurrency} concurrent\n"
+        )
+        print(f"{'mode':>12}  {'p50 ms':>8}  {'p99 ms':>8}  {'calls/s':>8}  {'upstream/s':>10}")
+        for name, embedder in modes:
+            server_stats["requests"] = 0
+            latencies, elapsed = await _load(embedder, args.rate, args.seconds)
+            print(
+                f"{name:>12}  {statistics.median(latencies):8.1f}  {_pct(latencies, 0.99):8.1f}"
+                f"  {len(latencies) / elapsed:8.1f}  {server_stats['requests'] / elapsed:10.1f}"
+            )
+
+    server.should_exit = True
+    await serving
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=200.0)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--per-text-ms", type=float, default=0.5)
+    parser.add_argument("--server-concurrency", type=int, default=4)
+    parser.add_argument("--max-batch", type=int, default=100)
+    parser.add_argument("--windows", type=float, nargs="+", default=[0.002, 0.005, 0.01])
+    asyncio.run(main(parser.parse_args()))
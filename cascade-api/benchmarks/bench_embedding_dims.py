@@ -0,0 +1,134 @@
+"""Benchmark: memory recall quality at reduced Gemini embedding widths.
+
+gemini-embedding-001 returns 3072 dims natively; ``GeminiEmbedder`` asks
+for a Matryoshka-truncated width instead (768 by default, matching
+``memories.embedding``). This embeds a small built-in set of user facts
+and recall-style queries at each width and reports, per width:
+
+- hit@k  — the query's relevant fact is in the top k
+- MRR    — mean reciprocal rank of the relevant fact
+- overlap — share of the 3072-dim top k also found at this width
+- bytes  — storage per vector (pgvector stores float4); HNSW indexes
+  only support up to 2000 dims
+
+Needs GEMINI_API_KEY (one embed request per width and batch).
+
+    python benchmarks/bench_embedding_dims.py --dims 256 768 3072 --k 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import os
+import statistics
+
+from cascade_api.memory.embedders.gemini import NATIVE_DIMENSIONS, GeminiEmbedder
+
+HNSW_MAX_DIMENSIONS = 2000
+
+FACTS = [
+    "Goal for the year is to reach $10k MRR from the design consultancy",
+    "Prefers deep work in the morning, before 11am",
+    "Energy drops sharply after lunch most days",
+    "Sends cold outreach DMs on LinkedIn, aiming for 10 a week",
+    "Has a daughter with swim practice Tuesday and Thursday evenings",
+    "Gets anxious about pricing conversations and tends to undercharge",
+    "Runs three times a week, usually Monday, Wednesday and Saturday",
+    "Quarterly focus is launching a Figma template store",
+    "Dislikes long task lists; wants at most three priorities a day",
+    "Weekly review happens on Sunday evenings",
+    "Works from a co-working space on Wednesdays",
+    "Past attempt at a newsletter stalled after six issues",
+    "Biggest client is a fintech startup paying a monthly retainer",
+    "Wants to stop working weekends by the end of the quarter",
+    "Sleeps badly when working past 10pm",
+    "Learning Webflow to offer no-code sites",
+    "Partner handles school drop-off on Mondays and Fridays",
+    "Finds accountability check-ins motivating, but not more than once a day",
+    "Portfolio site has not been updated in two years",
+    "Considering hiring a part-time virtual assistant for invoicing",
+    "Coffee after 2pm ruins their sleep",
+    "Tracks revenue in a Notion dashboard",
+    "Procrastinates on admin tasks like bookkeeping",
+    "Best sales conversations come from referrals by past clients",
+]
+
+# (query, index of the relevant fact)
+QUERIES = [
+    ("when should I schedule focused work?", 1),
+    ("how much revenue are they trying to hit", 0),
+    ("what's going on Tuesday evening", 4),
+    ("how many outreach messages per week", 3),
+    ("trouble setting rates", 5),
+    ("exercise routine", 6),
+    ("what are they building this quarter", 7),
+    ("how many tasks to suggest per day", 8),
+    ("when is the weekly planning session", 9),
+    ("why did the newsletter fail", 11),
+    ("who is the main paying customer", 12),
+    ("work-life balance goal", 13),
+    ("late night work and rest", 14),
+    ("new skills they're picking up", 15),
+    ("how often to nudge them", 17),
+    ("should they get help with admin", 19),
+    ("caffeine habits", 20),
+    ("where do good leads come from", 23),
+]
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b, strict=True))
+    return dot / (math.hypot(*a) * math.hypot(*b))
+
+
+def _rankings(queries: list[list[float]], facts: list[list[float]]) -> list[list[int]]:
+    return [
+        sorted(range(len(facts)), key=lambda i, q=q: _cosine(q, facts[i]), reverse=True)
+        for q in queries
+    ]
+
+
+async def _embed(api_key: str, dims: int) -> tuple[list[list[float]], list[list[float]]]:
+    embedder = GeminiEmbedder(api_key=api_key, output_dimensionality=dims)
+    facts = await embedder.embed_batch(FACTS)
+    queries = await embedder.embed_batch([q for q, _ in QUERIES])
+    return queries, facts
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dims", type=int, nargs="+", default=[256, 768, NATIVE_DIMENSIONS])
+    parser.add_argument("--k", type=int, default=3)
+    args = parser.parse_args()
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        parser.error("GEMINI_API_KEY is required")
+
+    widths = sorted(set(args.dims) | {NATIVE_DIMENSIONS})
+    rankings = {}
+    for dims in widths:
+        rankings[dims] = _rankings(*await _embed(api_key, dims))
+    reference = [set(r[: args.k]) for r in rankings[NATIVE_DIMENSIONS]]
+
+    print(f"{len(FACTS)} facts, {len(QUERIES)} queries, k={args.k}\n")
+    print(f"{'dims':>6}  {'hit@k':>6}  {'MRR':>6}  {'overlap':>7}  {'bytes':>6}  hnsw")
+    for dims in widths:
+        ranked = rankings[dims]
+        hits = [relevant in r[: args.k] for r, (_, relevant) in zip(ranked, QUERIES, strict=True)]
+        mrr = [
+            1 / (r.index(relevant) + 1) for r, (_, relevant) in zip(ranked, QUERIES, strict=True)
+        ]
+        overlap = [
+            len(ref & set(r[: args.k])) / args.k for r, ref in zip(ranked, reference, strict=True)
+        ]
+        print(
+            f"{dims:>6}  {statistics.mean(hits):6.3f}  {statistics.mean(mrr):6.3f}"
+            f"  {statistics.mean(overlap):7.3f}  {dims * 4:>6}"
+            f"  {'yes' if dims <= HNSW_MAX_DIMENSIONS else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
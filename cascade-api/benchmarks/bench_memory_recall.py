@@ -0,0 +1,154 @@
+"""Benchmark: exact memory ranking vs. two-phase HNSW search (recall vs. latency).
+
+Seeds a temporary pgvector table with random memories spread over several
+tenants, then for each query compares the old exact ranking (distance to
+every active memory of the tenant, ordered by the decay-weighted score)
+with ``match_memories``' two-phase search at several oversampling factors.
+Recall@k is the overlap with the exact top k.
+
+Needs a Postgres with the ``vector`` extension; nothing outside the
+session's temp schema is touched.
+
+    python benchmarks/bench_memory_recall.py --dsn postgresql://... \\
+        --rows 50000 --tenants 10 --queries 200 --oversample 1 2 4 8 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+
+import psycopg
+
+EXACT_SQL = """
+    SELECT id FROM bench_memories
+    WHERE tenant_id = %(tenant)s
+      AND 1 - (embedding <=> %(q)s::vector) > %(threshold)s
+    ORDER BY (1 - (embedding <=> %(q)s::vector)) * (0.3 + 0.7 * decay_score) * confidence DESC
+    LIMIT %(k)s
+"""
+
+# Same shape as match_memories in migration 018
+TWO_PHASE_SQL = """
+    WITH candidates AS (
+        SELECT id, decay_score, confidence, embedding <=> %(q)s::vector AS distance
+        FROM bench_memories
+        WHERE tenant_id = %(tenant)s
+        ORDER BY embedding <=> %(q)s::vector
+        LIMIT %(candidates)s
+    )
+    SELECT id FROM candidates
+    WHERE 1 - distance > %(threshold)s
+    ORDER BY (1 - distance) * (0.3 + 0.7 * decay_score) * confidence DESC
+    LIMIT %(k)s
+"""
+
+
+def _seed(conn: psycopg.Connection, rows: int, tenants: int, dim: int) -> None:
+    conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    conn.execute(
+        f"""
+        CREATE TEMP TABLE bench_memories (
+            id BIGSERIAL PRIMARY KEY,
+            tenant_id INT NOT NULL,
+            decay_score REAL NOT NULL,
+            confidence REAL NOT NULL,
+            embedding VECTOR({dim}) NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO bench_memories (tenant_id, decay_score, confidence, embedding)
+        SELECT
+            g %% %(tenants)s,
+            random(),
+            0.5 + random() / 2,
+            (SELECT array_agg(random() - 0.5) FROM generate_series(1, %(dim)s) WHERE g > 0)::vector
+        FROM generate_series(1, %(rows)s) g
+        """,
+        {"rows": rows, "tenants": tenants, "dim": dim},
+    )
+    conn.execute("CREATE INDEX ON bench_memories (tenant_id)")
+    conn.execute(
+        "CREATE INDEX ON bench_memories USING hnsw (embedding vector_cosine_ops)"
+        " WITH (m = 16, ef_construction = 64)"
+    )
+    conn.execute("ANALYZE bench_memories")
+
+
+def _timed(conn: psycopg.Connection, sql: str, params: dict) -> tuple[list[int], float]:
+    start = time.perf_counter()
+    ids = [row[0] for row in conn.execute(sql, params).fetchall()]
+    return ids, (time.perf_counter() - start) * 1000
+
+
+def _pct(values: list[float], q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(q * len(values)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--tenants", type=int, default=10)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    # Random vectors are near-orthogonal, so the default keeps every candidate
+    parser.add_argument("--threshold", type=float, default=-1.0)
+    parser.add_argument("--oversample", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+
+    with psycopg.connect(args.dsn, autocommit=True) as conn:
+        print(f"seeding {args.rows} memories x {args.dim} dims over {args.tenants} tenants...")
+        _seed(conn, args.rows, args.tenants, args.dim)
+        try:
+            conn.execute("SET hnsw.iterative_scan = relaxed_order")
+        except psycopg.Error:
+            print("pgvector < 0.8: no iterative scan; small tenants may under-fill")
+
+        queries = conn.execute(
+            "SELECT tenant_id, embedding::text FROM bench_memories ORDER BY random() LIMIT %s",
+            (args.queries,),
+        ).fetchall()
+
+        exact_ids, exact_ms = [], []
+        for tenant, q in queries:
+            params = {"tenant": tenant, "q": q, "threshold": args.threshold, "k": args.k}
+            ids, ms = _timed(conn, EXACT_SQL, params)
+            exact_ids.append(set(ids))
+            exact_ms.append(ms)
+
+        print(f"\n{'search':>14}  {'recall@' + str(args.k):>9}  {'p50 ms':>8}  {'p95 ms':>8}")
+        print(
+            f"{'exact':>14}  {1.0:9.3f}  {statistics.median(exact_ms):8.2f}"
+            f"  {_pct(exact_ms, 0.95):8.2f}"
+        )
+        for oversample in args.oversample:
+            candidates = args.k * oversample
+            conn.execute(f"SET hnsw.ef_search = {min(max(candidates, 40), 1000)}")
+            recalls, latencies = [], []
+            for (tenant, q), expected in zip(queries, exact_ids, strict=True):
+                params = {
+                    "tenant": tenant,
+                    "q": q,
+                    "threshold": args.threshold,
+                    "k": args.k,
+                    "candidates": candidates,
+                }
+                ids, ms = _timed(conn, TWO_PHASE_SQL, params)
+                recalls.append(len(expected & set(ids)) / len(expected) if expected else 1.0)
+                latencies.append(ms)
+            print(
+                f"{'two-phase x' + str(oversample):>14}  {statistics.mean(recalls):9.3f}"
+                f"  {statistics.median(latencies):8.2f}  {_pct(latencies, 0.95):8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Deterministic replies for one-word check-ins.
+
+"status", "tasks", "today" and "review" have a single right answer, so they
+skip the agent loop: the matching tool executor is called directly and its
+result rendered into Telegram HTML. No tokens, no model latency.
+"""
+
+from __future__ import annotations
+
+import html
+from collections.abc import Awaitable, Callable
+from datetime import date
+
+import structlog
+from supabase import Client as SupabaseClient
+
+from cascade_api.agent.tools import _get_status, _get_tasks, _get_weekly_review
+
+log = structlog.get_logger()
+
+MAX_LISTED_TITLES = 8
+
+
+def match_intent(message: str) -> str | None:
+    """The fast-path intent for ``message``, or None if it needs the agent."""
+    intent = message.strip().lower().rstrip("?!.")
+    return intent if intent in FAST_PATH_INTENTS else None
+
+
+async def try_fast_path(supabase: SupabaseClient, tenant_id: str, message: str) -> str | None:
+    """Rendered reply for a fast-path intent; None means fall back to the agent."""
+    intent = match_intent(message)
+    if intent is None:
+        return None
+    fetch, render = FAST_PATH_INTENTS[intent]
+    try:
+        return render(await fetch(supabase, tenant_id))
+    except Exception as e:
+        log.warning("fast_path.failed", intent=intent, tenant_id=tenant_id, error=str(e))
+        return None
+
+
+# ── Renderers ────────────────────────────────────────
+
+
+def _pct(done: int, total: int) -> str:
+    return f" ({round(done / total * 100)}%)" if total else ""
+
+
+def render_status(data: dict) -> str:
+    week = data["week_progress"]
+    month = data["monthly_progress"]
+    trend = {"up": "trending up", "down": "trending down"}.get(data["velocity_trend"], "steady")
+
+    lines = [
+        "<b>This week</b>",
+        f"Core: {week['core_completed']}/{week['core_total']} done"
+        + _pct(week["core_completed"], week["core_total"]),
+        f"Flex: {week['flex_completed']}/{week['flex_total']} done",
+        "",
+        f"• Velocity: {trend}",
+        f"• Logged {month['entries_count']} of {month['days_elapsed']} days this month",
+    ]
+    if data["rest_debt_days"] >= 7:
+        lines.append(f"• {data['rest_debt_days']} days straight without a break")
+    return "\n".join(lines)
+
+
+def _render_task_list(tasks: list[dict], heading: str, empty: str) -> str:
+    if not tasks:
+        return f"<b>{heading}</b>\n{empty}"
+    done = sum(1 for t in tasks if t.get("completed"))
+    lines = [f"<b>{heading}</b> — {done}/{len(tasks)} done", ""]
+    for task in tasks:
+        mark = "✓" if task.get("completed") else "•"
+        label = html.escape(task["title"])
+        if task.get("category") == "flex":
+            label += " <i>(flex)</i>"
+        lines.append(f"{mark} {label}")
+    return "\n".join(lines)
+
+
+def render_tasks(data: dict) -> str:
+    return _render_task_list(data["tasks"], "This week", "No tasks planned this week.")
+
+
+def render_today(data: dict) -> str:
+    return _render_task_list(
+        data["tasks"],
+        f"Today, {date.today():%A}",
+        "Nothing scheduled today.",
+    )
+
+
+def _titles(titles: list[str]) -> str:
+    shown = ", ".join(html.escape(t) for t in titles[:MAX_LISTED_TITLES])
+    extra = len(titles) - MAX_LISTED_TITLES
+    return shown + (f" and {extra} more" if extra > 0 else "")
+
+
+def render_review(data: dict) -> str:
+    planned = data["planned_vs_actual"]
+    rates = data["completion_rate"]
+    energy = data["energy"]
+
+    lines = [
+        "<b>Weekly review</b>",
+        f"Core: {planned['core_completed']}/{planned['core_planned']} ({rates['core_pct']:g}%)",
+        f"Flex: {planned['flex_completed']}/{planned['flex_planned']} ({rates['flex_pct']:g}%)",
+    ]
+    if data["what_worked"]:
+        lines += ["", f"<b>Done:</b> {_titles(data['what_worked'])}"]
+    if data["what_didnt"]:
+        lines += ["", f"<b>Open:</b> {_titles(data['what_didnt'])}"]
+    if energy["average"] is not None:
+        lines += ["", f"Energy averaged {energy['average']}/5"]
+    return "\n".join(lines)
+
+
+FAST_PATH_INTENTS: dict[
+    str,
+    tuple[Callable[[SupabaseClient, str], Awaitable[dict]], Callable[[dict], str]],
+] = {
+    "status": (lambda sb, tid: _get_status({}, sb, tid), render_status),
+    "tasks": (lambda sb, tid: _get_tasks({}, sb, tid), render_tasks),
+    "today": (lambda sb, tid: _get_tasks({"day": "today"}, sb, tid), render_today),
+    "review": (lambda sb, tid: _get_weekly_review({}, sb, tid), render_review),
+}
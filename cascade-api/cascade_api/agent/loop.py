@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from typing import Protocol
 
 import structlog
-import anthropic
 
-from cascade_api.agent.tools import TOOLS, execute_tool
-from cascade_api.agent.system_prompt import build_system_prompt
+from cascade_api.agent.fast_path import match_intent
+from cascade_api.agent.tools import TOOLS, ToolCache, execute_tool, is_read_only
+from cascade_api.agent.system_prompt import build_system_blocks
+from cascade_api.db.tenants import get_tenant
 from cascade_api.dependencies import get_supabase
+from cascade_api.llm.gateway import create_message, stream_message
 from cascade_api.observability.langfuse_client import get_langfuse, should_eval
+from cascade_api.observability.usage_ledger import set_tenant
 
 log = structlog.get_logger()
 
@@ -18,6 +23,25 @@ log = structlog.get_logger()
 SIMPLE_MODEL = "claude-haiku-4-5-20251001"
 COMPLEX_MODEL = "claude-sonnet-4-6"
 MAX_TOOL_ROUNDS = 10
+# Cap on read-only tools running at once within a single model turn
+MAX_CONCURRENT_TOOLS = 4
+
+# Identical for every tenant and call so it stays inside the shared cache prefix
+AGENT_TOOLS = [*TOOLS, {"type": "web_search_20250305", "name": "web_search"}]
+
+
+class AgentStream(Protocol):
+    """Receives progress from a streaming ``run_agent`` call.
+
+    ``on_text`` gets each assistant text delta; tool execution is bracketed
+    by ``on_tools_start`` / ``on_tools_end``.
+    """
+
+    async def on_text(self, delta: str) -> None: ...
+
+    async def on_tools_start(self) -> None: ...
+
+    async def on_tools_end(self) -> None: ...
 
 
 async def run_agent(
@@ -28,29 +52,33 @@ async def run_agent(
     is_scheduled: bool = False,
     scheduled_context: str | None = None,
     scheduled_model: str | None = None,
+    stream: AgentStream | None = None,
+    history_summary: str | None = None,
 ) -> tuple[str, list[dict]]:
     """Run the agent loop with optional Langfuse tracing.
 
+    ``conversation_history`` holds the recent turns that fit the history
+    token budget; older turns arrive condensed as ``history_summary``.
+
+    When ``stream`` is given, each model round uses the streaming API and
+    progress is forwarded to it as it happens.
+
     Returns (response_text, updated_history).
     """
-    client = anthropic.AsyncAnthropic(api_key=api_key)
     supabase = get_supabase()
     lf = get_langfuse()
+    # Evals and background extraction spawned from this turn bill to the tenant too
+    set_tenant(tenant_id)
 
     # Build system prompt
-    tenant_result = (
-        supabase.table("tenants")
-        .select("timezone, morning_hour, morning_minute, review_day")
-        .eq("id", tenant_id)
-        .execute()
-    )
-    tenant = tenant_result.data[0] if tenant_result.data else {}
+    tenant = await get_tenant(supabase, tenant_id) or {}
 
-    system = await build_system_prompt(
+    system = await build_system_blocks(
         supabase,
         tenant_id,
         tenant,
         scheduled_context=scheduled_context,
+        history_summary=history_summary,
     )
 
     messages = list(conversation_history)
@@ -79,6 +107,7 @@ async def run_agent(
             trace = None
 
     tool_calls_log = []  # collect for evals
+    tool_cache = ToolCache()  # read results reused until a write invalidates them
 
     for round_num in range(MAX_TOOL_ROUNDS):
         # --- Langfuse generation span ---
@@ -93,13 +122,24 @@ async def run_agent(
             except Exception:
                 generation = None
 
-        response = await client.messages.create(
-            model=model,
-            max_tokens=1024,
-            system=[{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
-            tools=[*TOOLS, {"type": "web_search_20250305", "name": "web_search"}],
-            messages=messages,
-        )
+        request = {
+            "model": model,
+            "max_tokens": 1024,
+            # Tools + static prompt, then core memory, carry the cache breakpoints
+            "system": system,
+            "tools": AGENT_TOOLS,
+            "messages": messages,
+        }
+        if stream:
+            response = await _stream_message(api_key, request, stream, tenant_id, round_num)
+        else:
+            response = await create_message(
+                call_site="agent.loop",
+                api_key=api_key,
+                tenant_id=tenant_id,
+                round_num=round_num,
+                **request,
+            )
 
         # End generation span
         if generation:
@@ -110,7 +150,15 @@ async def run_agent(
                         "input": response.usage.input_tokens,
                         "output": response.usage.output_tokens,
                     },
-                    metadata={"stop_reason": response.stop_reason},
+                    metadata={
+                        "stop_reason": response.stop_reason,
+                        "cache_creation_input_tokens": getattr(
+                            response.usage, "cache_creation_input_tokens", None
+                        ),
+                        "cache_read_input_tokens": getattr(
+                            response.usage, "cache_read_input_tokens", None
+                        ),
+                    },
                 )
             except Exception:
                 pass
@@ -124,25 +172,28 @@ async def run_agent(
             # --- Finalize trace ---
             if trace:
                 try:
-                    trace.update(output=text)
+                    trace.update(output=text, metadata={"tool_cache": tool_cache.stats()})
                 except Exception:
                     pass
 
-            # --- Trigger evals ---
+            # --- Queue evals (scored by a job worker, off the reply path) ---
             if trace and should_eval(user_message, is_scheduled):
                 try:
-                    from cascade_api.observability.evals import score_trace
-
-                    await score_trace(
-                        trace_id=trace.id,
-                        user_message=user_message,
-                        agent_response=text,
-                        tool_calls=tool_calls_log,
-                        is_scheduled=is_scheduled,
-                        api_key=api_key,
+                    from cascade_api.jobs import enqueue
+
+                    await enqueue(
+                        "evals.score",
+                        {
+                            "trace_id": trace.id,
+                            "tenant_id": tenant_id,
+                            "user_message": user_message,
+                            "agent_response": text,
+                            "tool_calls": tool_calls_log,
+                            "is_scheduled": is_scheduled,
+                        },
                     )
                 except Exception as e:
-                    log.warning("langfuse.eval_failed", error=str(e))
+                    log.warning("langfuse.eval_enqueue_failed", error=str(e))
 
             if lf:
                 try:
@@ -154,65 +205,17 @@ async def run_agent(
 
         # Execute tool calls
         messages.append({"role": "assistant", "content": response.content})
-        tool_results = []
-
-        for tool_block in tool_use_blocks:
-            # --- Langfuse tool span ---
-            tool_span = None
-            if trace:
-                try:
-                    tool_span = trace.span(
-                        name=f"tool_{tool_block.name}",
-                        input=tool_block.input,
-                    )
-                except Exception:
-                    tool_span = None
-
-            try:
-                result = await execute_tool(
-                    tool_block.name,
-                    tool_block.input,
-                    supabase,
-                    tenant_id,
-                )
-                tool_results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_block.id,
-                        "content": result,
-                    }
-                )
-                tool_calls_log.append(
-                    {
-                        "tool": tool_block.name,
-                        "input": tool_block.input,
-                        "output": result,
-                    }
-                )
-
-                if tool_span:
-                    try:
-                        tool_span.end(output=result)
-                    except Exception:
-                        pass
-
-            except Exception as e:
-                log.error("tool.failed", tool=tool_block.name, error=str(e))
-                error_result = json.dumps({"error": str(e)})
-                tool_results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_block.id,
-                        "content": error_result,
-                        "is_error": True,
-                    }
-                )
-
-                if tool_span:
-                    try:
-                        tool_span.end(output=error_result, level="ERROR")
-                    except Exception:
-                        pass
+        if stream:
+            await stream.on_tools_start()
+        try:
+            outcomes = await _run_tool_calls(
+                tool_use_blocks, supabase, tenant_id, trace, tool_cache
+            )
+        finally:
+            if stream:
+                await stream.on_tools_end()
+        tool_results = [tool_result for tool_result, _ in outcomes]
+        tool_calls_log.extend(entry for _, entry in outcomes if entry is not None)
 
         messages.append({"role": "user", "content": tool_results})
 
@@ -227,7 +230,10 @@ async def run_agent(
     # Safety: max rounds exceeded
     if trace:
         try:
-            trace.update(output="max_rounds_exceeded", metadata={"error": True})
+            trace.update(
+                output="max_rounds_exceeded",
+                metadata={"error": True, "tool_cache": tool_cache.stats()},
+            )
             lf.flush()
         except Exception:
             pass
@@ -235,11 +241,152 @@ async def run_agent(
     return "I hit my reasoning limit. Can you try rephrasing?", messages
 
 
+async def _stream_message(
+    api_key: str,
+    request: dict,
+    stream: AgentStream,
+    tenant_id: str,
+    round_num: int,
+):
+    """Run one model round via the streaming API, forwarding text deltas."""
+    async with stream_message(
+        call_site="agent.loop",
+        api_key=api_key,
+        tenant_id=tenant_id,
+        round_num=round_num,
+        **request,
+    ) as message_stream:
+        async for event in message_stream:
+            if event.type == "text":
+                await stream.on_text(event.text)
+        return await message_stream.get_final_message()
+
+
+def _group_tool_calls(tool_use_blocks: list) -> list[list]:
+    """Split one turn's tool calls into batches that may run concurrently.
+
+    Consecutive read-only calls share a batch. Every write is a batch of its
+    own, so it waits for the reads before it and finishes before anything
+    after it starts.
+    """
+    groups: list[list] = []
+    for block in tool_use_blocks:
+        if is_read_only(block.name) and groups and is_read_only(groups[-1][0].name):
+            groups[-1].append(block)
+        else:
+            groups.append([block])
+    return groups
+
+
+async def _run_tool_calls(
+    tool_use_blocks: list,
+    supabase,
+    tenant_id: str,
+    trace=None,
+    cache: ToolCache | None = None,
+) -> list[tuple[dict, dict | None]]:
+    """Execute a turn's tool calls, overlapping independent reads.
+
+    Returns (tool_result, eval_log_entry) pairs in the original block order;
+    the log entry is None for calls that failed.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOLS)
+    outcomes: list[tuple[dict, dict | None]] = []
+
+    for group_index, group in enumerate(_group_tool_calls(tool_use_blocks)):
+        parallel = len(group) > 1
+        outcomes.extend(
+            await asyncio.gather(
+                *(
+                    _run_tool_call(
+                        block,
+                        supabase,
+                        tenant_id,
+                        trace,
+                        semaphore,
+                        cache=cache,
+                        group_index=group_index,
+                        parallel=parallel,
+                    )
+                    for block in group
+                )
+            )
+        )
+
+    return outcomes
+
+
+async def _run_tool_call(
+    tool_block,
+    supabase,
+    tenant_id: str,
+    trace,
+    semaphore: asyncio.Semaphore,
+    cache: ToolCache | None = None,
+    group_index: int = 0,
+    parallel: bool = False,
+) -> tuple[dict, dict | None]:
+    """Execute one tool call inside its own Langfuse span."""
+    async with semaphore:
+        # Span opens once the call actually starts, so concurrent reads show
+        # up as overlapping spans in the trace timeline.
+        tool_span = None
+        if trace:
+            try:
+                tool_span = trace.span(
+                    name=f"tool_{tool_block.name}",
+                    input=tool_block.input,
+                    metadata={"group": group_index, "parallel": parallel},
+                )
+            except Exception:
+                tool_span = None
+
+        try:
+            result = await execute_tool(
+                tool_block.name,
+                tool_block.input,
+                supabase,
+                tenant_id,
+                cache=cache,
+            )
+        except Exception as e:
+            log.error("tool.failed", tool=tool_block.name, error=str(e))
+            error_result = json.dumps({"error": str(e)})
+
+            if tool_span:
+                try:
+                    tool_span.end(output=error_result, level="ERROR")
+                except Exception:
+                    pass
+
+            return {
+                "type": "tool_result",
+                "tool_use_id": tool_block.id,
+                "content": error_result,
+                "is_error": True,
+            }, None
+
+        if tool_span:
+            try:
+                tool_span.end(output=result)
+            except Exception:
+                pass
+
+        return {
+            "type": "tool_result",
+            "tool_use_id": tool_block.id,
+            "content": result,
+        }, {
+            "tool": tool_block.name,
+            "input": tool_block.input,
+            "output": result,
+        }
+
+
 def _pick_model(message: str, is_scheduled: bool = False) -> str:
     """Route to cheap or expensive model based on context."""
     if is_scheduled:
         return SIMPLE_MODEL
-    msg_lower = message.strip().lower()
-    if len(msg_lower) < 20 and msg_lower in ("status", "tasks", "today", "review"):
+    if match_intent(message) is not None:
         return SIMPLE_MODEL
     return COMPLEX_MODEL
@@ -131,20 +131,72 @@ the new one, ask which is current, then update with permission.
 """
 
 
+_CACHE_BREAKPOINT = {"type": "ephemeral"}
+
+
+async def build_system_blocks(
+    supabase,  # kept for backward compat — no longer used for memory
+    tenant_id: str,
+    tenant: dict,
+    scheduled_context: str | None = None,
+    history_summary: str | None = None,
+) -> list[dict]:
+    """Build the system prompt as content blocks laid out for prompt caching.
+
+    Anthropic caches prefixes in order tools → system → messages, so blocks
+    run from most to least stable:
+    1. Base coaching prompt (SYSTEM_PROMPT) — breakpoint shared by all
+       tenants; the cached prefix also covers the tool definitions
+    2. Core memory document and rolling conversation summary — breakpoint
+       per tenant, stable across turns
+    3. Current date/time context and scheduled context — never cached
+    """
+    # Core memory
+    scoped = get_memory_client().for_tenant(tenant_id)
+    core_memory, _ = await scoped.core.read()
+    if core_memory:
+        memory_section = f"## Core Memory\n\n{core_memory}\n"
+    else:
+        memory_section = (
+            "## Core Memory\n\n"
+            "No core memory yet. As you learn about this user, use core_memory_append "
+            "to build their profile (with their approval).\n"
+        )
+
+    if history_summary:
+        memory_section += f"\n## Earlier Conversation (summary)\n\n{history_summary}\n"
+
+    volatile = _build_date_context(tenant)
+    if scheduled_context:
+        volatile += f"\n\n## Current Task\n\n{scheduled_context}"
+
+    return [
+        {"type": "text", "text": SYSTEM_PROMPT, "cache_control": _CACHE_BREAKPOINT},
+        {"type": "text", "text": memory_section, "cache_control": _CACHE_BREAKPOINT},
+        {"type": "text", "text": volatile},
+    ]
+
+
 async def build_system_prompt(
     supabase,  # kept for backward compat — no longer used for memory
     tenant_id: str,
     tenant: dict,
     scheduled_context: str | None = None,
+    history_summary: str | None = None,
 ) -> str:
-    """Build the full system prompt with date context and core memory.
+    """Build the full system prompt as a single string (same sections as the blocks)."""
+    blocks = await build_system_blocks(
+        supabase,
+        tenant_id,
+        tenant,
+        scheduled_context=scheduled_context,
+        history_summary=history_summary,
+    )
+    return "\n\n".join(block["text"] for block in blocks)
 
-    Structure:
-    1. Base coaching prompt (SYSTEM_PROMPT)
-    2. Current date/time context
-    3. Core memory document (if exists)
-    4. Scheduled context (if scheduled message)
-    """
+
+def _build_date_context(tenant: dict) -> str:
+    """Current date/time in the tenant's timezone — changes every minute."""
     tz_name = tenant.get("timezone") or "America/New_York"
     try:
         tz = ZoneInfo(tz_name)
@@ -168,7 +220,7 @@ async def build_system_prompt(
     morning_h = tenant.get("morning_hour", 7)
     morning_m = tenant.get("morning_minute", 0)
 
-    date_context = (
+    return (
         f"## Current Context\n\n"
         f"Date: {now.strftime('%A, %B %d, %Y')}\n"
         f"Time: {now.strftime('%I:%M %p')} {tz_name}\n"
@@ -179,22 +231,3 @@ async def build_system_prompt(
         f"User's review day: {day_names[review_day]}\n"
         f"User's morning message time: {morning_h:02d}:{morning_m:02d} {tz_name}\n"
     )
-
-    # Core memory
-    scoped = get_memory_client().for_tenant(tenant_id)
-    core_memory, _ = await scoped.core.read()
-    if core_memory:
-        memory_section = f"\n## Core Memory\n\n{core_memory}\n"
-    else:
-        memory_section = (
-            "\n## Core Memory\n\n"
-            "No core memory yet. As you learn about this user, use core_memory_append "
-            "to build their profile (with their approval).\n"
-        )
-
-    # Assemble
-    parts = [SYSTEM_PROMPT, date_context, memory_section]
-    if scheduled_context:
-        parts.append(f"\n## Current Task\n\n{scheduled_context}")
-
-    return "\n\n".join(parts)
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import calendar
 from datetime import date, datetime, timedelta, timezone
 import json
+from collections.abc import Awaitable, Callable
 
 from supabase import Client as SupabaseClient
 
+from cascade_api.db.client import execute
+from cascade_api.db.status_snapshot import get_status_snapshot
+from cascade_api.db.tenants import get_tenant, invalidate_tenant
+
 
 # --- Tool definitions (sent to Claude API) ---
 
@@ -396,8 +402,25 @@ async def execute_tool(
     tool_input: dict,
     supabase: SupabaseClient,
     tenant_id: str,
+    cache: ToolCache | None = None,
+) -> str:
+    """Execute a tool and return the result as a JSON string.
+
+    With a ``cache``, read-only results are memoized for the rest of the turn
+    and writes drop the reads they make stale.
+    """
+    if cache is None:
+        return await _run_executor(tool_name, tool_input, supabase, tenant_id)
+    return await cache.get_or_run(
+        tool_name,
+        tool_input,
+        lambda: _run_executor(tool_name, tool_input, supabase, tenant_id),
+    )
+
+
+async def _run_executor(
+    tool_name: str, tool_input: dict, supabase: SupabaseClient, tenant_id: str
 ) -> str:
-    """Execute a tool and return the result as a JSON string."""
     result = await _EXECUTORS[tool_name](tool_input, supabase, tenant_id)
     return json.dumps(result, default=str)
 
@@ -413,7 +436,7 @@ async def _get_tasks(inp: dict, sb: SupabaseClient, tid: str) -> dict:
     )
     if inp.get("category"):
         query = query.eq("category", inp["category"])
-    tasks = query.execute().data
+    tasks = (await execute(query)).data
 
     if inp.get("day"):
         day = inp["day"]
@@ -437,13 +460,12 @@ async def _get_tasks(inp: dict, sb: SupabaseClient, tid: str) -> dict:
 
 
 async def _complete_task(inp: dict, sb: SupabaseClient, tid: str) -> dict:
-    result = (
+    result = await execute(
         sb.table("tasks")
         .update({"completed": True, "completed_at": datetime.now(timezone.utc).isoformat()})
         .eq("id", inp["task_id"])
         .eq("tenant_id", tid)
         .eq("completed", False)
-        .execute()
     )
     if result.data:
         return {"status": "completed", "task": result.data[0]}
@@ -454,115 +476,35 @@ async def _log_progress(inp: dict, sb: SupabaseClient, tid: str) -> dict:
     entry_date = inp.get("entry_date") or date.today().isoformat()
     data = {k: v for k, v in inp.items() if v is not None and k != "entry_date"}
 
-    existing = (
-        sb.table("tracker_entries")
-        .select("*")
-        .eq("tenant_id", tid)
-        .eq("date", entry_date)
-        .execute()
+    existing = await execute(
+        sb.table("tracker_entries").select("*").eq("tenant_id", tid).eq("date", entry_date)
     )
     if existing.data:
         row_id = existing.data[0]["id"]
-        result = (
-            sb.table("tracker_entries").update(data).eq("id", row_id).eq("tenant_id", tid).execute()
+        result = await execute(
+            sb.table("tracker_entries").update(data).eq("id", row_id).eq("tenant_id", tid)
         )
     else:
         row = {"tenant_id": tid, "date": entry_date, **data}
-        result = sb.table("tracker_entries").insert(row).execute()
+        result = await execute(sb.table("tracker_entries").insert(row))
 
     return {"status": "logged", "entry": result.data[0]}
 
 
 async def _get_status(inp: dict, sb: SupabaseClient, tid: str) -> dict:
-    week_start = _current_week_start()
-    week_tasks = (
-        sb.table("tasks")
-        .select("*")
-        .eq("tenant_id", tid)
-        .eq("week_start", week_start)
-        .order("sort_order")
-        .execute()
-        .data
-    )
-
-    velocity_weeks = (
-        sb.rpc("get_weekly_velocity", {"p_tenant_id": tid, "p_weeks": 4}).execute().data
-    )
-
-    today = date.today()
-    month_start = today.replace(day=1).isoformat()
-    month_entries = (
-        sb.table("tracker_entries")
-        .select("*")
-        .eq("tenant_id", tid)
-        .gte("date", month_start)
-        .order("date", desc=True)
-        .execute()
-        .data
-    )
-
-    recent_entries = (
-        sb.table("tracker_entries")
-        .select("*")
-        .eq("tenant_id", tid)
-        .order("date", desc=True)
-        .limit(14)
-        .execute()
-        .data
-    )
-
-    core = [t for t in week_tasks if t["category"] == "core"]
-    flex = [t for t in week_tasks if t["category"] == "flex"]
-    core_done = sum(1 for t in core if t["completed"])
-    flex_done = sum(1 for t in flex if t["completed"])
-
-    # Rest debt
-    rest_debt = 0
-    for i in range(14):
-        day = today - timedelta(days=i)
-        if any(e["date"] == day.isoformat() for e in recent_entries):
-            rest_debt += 1
-        else:
-            break
-
-    # Trend
-    trend = "flat"
-    if len(velocity_weeks) >= 2:
-        rates = [w.get("completion_rate") or 0 for w in velocity_weeks[:3]]
-        if rates[0] > rates[-1] + 5:
-            trend = "up"
-        elif rates[0] < rates[-1] - 5:
-            trend = "down"
-
-    _, days_in_month = calendar.monthrange(today.year, today.month)
-
-    return {
-        "week_progress": {
-            "core_completed": core_done,
-            "core_total": len(core),
-            "flex_completed": flex_done,
-            "flex_total": len(flex),
-        },
-        "velocity_trend": trend,
-        "velocity_weeks": velocity_weeks,
-        "monthly_progress": {
-            "entries_count": len(month_entries),
-            "days_elapsed": today.day,
-            "days_in_month": days_in_month,
-        },
-        "rest_debt_days": rest_debt,
-    }
+    snapshot = await get_status_snapshot(sb, tid)
+    snapshot.pop("active_adaptations")
+    return snapshot
 
 
 async def _get_goals(inp: dict, sb: SupabaseClient, tid: str) -> dict:
     status = inp.get("status", "active")
-    result = (
+    result = await execute(
         sb.table("goals")
         .select("*")
         .eq("tenant_id", tid)
         .eq("status", status)
         .order("created_at", desc=True)
-        .execute()
     )
     return {"goals": result.data}
 
@@ -572,7 +514,7 @@ async def _update_goal(inp: dict, sb: SupabaseClient, tid: str) -> dict:
     updates = {k: v for k, v in inp.items() if v is not None and k != "goal_id"}
     if not updates:
         return {"error": "No updates specified"}
-    result = sb.table("goals").update(updates).eq("id", goal_id).eq("tenant_id", tid).execute()
+    result = await execute(sb.table("goals").update(updates).eq("id", goal_id).eq("tenant_id", tid))
     if result.data:
         return {"status": "updated", "goal": result.data[0]}
     return {"error": f"Goal {goal_id} not found"}
@@ -603,7 +545,7 @@ async def _add_task(inp: dict, sb: SupabaseClient, tid: str) -> dict:
     if inp.get("estimated_minutes"):
         row["estimated_minutes"] = inp["estimated_minutes"]
 
-    result = sb.table("tasks").insert(row).execute()
+    result = await execute(sb.table("tasks").insert(row))
     return {"status": "added", "task": result.data[0]}
 
 
@@ -623,12 +565,11 @@ async def _move_task(inp: dict, sb: SupabaseClient, tid: str) -> dict:
     else:
         target = new_day
 
-    result = (
+    result = await execute(
         sb.table("tasks")
         .update({"scheduled_day": target})
         .eq("id", inp["task_id"])
         .eq("tenant_id", tid)
-        .execute()
     )
     if result.data:
         return {"status": "moved", "task": result.data[0]}
@@ -636,32 +577,30 @@ async def _move_task(inp: dict, sb: SupabaseClient, tid: str) -> dict:
 
 
 async def _remove_task(inp: dict, sb: SupabaseClient, tid: str) -> dict:
-    sb.table("tasks").delete().eq("id", inp["task_id"]).eq("tenant_id", tid).execute()
+    await execute(sb.table("tasks").delete().eq("id", inp["task_id"]).eq("tenant_id", tid))
     return {"status": "removed", "task_id": inp["task_id"]}
 
 
 async def _get_history(inp: dict, sb: SupabaseClient, tid: str) -> dict:
     days = inp.get("days", 7)
     start = (date.today() - timedelta(days=days)).isoformat()
-    result = (
+    result = await execute(
         sb.table("tracker_entries")
         .select("*")
         .eq("tenant_id", tid)
         .gte("date", start)
         .order("date", desc=True)
-        .execute()
     )
     return {"entries": result.data}
 
 
 async def _get_adaptations(inp: dict, sb: SupabaseClient, tid: str) -> dict:
-    result = (
+    result = await execute(
         sb.table("adaptations")
         .select("*")
         .eq("tenant_id", tid)
         .eq("active", True)
         .order("detected_at", desc=True)
-        .execute()
     )
     return {"adaptations": result.data}
 
@@ -672,7 +611,7 @@ async def _add_adaptation(inp: dict, sb: SupabaseClient, tid: str) -> dict:
         "pattern_type": inp["pattern_type"],
         "description": inp["description"],
     }
-    result = sb.table("adaptations").insert(row).execute()
+    result = await execute(sb.table("adaptations").insert(row))
     return {"status": "added", "adaptation": result.data[0]}
 
 
@@ -682,23 +621,19 @@ async def _update_monthly_targets(inp: dict, sb: SupabaseClient, tid: str) -> di
     y = inp.get("year", today.year)
     new_targets = inp["targets"]
 
-    existing = (
-        sb.table("monthly_plans")
-        .select("*")
-        .eq("tenant_id", tid)
-        .eq("month", m)
-        .eq("year", y)
-        .execute()
+    existing = await execute(
+        sb.table("monthly_plans").select("*").eq("tenant_id", tid).eq("month", m).eq("year", y)
     )
     if existing.data:
         plan_id = existing.data[0]["id"]
         current = existing.data[0].get("targets", {})
         merged = {**current, **new_targets}
-        result = sb.table("monthly_plans").update({"targets": merged}).eq("id", plan_id).execute()
+        result = await execute(
+            sb.table("monthly_plans").update({"targets": merged}).eq("id", plan_id)
+        )
     else:
-        result = (
-            sb.table("monthly_plans")
-            .insert(
+        result = await execute(
+            sb.table("monthly_plans").insert(
                 {
                     "tenant_id": tid,
                     "month": m,
@@ -706,7 +641,6 @@ async def _update_monthly_targets(inp: dict, sb: SupabaseClient, tid: str) -> di
                     "targets": new_targets,
                 }
             )
-            .execute()
         )
 
     return {"status": "updated", "plan": result.data[0]}
@@ -717,24 +651,24 @@ async def _get_weekly_review(inp: dict, sb: SupabaseClient, tid: str) -> dict:
     week_end = (date.fromisoformat(week_start) + timedelta(days=6)).isoformat()
 
     tasks_data = (
-        sb.table("tasks")
-        .select("*")
-        .eq("tenant_id", tid)
-        .eq("week_start", week_start)
-        .order("sort_order")
-        .execute()
-        .data
-    )
+        await execute(
+            sb.table("tasks")
+            .select("*")
+            .eq("tenant_id", tid)
+            .eq("week_start", week_start)
+            .order("sort_order")
+        )
+    ).data
     entries = (
-        sb.table("tracker_entries")
-        .select("*")
-        .eq("tenant_id", tid)
-        .gte("date", week_start)
-        .lte("date", week_end)
-        .order("date", desc=True)
-        .execute()
-        .data
-    )
+        await execute(
+            sb.table("tracker_entries")
+            .select("*")
+            .eq("tenant_id", tid)
+            .gte("date", week_start)
+            .lte("date", week_end)
+            .order("date", desc=True)
+        )
+    ).data
 
     core = [t for t in tasks_data if t["category"] == "core"]
     flex = [t for t in tasks_data if t["category"] == "flex"]
@@ -764,15 +698,9 @@ async def _get_weekly_review(inp: dict, sb: SupabaseClient, tid: str) -> dict:
 
 
 async def _get_schedule(inp: dict, sb: SupabaseClient, tid: str) -> dict:
-    result = (
-        sb.table("tenants")
-        .select("morning_hour, morning_minute, review_day, timezone")
-        .eq("id", tid)
-        .execute()
-    )
-    if not result.data:
+    t = await get_tenant(sb, tid)
+    if t is None:
         return {"error": "Tenant not found"}
-    t = result.data[0]
     morning_h = t.get("morning_hour", 7)
     morning_m = t.get("morning_minute", 0)
     day_names = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
@@ -809,7 +737,8 @@ async def _update_schedule(inp: dict, sb: SupabaseClient, tid: str) -> dict:
     else:
         return {"error": f"Unknown schedule_type: {schedule_type}"}
 
-    sb.table("tenants").update(updates).eq("id", tid).execute()
+    await execute(sb.table("tenants").update(updates).eq("id", tid))
+    invalidate_tenant(tid)
     return {"status": "updated", "message": result_msg}
 
 
@@ -908,8 +837,8 @@ async def _forget_memory(inp: dict, sb: SupabaseClient, tid: str) -> dict:
 async def _get_current_datetime(inp: dict, sb: SupabaseClient, tid: str) -> dict:
     from zoneinfo import ZoneInfo
 
-    tenant = sb.table("tenants").select("timezone").eq("id", tid).execute().data
-    tz_name = tenant[0].get("timezone", "America/New_York") if tenant else "America/New_York"
+    tenant = await get_tenant(sb, tid)
+    tz_name = tenant.get("timezone", "America/New_York") if tenant else "America/New_York"
 
     try:
         tz = ZoneInfo(tz_name)
@@ -957,3 +886,103 @@ _EXECUTORS = {
     "forget_memory": _forget_memory,
     "get_current_datetime": _get_current_datetime,
 }
+
+# Tools with no side effects on the tenant's data. The agent loop may run these
+# concurrently within one model turn; anything not listed is treated as a write
+# and runs on its own, in the order the model asked for it.
+READ_ONLY_TOOLS = frozenset(
+    {
+        "get_tasks",
+        "get_status",
+        "get_goals",
+        "get_history",
+        "get_adaptations",
+        "get_weekly_review",
+        "get_schedule",
+        "core_memory_read",
+        "recall",
+        "get_current_datetime",
+    }
+)
+
+
+def is_read_only(tool_name: str) -> bool:
+    """Whether a tool call can safely overlap with other reads."""
+    return tool_name in READ_ONLY_TOOLS
+
+
+# Read tools each write makes stale (by the tables they touch). A write that
+# is not listed here clears the whole turn cache.
+_TASK_READS = frozenset({"get_tasks", "get_status", "get_weekly_review"})
+INVALIDATES: dict[str, frozenset[str]] = {
+    "complete_task": _TASK_READS,
+    "add_task": _TASK_READS,
+    "move_task": _TASK_READS,
+    "remove_task": _TASK_READS,
+    "log_progress": frozenset({"get_status", "get_history", "get_weekly_review"}),
+    "update_goal": frozenset({"get_goals"}),
+    "add_adaptation": frozenset({"get_adaptations"}),
+    "update_monthly_targets": frozenset({"get_status"}),
+    "update_schedule": frozenset({"get_schedule", "get_current_datetime"}),
+    "core_memory_append": frozenset({"core_memory_read"}),
+    "core_memory_replace": frozenset({"core_memory_read"}),
+    "save_memory": frozenset({"recall"}),
+    "update_memory": frozenset({"recall"}),
+    "forget_memory": frozenset({"recall"}),
+}
+
+
+class ToolCache:
+    """Memoizes read-only tool results for one ``run_agent`` turn.
+
+    Keyed by tool name and normalized input. Identical reads issued
+    concurrently share one execution; a failed read is not cached.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple[str, str], asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(tool_name: str, tool_input: dict) -> tuple[str, str]:
+        return tool_name, json.dumps(tool_input or {}, sort_keys=True, default=str)
+
+    async def get_or_run(
+        self,
+        tool_name: str,
+        tool_input: dict,
+        run: Callable[[], Awaitable[str]],
+    ) -> str:
+        if not is_read_only(tool_name):
+            try:
+                return await run()
+            finally:
+                self.invalidate(tool_name)
+
+        key = self.key(tool_name, tool_input)
+        task = self._entries.get(key)
+        if task is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(run())
+            self._entries[key] = task
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            if self._entries.get(key) is task:
+                del self._entries[key]
+            raise
+
+    def invalidate(self, write_tool: str) -> None:
+        """Drop cached reads made stale by ``write_tool``."""
+        stale = INVALIDATES.get(write_tool)
+        for key in list(self._entries):
+            if stale is None or key[0] in stale:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "invalidations": self.invalidations}
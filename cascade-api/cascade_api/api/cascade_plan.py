@@ -8,6 +8,8 @@ from pydantic import BaseModel
 from fastapi import APIRouter
 import structlog
 
+from cascade_api.db.client import execute
+from cascade_api.db.tenants import invalidate_tenant
 from cascade_api.dependencies import get_supabase
 from cascade_api.llm.client import ask
 from cascade_api.observability.posthog_client import track_event
@@ -45,14 +47,12 @@ async def generate_cascade(
     if supabase is None:
         supabase = get_supabase()
 
-    goal = supabase.table("goals").select("*").eq("id", goal_id).execute().data[0]
+    goal = (await execute(supabase.table("goals").select("*").eq("id", goal_id))).data[0]
     tenant = (
-        supabase.table("tenants")
-        .select("core_hours, flex_hours")
-        .eq("id", tenant_id)
-        .execute()
-        .data[0]
-    )
+        await execute(
+            supabase.table("tenants").select("core_hours, flex_hours").eq("id", tenant_id)
+        )
+    ).data[0]
 
     prompt = CASCADE_SYSTEM_PROMPT.format(
         core_hours=tenant["core_hours"],
@@ -71,6 +71,7 @@ Today: {date.today().isoformat()}"""
         api_key=api_key,
         user_id=tenant_id,
         context="onboarding_cascade_generation",
+        call_site="api.cascade_plan",
     )
 
     # Strip markdown fences if present
@@ -84,49 +85,62 @@ Today: {date.today().isoformat()}"""
     # Mark as plan_drafted BEFORE writing plan data to DB.
     # If the DB writes below fail, the user stays in plan_drafted (not plan_approved
     # with missing data).
-    supabase.table("tenants").update(
-        {
-            "onboarding_status": "plan_drafted",
-        }
-    ).eq("id", tenant_id).execute()
+    await execute(
+        supabase.table("tenants")
+        .update(
+            {
+                "onboarding_status": "plan_drafted",
+            }
+        )
+        .eq("id", tenant_id)
+    )
+    invalidate_tenant(tenant_id)
 
     # Store quarterly plans
     today = date.today()
     current_quarter = (today.month - 1) // 3 + 1
     for qm in plan.get("quarterly_milestones", []):
-        supabase.table("quarterly_plans").upsert(
+        await execute(
+            supabase.table("quarterly_plans").upsert(
+                {
+                    "goal_id": goal_id,
+                    "quarter": qm.get("quarter", current_quarter),
+                    "year": today.year,
+                    "milestones": qm,
+                },
+                on_conflict="goal_id,quarter,year",
+            )
+        )
+
+    # Store monthly plan
+    await execute(
+        supabase.table("monthly_plans").upsert(
             {
-                "goal_id": goal_id,
-                "quarter": qm.get("quarter", current_quarter),
+                "tenant_id": tenant_id,
+                "month": today.month,
                 "year": today.year,
-                "milestones": qm,
+                "targets": plan.get("monthly_targets", []),
             },
-            on_conflict="goal_id,quarter,year",
-        ).execute()
-
-    # Store monthly plan
-    supabase.table("monthly_plans").upsert(
-        {
-            "tenant_id": tenant_id,
-            "month": today.month,
-            "year": today.year,
-            "targets": plan.get("monthly_targets", []),
-        },
-        on_conflict="tenant_id,month,year",
-    ).execute()
+            on_conflict="tenant_id,month,year",
+        )
+    )
 
     # Store weekly plan + tasks
     week_start = today - timedelta(days=today.weekday())  # Monday
     week_end = week_start + timedelta(days=6)
 
-    supabase.table("weekly_plans").upsert(
-        {
-            "tenant_id": tenant_id,
-            "week_start": week_start.isoformat(),
-            "week_end": week_end.isoformat(),
-        },
-        on_conflict="tenant_id,week_start",
-    ).execute().data[0]
+    (
+        await execute(
+            supabase.table("weekly_plans").upsert(
+                {
+                    "tenant_id": tenant_id,
+                    "week_start": week_start.isoformat(),
+                    "week_end": week_end.isoformat(),
+                },
+                on_conflict="tenant_id,week_start",
+            )
+        )
+    ).data[0]
 
     # Map day names to dates for this week
     day_map = {
@@ -155,36 +169,45 @@ Today: {date.today().isoformat()}"""
 
     weekly = plan.get("weekly_tasks", {})
     for task in weekly.get("core", []):
-        supabase.table("tasks").insert(
-            {
-                "tenant_id": tenant_id,
-                "goal_id": goal_id,
-                "week_start": week_start.isoformat(),
-                "title": task["title"],
-                "category": "core",
-                "estimated_minutes": task.get("estimated_minutes"),
-                "scheduled_day": resolve_day(task.get("scheduled_day")),
-            }
-        ).execute()
+        await execute(
+            supabase.table("tasks").insert(
+                {
+                    "tenant_id": tenant_id,
+                    "goal_id": goal_id,
+                    "week_start": week_start.isoformat(),
+                    "title": task["title"],
+                    "category": "core",
+                    "estimated_minutes": task.get("estimated_minutes"),
+                    "scheduled_day": resolve_day(task.get("scheduled_day")),
+                }
+            )
+        )
 
     for task in weekly.get("flex", []):
-        supabase.table("tasks").insert(
-            {
-                "tenant_id": tenant_id,
-                "goal_id": goal_id,
-                "week_start": week_start.isoformat(),
-                "title": task["title"],
-                "category": "flex",
-                "estimated_minutes": task.get("estimated_minutes"),
-            }
-        ).execute()
+        await execute(
+            supabase.table("tasks").insert(
+                {
+                    "tenant_id": tenant_id,
+                    "goal_id": goal_id,
+                    "week_start": week_start.isoformat(),
+                    "title": task["title"],
+                    "category": "flex",
+                    "estimated_minutes": task.get("estimated_minutes"),
+                }
+            )
+        )
 
     # All plan data written successfully — now mark as plan_approved
-    supabase.table("tenants").update(
-        {
-            "onboarding_status": "plan_approved",
-        }
-    ).eq("id", tenant_id).execute()
+    await execute(
+        supabase.table("tenants")
+        .update(
+            {
+                "onboarding_status": "plan_approved",
+            }
+        )
+        .eq("id", tenant_id)
+    )
+    invalidate_tenant(tenant_id)
 
     track_event(tenant_id, "plan_approved", {"goal_id": goal_id})
 
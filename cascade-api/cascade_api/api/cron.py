@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
 from fastapi import APIRouter, Request, HTTPException
 import structlog
 
@@ -23,26 +25,24 @@ def _verify_cron_secret(request: Request):
 
 @router.post("/daily")
 async def cron_daily(request: Request):
-    """Send daily message to all eligible tenants at their preferred time."""
+    """Queue the daily message fan-out and memory maintenance.
+
+    The work runs on the job queue; each job is deduplicated per tick (fan-out)
+    or per day (decay, purge), so overlapping cron calls are harmless.
+    """
     _verify_cron_secret(request)
 
-    from cascade_api.telegram.bot import create_bot
-    from cascade_api.telegram.scheduler import send_daily_messages
+    from cascade_api.jobs import enqueue
 
-    bot = create_bot().bot
-    result = await send_daily_messages(bot)
+    now = datetime.now(timezone.utc)
+    tick = f"{now:%Y-%m-%dT%H}:{now.minute // 15}"
+    day = now.date().isoformat()
+    result = {
+        "fanout_job": await enqueue("scheduled.daily_fanout", dedupe_key=f"daily_fanout:{tick}"),
+        "decay_job": await enqueue("memory.decay", dedupe_key=f"memory_decay:{day}"),
+        "purge_job": await enqueue("jobs.purge", dedupe_key=f"jobs_purge:{day}"),
+    }
     log.info("cron.daily", **result)
-
-    # Memory decay — update scores daily
-    from cascade_api.dependencies import get_memory_client
-
-    try:
-        decay_updated = await get_memory_client().run_decay()
-        result["decay_updated"] = decay_updated
-    except Exception as e:
-        log.warning("cron.decay_failed", error=str(e))
-        result["decay_updated"] = 0
-
     return result
 
 
@@ -58,3 +58,28 @@ async def cron_trial_check(request: Request):
     result = await run_trial_check_pull(bot)
     log.info("cron.trial_check", **result)
     return result
+
+
+@router.post("/backfill-velocity")
+async def cron_backfill_velocity(request: Request):
+    """Rebuild the weekly_velocity rollup for every tenant (idempotent)."""
+    _verify_cron_secret(request)
+
+    from cascade_api.db.client import execute
+    from cascade_api.db.tracker import backfill_weekly_velocity
+    from cascade_api.dependencies import get_supabase
+
+    supabase = get_supabase()
+    tenants = (await execute(supabase.table("tenants").select("id"))).data
+    result = {"tenants": len(tenants), "weeks": 0, "failed": 0}
+
+    # One tenant per call keeps each backfill transaction (and its row locks) small
+    for tenant in tenants:
+        try:
+            result["weeks"] += await backfill_weekly_velocity(supabase, tenant["id"])
+        except Exception as e:
+            log.warning("cron.velocity_backfill_failed", tenant_id=tenant["id"], error=str(e))
+            result["failed"] += 1
+
+    log.info("cron.backfill_velocity", **result)
+    return result
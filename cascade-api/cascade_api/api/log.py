@@ -9,9 +9,9 @@ from fastapi import HTTPException
 from pydantic import BaseModel
 
 from cascade_api.api.router import api_router
-from cascade_api.db.client import get_supabase
+from cascade_api.db.client import execute, get_supabase
 from cascade_api.db import tracker
-from cascade_api.dependencies import get_anthropic
+from cascade_api.llm.gateway import create_message
 
 log = structlog.get_logger()
 
@@ -52,8 +52,9 @@ async def log_progress(req: LogRequest):
 
     # Parse natural language with Claude Haiku
     try:
-        client = get_anthropic()
-        message = await client.messages.create(
+        message = await create_message(
+            call_site="api.log",
+            tenant_id=req.tenant_id,
             model="claude-haiku-4-5-20251001",
             max_tokens=512,
             system=PARSE_SYSTEM_PROMPT,
@@ -90,9 +91,8 @@ async def log_progress(req: LogRequest):
     entry = await tracker.log_entry(supabase, req.tenant_id, entry_date, parsed)
 
     # Store raw text in conversations table
-    conv_result = (
-        supabase.table("conversations")
-        .insert(
+    conv_result = await execute(
+        supabase.table("conversations").insert(
             {
                 "tenant_id": req.tenant_id,
                 "raw_text": req.text,
@@ -100,7 +100,6 @@ async def log_progress(req: LogRequest):
                 "extracted_entities": parsed,
             }
         )
-        .execute()
     )
     conversation_id = conv_result.data[0]["id"]
 
@@ -0,0 +1,72 @@
+"""Operational metrics — in-process counters and latency histograms."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Request
+
+from cascade_api.api.cron import _verify_cron_secret
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@router.get("")
+async def get_metrics(request: Request):
+    """Snapshot of this process's metrics. Uses the cron secret for auth."""
+    _verify_cron_secret(request)
+
+    from cascade_api.llm.gateway import latency_snapshot
+    from cascade_api.db.tenants import get_tenant_cache
+    from cascade_api.dependencies import get_memory_client
+    from cascade_api.memory.embedders.batching import BatchingEmbedder
+    from cascade_api.memory.embedders.cached import CachedEmbedder
+    from cascade_api.telegram.dedup import get_update_dedup
+    from cascade_api.telegram.outbound import get_outbound_limiter
+
+    update_queue = getattr(request.app.state, "update_queue", None)
+    embedder = get_memory_client().embedder
+    return {
+        "llm": latency_snapshot(),
+        "telegram_updates": update_queue.snapshot() if update_queue else None,
+        "telegram_dedup": get_update_dedup().stats,
+        "tenant_cache": get_tenant_cache().stats,
+        "telegram_outbound": get_outbound_limiter().snapshot(),
+        "embedding_cache": _embedder_snapshot(embedder, CachedEmbedder),
+        "embedding_batcher": _embedder_snapshot(embedder, BatchingEmbedder),
+    }
+
+
+def _embedder_snapshot(embedder, kind: type) -> dict | None:
+    """Snapshot of the ``kind`` layer in a stack of wrapping embedders."""
+    while embedder is not None and not isinstance(embedder, kind):
+        embedder = getattr(embedder, "_embedder", None)
+    return embedder.snapshot() if embedder is not None else None
+
+
+@router.get("/usage")
+async def get_usage_rollups(request: Request, days: int = 7, tenant_id: UUID | None = None):
+    """LLM cost per tenant per day and latency per call site, from the usage ledger."""
+    _verify_cron_secret(request)
+
+    from datetime import date, datetime, timedelta, timezone
+
+    from cascade_api.db.client import execute
+    from cascade_api.dependencies import get_supabase
+
+    supabase = get_supabase()
+    since_day = date.today() - timedelta(days=days)
+    since_ts = datetime.now(timezone.utc) - timedelta(days=days)
+    cost = await execute(
+        supabase.rpc(
+            "llm_cost_daily",
+            {
+                "p_since": since_day.isoformat(),
+                "p_tenant_id": str(tenant_id) if tenant_id else None,
+            },
+        )
+    )
+    latency = await execute(
+        supabase.rpc("llm_latency_by_call_site", {"p_since": since_ts.isoformat()})
+    )
+    return {"cost_daily": cost.data, "latency_by_call_site": latency.data}
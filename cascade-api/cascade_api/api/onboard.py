@@ -5,6 +5,8 @@ from __future__ import annotations
 from pydantic import BaseModel
 from fastapi import APIRouter, HTTPException
 import structlog
+from cascade_api.db.client import execute, run_sync
+from cascade_api.db.tenants import invalidate_tenant
 from cascade_api.dependencies import get_supabase
 from cascade_api.observability.posthog_client import track_event
 from cascade_api.telegram.tokens import generate_token
@@ -44,46 +46,49 @@ async def create_goal(req: GoalRequest):
         supabase = get_supabase()
 
         # Find or create tenant
-        result = supabase.table("tenants").select("*").eq("user_id", req.user_id).execute()
+        result = await execute(supabase.table("tenants").select("*").eq("user_id", req.user_id))
         if result.data:
             tenant = result.data[0]
         else:
             tenant = (
-                supabase.table("tenants")
-                .insert(
+                await execute(
+                    supabase.table("tenants").insert(
+                        {
+                            "user_id": req.user_id,
+                            "core_hours": req.core_hours,
+                            "flex_hours": req.flex_hours,
+                            "onboarding_status": "signed_up",
+                        }
+                    )
+                )
+            ).data[0]
+
+        # Create goal
+        goal = (
+            await execute(
+                supabase.table("goals").insert(
                     {
-                        "user_id": req.user_id,
-                        "core_hours": req.core_hours,
-                        "flex_hours": req.flex_hours,
-                        "onboarding_status": "signed_up",
+                        "tenant_id": tenant["id"],
+                        "title": req.title,
+                        "description": f"{req.description}\n\nCurrent state: {req.current_state}",
+                        "success_criteria": req.success_criteria,
+                        "target_date": req.target_date,
                     }
                 )
-                .execute()
-                .data[0]
             )
+        ).data[0]
 
-        # Create goal
-        goal = (
-            supabase.table("goals")
-            .insert(
+        # Update onboarding status
+        await execute(
+            supabase.table("tenants")
+            .update(
                 {
-                    "tenant_id": tenant["id"],
-                    "title": req.title,
-                    "description": f"{req.description}\n\nCurrent state: {req.current_state}",
-                    "success_criteria": req.success_criteria,
-                    "target_date": req.target_date,
+                    "onboarding_status": "goal_set",
                 }
             )
-            .execute()
-            .data[0]
+            .eq("id", tenant["id"])
         )
-
-        # Update onboarding status
-        supabase.table("tenants").update(
-            {
-                "onboarding_status": "goal_set",
-            }
-        ).eq("id", tenant["id"]).execute()
+        invalidate_tenant(tenant["id"])
 
         track_event(req.user_id, "goal_defined", {"goal_title": req.title})
 
@@ -98,17 +103,22 @@ async def connect_telegram(req: TelegramConnectRequest):
     """Link Telegram account to tenant. Transition to tg_connected."""
     supabase = get_supabase()
 
-    result = supabase.table("tenants").select("*").eq("user_id", req.user_id).execute()
+    result = await execute(supabase.table("tenants").select("*").eq("user_id", req.user_id))
     if not result.data:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     tenant = result.data[0]
-    supabase.table("tenants").update(
-        {
-            "telegram_id": req.telegram_id,
-            "onboarding_status": "tg_connected",
-        }
-    ).eq("id", tenant["id"]).execute()
+    await execute(
+        supabase.table("tenants")
+        .update(
+            {
+                "telegram_id": req.telegram_id,
+                "onboarding_status": "tg_connected",
+            }
+        )
+        .eq("id", tenant["id"])
+    )
+    invalidate_tenant(tenant["id"], telegram_id=req.telegram_id)
 
     track_event(req.user_id, "telegram_connected", {"telegram_id": req.telegram_id})
 
@@ -124,12 +134,12 @@ async def generate_telegram_link(req: TelegramLinkRequest):
     """Generate a secure one-time deep link token for Telegram connection."""
     supabase = get_supabase()
 
-    result = supabase.table("tenants").select("*").eq("user_id", req.user_id).execute()
+    result = await execute(supabase.table("tenants").select("*").eq("user_id", req.user_id))
     if not result.data:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     tenant = result.data[0]
-    token = generate_token(supabase, tenant["id"])
+    token = await run_sync(generate_token, supabase, tenant["id"])
 
     return {"token": token, "tenant_id": tenant["id"]}
 
@@ -139,19 +149,24 @@ async def set_schedule(req: SetScheduleRequest):
     """Set user's schedule preferences and timezone during onboarding."""
     supabase = get_supabase()
 
-    result = supabase.table("tenants").select("*").eq("user_id", req.user_id).execute()
+    result = await execute(supabase.table("tenants").select("*").eq("user_id", req.user_id))
     if not result.data:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     tenant = result.data[0]
-    supabase.table("tenants").update(
-        {
-            "morning_hour": req.morning_hour,
-            "morning_minute": req.morning_minute,
-            "review_day": req.review_day,
-            "timezone": req.timezone,
-        }
-    ).eq("id", tenant["id"]).execute()
+    await execute(
+        supabase.table("tenants")
+        .update(
+            {
+                "morning_hour": req.morning_hour,
+                "morning_minute": req.morning_minute,
+                "review_day": req.review_day,
+                "timezone": req.timezone,
+            }
+        )
+        .eq("id", tenant["id"])
+    )
+    invalidate_tenant(tenant["id"])
 
     track_event(
         req.user_id,
@@ -12,7 +12,7 @@ from pydantic import BaseModel
 from cascade_api.api.router import api_router
 from cascade_api.db.client import get_supabase
 from cascade_api.db import tracker, tasks, adaptations, goals
-from cascade_api.dependencies import get_anthropic
+from cascade_api.llm.gateway import create_message
 
 log = structlog.get_logger()
 
@@ -129,8 +129,10 @@ async def generate_plan(req: PlanRequest):
 
     # Call Claude to generate the plan
     try:
-        client = get_anthropic(req.api_key)
-        message = await client.messages.create(
+        message = await create_message(
+            call_site="api.plan",
+            tenant_id=req.tenant_id,
+            api_key=req.api_key,
             model="claude-sonnet-4-5-20250514",
             max_tokens=2048,
             system=PLAN_SYSTEM_PROMPT,
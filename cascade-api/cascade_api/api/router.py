@@ -15,6 +15,7 @@ from cascade_api.api import onboard  # noqa: E402
 from cascade_api.api import cascade_plan  # noqa: E402
 from cascade_api.api import cron  # noqa: E402
 from cascade_api.api import telegram_webhook  # noqa: E402
+from cascade_api.api import metrics  # noqa: E402
 
 api_router.include_router(payment.router)
 api_router.include_router(stripe_webhook.router)
@@ -22,3 +23,4 @@ api_router.include_router(onboard.router)
 api_router.include_router(cascade_plan.router)
 api_router.include_router(cron.router)
 api_router.include_router(telegram_webhook.router)
+api_router.include_router(metrics.router)
@@ -9,6 +9,8 @@ import structlog
 from fastapi import APIRouter, Request, HTTPException
 
 from cascade_api.config import settings
+from cascade_api.db.client import run_sync
+from cascade_api.db.tenants import invalidate_tenant
 from cascade_api.dependencies import get_supabase
 from cascade_api.observability.posthog_client import track_event
 
@@ -53,6 +55,7 @@ def process_webhook_event(
                 "stripe_subscription_id": data.get("subscription"),
             }
         ).eq("id", tenant_id).execute()
+        invalidate_tenant(tenant_id)
 
         track_event(tenant_id, "payment_completed", {})
 
@@ -71,6 +74,7 @@ def process_webhook_event(
                     "subscription_status": "canceled",
                 }
             ).eq("id", t["id"]).execute()
+            invalidate_tenant(t["id"])
             track_event(t.get("user_id", t["id"]), "churned", {})
 
     elif event_type == "invoice.payment_failed":
@@ -85,6 +89,7 @@ def process_webhook_event(
                     "past_due_since": datetime.now(timezone.utc).isoformat(),
                 }
             ).eq("id", result.data[0]["id"]).execute()
+            invalidate_tenant(result.data[0]["id"])
 
     elif event_type == "invoice.paid":
         customer_id = data.get("customer")
@@ -98,6 +103,7 @@ def process_webhook_event(
                     "past_due_since": None,
                 }
             ).eq("id", result.data[0]["id"]).execute()
+            invalidate_tenant(result.data[0]["id"])
 
     return {"status": "processed"}
 
@@ -118,7 +124,8 @@ async def stripe_webhook(request: Request):
         raise HTTPException(status_code=400, detail="Invalid signature")
 
     data_obj = event.data.object
-    result = process_webhook_event(
+    result = await run_sync(
+        process_webhook_event,
         event_id=event.id,
         event_type=event.type,
         data={
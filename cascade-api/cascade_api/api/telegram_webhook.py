@@ -8,6 +8,7 @@ from telegram import Update
 
 from cascade_api.config import settings
 from cascade_api.observability.posthog_client import track_event
+from cascade_api.telegram.dedup import get_update_dedup
 
 log = structlog.get_logger()
 
@@ -70,7 +71,12 @@ async def webhook_info(request: Request):
 
 @router.post("/webhook")
 async def telegram_webhook(request: Request):
-    """Receive an update from Telegram and process it through the bot application."""
+    """Receive an update from Telegram and queue it for the bot application.
+
+    Acks as soon as the update is queued so Telegram doesn't time out and
+    retry while the agent runs. Without a running queue (e.g. in tests) the
+    update is processed inline.
+    """
     # Verify the secret token header
     if settings.telegram_webhook_secret:
         header_secret = request.headers.get("X-Telegram-Bot-Api-Secret-Token")
@@ -91,6 +97,18 @@ async def telegram_webhook(request: Request):
             "chat_type": update.effective_chat.type if update.effective_chat else None,
         },
     )
-    await bot_app.process_update(update)
+
+    # Redeliveries of an update we already took are acked without running it again
+    dedup = get_update_dedup()
+    if not await dedup.claim(update.update_id):
+        return {"ok": True}
+
+    update_queue = getattr(request.app.state, "update_queue", None)
+    if update_queue is None:
+        await bot_app.process_update(update)
+    elif not update_queue.submit(update):
+        # Backlogged: refuse so Telegram redelivers later
+        await dedup.release(update.update_id)
+        raise HTTPException(status_code=503, detail="Update queue full")
 
     return {"ok": True}
@@ -5,13 +5,20 @@ class Settings(BaseSettings):
     supabase_url: str = ""
     supabase_service_key: str = ""
     anthropic_api_key: str = ""
+    anthropic_timeout_s: float = 60.0
+    anthropic_max_retries: int = 2
+    anthropic_client_cache_size: int = 32  # pooled clients kept per API key (BYOK)
     database_url: str = ""
+    db_max_concurrency: int = 20  # worker threads for blocking Supabase calls
+    history_token_budget: int = 3000  # recent turns sent verbatim to the agent
+    history_summary_min_tokens: int = 800  # overflow needed before re-summarizing
     port: int = 8000
     data_dir: str = "../data"
     log_level: str = "info"
     sentry_dsn: str = ""
     posthog_api_key: str = ""
     posthog_host: str = "https://us.i.posthog.com"
+    usage_ledger_enabled: bool = True  # batch-write every LLM call to llm_usage
     langfuse_public_key: str = ""
     langfuse_secret_key: str = ""
     langfuse_host: str = "https://cloud.langfuse.com"
@@ -24,7 +31,25 @@ class Settings(BaseSettings):
     telegram_webhook_url: str = ""  # e.g. https://your-app.up.railway.app/api/telegram/webhook
     telegram_webhook_secret: str = ""  # secret token for webhook verification
     cron_secret: str = ""
+    job_worker_enabled: bool = True  # run a job worker inside the API process
+    job_worker_concurrency: int = 4
+    job_poll_interval_s: float = 2.0
+    scheduled_fanout_concurrency: int = 8  # tenants processed at once by the daily cron
+    scheduled_message_timeout_s: float = 90.0  # per-tenant budget for one daily message
+    telegram_update_consumers: int = 8  # webhook updates processed at once (one per user)
+    telegram_update_queue_max: int = 1000  # queued updates before the webhook refuses
+    telegram_coalesce_window_s: float = 1.5  # merge a user's quick texts; 0 = off
+    telegram_dedup_cache_size: int = 10000  # recent update_ids remembered in memory
+    tenant_cache_ttl_s: float = 30.0  # tenant rows cached per process; 0 = off
+    telegram_global_rate: float = 30.0  # outbound Bot API requests per second
+    telegram_chat_rate: float = 1.0  # messages per second to one private chat
     gemini_api_key: str = ""
+    memory_search_oversample: int = 4  # HNSW candidates per recalled memory
+    memory_embedding_dimensions: int = 768  # must match memories.embedding
+    embedding_cache_size: int = 10000  # vectors kept in memory; 0 = no cache
+    embedding_batch_window_s: float = 0.005  # coalesce concurrent embeds; 0 = off
+    embedding_batch_max: int = 100  # texts per coalesced request
+    embedding_batch_in_flight: int = 4  # batches outstanding at once
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 import structlog
 from supabase import Client as SupabaseClient
 
+from cascade_api.db.client import execute
+
 log = structlog.get_logger()
 
 
@@ -22,7 +24,7 @@ async def create_adaptation(
         "pattern_type": pattern_type,
         "description": description,
     }
-    result = supabase.table("adaptations").insert(row).execute()
+    result = await execute(supabase.table("adaptations").insert(row))
     log.info(
         "adaptation.created",
         tenant_id=tenant_id,
@@ -36,13 +38,12 @@ async def get_active(
     tenant_id: str,
 ) -> list[dict]:
     """Return adaptations where active=True."""
-    result = (
+    result = await execute(
         supabase.table("adaptations")
         .select("*")
         .eq("tenant_id", tenant_id)
         .eq("active", True)
         .order("detected_at", desc=True)
-        .execute()
     )
     return result.data
 
@@ -52,7 +53,7 @@ async def approve(
     adaptation_id: str,
 ) -> dict:
     """Mark an adaptation as approved."""
-    result = (
+    result = await execute(
         supabase.table("adaptations")
         .update(
             {
@@ -61,7 +62,6 @@ async def approve(
             }
         )
         .eq("id", adaptation_id)
-        .execute()
     )
     log.info("adaptation.approved", adaptation_id=adaptation_id)
     return result.data[0]
@@ -1,5 +1,43 @@
-"""Supabase client — re-exported for convenience."""
+"""Supabase client — re-exported for convenience, plus non-blocking query execution.
 
+The Supabase Python SDK is synchronous: every ``.execute()`` is a full HTTP
+round trip. Calling it directly inside ``async def`` stalls the event loop for
+every other webhook in the process, so all data-access code awaits
+``execute(query)`` instead, which runs the request on a bounded worker pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, TypeVar
+
+from cascade_api.config import settings
 from cascade_api.dependencies import get_supabase
 
-__all__ = ["get_supabase"]
+T = TypeVar("T")
+
+
+@lru_cache
+def _get_executor() -> ThreadPoolExecutor:
+    """Dedicated pool so DB calls never queue behind other ``to_thread`` work."""
+    return ThreadPoolExecutor(
+        max_workers=settings.db_max_concurrency,
+        thread_name_prefix="supabase",
+    )
+
+
+async def execute(query: Any) -> Any:
+    """Run a PostgREST query builder's blocking ``.execute()`` off the event loop."""
+    return await run_sync(query.execute)
+
+
+async def run_sync(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking Supabase helper (e.g. ``verify_token``) on the DB worker pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(fn, *args, **kwargs))
+
+
+__all__ = ["execute", "get_supabase", "run_sync"]
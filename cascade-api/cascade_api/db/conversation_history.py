@@ -1,34 +1,232 @@
-"""Conversation history storage for the agent loop."""
+"""Conversation history storage for the agent loop.
+
+Recent turns are packed newest-first into a token budget. Turns that fall
+out of the budget are folded into a rolling per-tenant summary
+(``conversation_summaries``) by a background task, so the request path only
+ever reads the stored summary.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
 import structlog
 from supabase import Client as SupabaseClient
 
+from cascade_api.config import settings
+from cascade_api.db.client import execute
+
 log = structlog.get_logger()
 
-MAX_HISTORY_MESSAGES = 20  # Keep last N messages for context
+HISTORY_FETCH_LIMIT = 60  # rows read per turn to fill the token budget
+SUMMARY_MODEL = "claude-haiku-4-5-20251001"
+SUMMARY_BATCH_SIZE = 80  # turns folded into the summary per refresh
+SUMMARY_TURN_CHARS = 2000  # per-turn cap in the summarization transcript
+
+SUMMARY_PROMPT = """You maintain a running summary of a coaching conversation between a user \
+and Cascade, their goal-execution coach.
+
+Current summary:
+{summary}
+
+Older turns to fold in:
+{transcript}
+
+Rewrite the summary to include anything from these turns that matters for future \
+coaching: commitments, decisions, progress, setbacks, open questions, and how the user \
+likes to be coached. Drop small talk. Keep it under 250 words, third person, plain text.
+
+Return ONLY the updated summary."""
+
+# Tenants with a summary refresh in flight (one at a time per tenant)
+_refreshing: set[str] = set()
+_background_tasks: set[asyncio.Task] = set()
+
+
+@dataclass
+class ConversationContext:
+    """What the agent sees of past conversation on a turn."""
+
+    summary: str | None = None
+    messages: list[dict] = field(default_factory=list)
+    # Oldest turn still sent verbatim; older unsummarized turns need folding
+    oldest_included_id: int | None = None
+    needs_summary_refresh: bool = False
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 chars/token plus per-message overhead)."""
+    return len(text) // 4 + 4
+
+
+async def load_context(
+    supabase: SupabaseClient,
+    tenant_id: str,
+    token_budget: int | None = None,
+) -> ConversationContext:
+    """Rolling summary plus as many recent turns as fit in ``token_budget``."""
+    budget = token_budget if token_budget is not None else settings.history_token_budget
+
+    rows_result, summary_result = await asyncio.gather(
+        execute(
+            supabase.table("conversations")
+            .select("id, role, content")
+            .eq("tenant_id", tenant_id)
+            .eq("source", "agent_history")
+            .order("id", desc=True)
+            .limit(HISTORY_FETCH_LIMIT)
+        ),
+        execute(
+            supabase.table("conversation_summaries")
+            .select("summary, summarized_through_id")
+            .eq("tenant_id", tenant_id)
+        ),
+    )
+    rows = rows_result.data or []
+    summary_row = summary_result.data[0] if summary_result.data else {}
+    summarized_through = summary_row.get("summarized_through_id") or 0
+
+    packed: list[dict] = []
+    used = 0
+    for row in rows:  # newest first
+        if row["id"] <= summarized_through:
+            break
+        cost = estimate_tokens(row.get("content") or "")
+        if packed and used + cost > budget:
+            break
+        packed.append(row)
+        used += cost
+
+    # Start on a user turn so the transcript alternates correctly
+    while packed and packed[-1]["role"] != "user":
+        packed.pop()
+    packed.reverse()
+
+    oldest_included_id = packed[0]["id"] if packed else None
+    overflow = [
+        row
+        for row in rows
+        if row["id"] > summarized_through
+        and (oldest_included_id is None or row["id"] < oldest_included_id)
+    ]
+    overflow_tokens = sum(estimate_tokens(row.get("content") or "") for row in overflow)
+    fetch_exhausted = len(rows) == HISTORY_FETCH_LIMIT and rows[-1]["id"] > summarized_through
+
+    return ConversationContext(
+        summary=summary_row.get("summary") or None,
+        messages=[{"role": row["role"], "content": row["content"]} for row in packed],
+        oldest_included_id=oldest_included_id,
+        needs_summary_refresh=bool(overflow)
+        and (fetch_exhausted or overflow_tokens >= settings.history_summary_min_tokens),
+    )
 
 
 async def get_history(
     supabase: SupabaseClient,
     tenant_id: str,
 ) -> list[dict]:
-    """Retrieve recent conversation history for the agent."""
-    result = (
+    """Retrieve recent conversation history for the agent (within the token budget)."""
+    context = await load_context(supabase, tenant_id)
+    return context.messages
+
+
+def schedule_summary_refresh(
+    supabase: SupabaseClient,
+    tenant_id: str,
+    context: ConversationContext,
+) -> None:
+    """Fold turns older than the packed window into the summary, off the request path."""
+    if not context.needs_summary_refresh or tenant_id in _refreshing:
+        return
+    _refreshing.add(tenant_id)
+    task = asyncio.create_task(
+        _refresh_in_background(supabase, tenant_id, context.oldest_included_id),
+        name=f"history_summary_{tenant_id[:8]}",
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _refresh_in_background(
+    supabase: SupabaseClient, tenant_id: str, before_id: int | None
+) -> None:
+    try:
+        await refresh_summary(supabase, tenant_id, before_id)
+    except Exception as e:
+        log.warning("history.summary_refresh_failed", tenant_id=tenant_id, error=str(e))
+    finally:
+        _refreshing.discard(tenant_id)
+
+
+async def refresh_summary(
+    supabase: SupabaseClient,
+    tenant_id: str,
+    before_id: int | None,
+) -> int:
+    """Fold unsummarized turns older than ``before_id`` into the stored summary.
+
+    Incremental: only turns after ``summarized_through_id`` are sent to the
+    model, together with the previous summary. Returns the number of turns
+    folded in.
+    """
+    from cascade_api.llm.gateway import create_message
+
+    existing = await execute(
+        supabase.table("conversation_summaries")
+        .select("summary, summarized_through_id")
+        .eq("tenant_id", tenant_id)
+    )
+    current = existing.data[0] if existing.data else {}
+    summarized_through = current.get("summarized_through_id") or 0
+
+    query = (
         supabase.table("conversations")
-        .select("role, content")
+        .select("id, role, content")
         .eq("tenant_id", tenant_id)
         .eq("source", "agent_history")
-        .order("created_at", desc=True)
-        .limit(MAX_HISTORY_MESSAGES)
-        .execute()
+        .gt("id", summarized_through)
     )
-    # Reverse to chronological order
-    rows = list(reversed(result.data))
-    return [{"role": row["role"], "content": row["content"]} for row in rows]
+    if before_id is not None:
+        query = query.lt("id", before_id)
+    turns = (await execute(query.order("id").limit(SUMMARY_BATCH_SIZE))).data
+    if not turns:
+        return 0
+
+    transcript = "\n\n".join(
+        f"{row['role'].capitalize()}: {(row.get('content') or '')[:SUMMARY_TURN_CHARS]}"
+        for row in turns
+    )
+    response = await create_message(
+        call_site="history.summary",
+        model=SUMMARY_MODEL,
+        max_tokens=512,
+        messages=[
+            {
+                "role": "user",
+                "content": SUMMARY_PROMPT.format(
+                    summary=current.get("summary") or "(none yet)",
+                    transcript=transcript,
+                ),
+            }
+        ],
+    )
+    summary = response.content[0].text.strip()
+
+    await execute(
+        supabase.table("conversation_summaries").upsert(
+            {
+                "tenant_id": tenant_id,
+                "summary": summary,
+                "summarized_through_id": turns[-1]["id"],
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+    )
+    log.info("history.summary_refreshed", tenant_id=tenant_id, turns=len(turns))
+    return len(turns)
 
 
 async def save_turn(
@@ -38,12 +236,14 @@ async def save_turn(
     content: str,
 ) -> None:
     """Save a single conversation turn."""
-    supabase.table("conversations").insert(
-        {
-            "tenant_id": tenant_id,
-            "role": role,
-            "raw_text": content if isinstance(content, str) else json.dumps(content),
-            "content": content,
-            "source": "agent_history",
-        }
-    ).execute()
+    await execute(
+        supabase.table("conversations").insert(
+            {
+                "tenant_id": tenant_id,
+                "role": role,
+                "raw_text": content if isinstance(content, str) else json.dumps(content),
+                "content": content,
+                "source": "agent_history",
+            }
+        )
+    )
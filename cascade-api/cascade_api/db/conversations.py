@@ -7,7 +7,8 @@ import json
 import structlog
 from supabase import Client as SupabaseClient
 
-from cascade_api.dependencies import get_anthropic
+from cascade_api.db.client import execute
+from cascade_api.llm.gateway import create_message
 
 log = structlog.get_logger()
 
@@ -24,7 +25,7 @@ async def store_conversation(
         "raw_text": raw_text,
         "source": source,
     }
-    result = supabase.table("conversations").insert(row).execute()
+    result = await execute(supabase.table("conversations").insert(row))
     log.info("conversation.stored", tenant_id=tenant_id, source=source)
     return result.data[0]
 
@@ -45,7 +46,7 @@ async def get_conversations(
     )
     if source:
         query = query.eq("source", source)
-    result = query.execute()
+    result = await execute(query)
     return result.data
 
 
@@ -72,8 +73,9 @@ async def extract_entities(
 
     Uses Claude Haiku for speed/cost. Updates extracted_entities JSONB column.
     """
-    client = get_anthropic(api_key)
-    message = await client.messages.create(
+    message = await create_message(
+        call_site="db.conversations",
+        api_key=api_key,
         model="claude-haiku-4-5-20251001",
         max_tokens=256,
         messages=[
@@ -91,11 +93,10 @@ async def extract_entities(
             raw = raw[: raw.rfind("```")]
     entities: dict = json.loads(raw)
 
-    result = (
+    result = await execute(
         supabase.table("conversations")
         .update({"extracted_entities": entities})
         .eq("id", conversation_id)
-        .execute()
     )
     log.info(
         "conversation.entities_extracted",
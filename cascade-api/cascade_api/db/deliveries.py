@@ -0,0 +1,92 @@
+"""Claim/complete helpers for the message_deliveries table.
+
+A scheduled message is claimed before it is generated, so concurrent cron
+ticks or replicas never both send it. See migration 015 for the states.
+An expired claim can be taken over, so completion only applies while the
+row still carries this worker's claim (migration 021).
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import NamedTuple
+
+import structlog
+from supabase import Client as SupabaseClient
+
+from cascade_api.db.client import execute
+
+log = structlog.get_logger()
+
+DELIVERY_LEASE_S = 300  # well above scheduled_message_timeout_s
+MAX_DELIVERY_ATTEMPTS = 3
+
+
+class DeliveryClaim(NamedTuple):
+    id: int
+    attempts: int  # changes whenever the row is reclaimed
+
+
+async def claim_delivery(
+    supabase: SupabaseClient,
+    tenant_id: str,
+    message_type: str,
+    scheduled_for: date,
+) -> DeliveryClaim | None:
+    """Atomically claim a delivery. Returns the claim, or None if someone else owns it."""
+    result = await execute(
+        supabase.rpc(
+            "claim_delivery",
+            {
+                "p_tenant_id": tenant_id,
+                "p_message_type": message_type,
+                "p_scheduled_for": scheduled_for.isoformat(),
+                "p_lease_seconds": DELIVERY_LEASE_S,
+                "p_max_attempts": MAX_DELIVERY_ATTEMPTS,
+            },
+        )
+    )
+    if not result.data:
+        return None
+    row = result.data[0]
+    return DeliveryClaim(row["id"], row["attempts"])
+
+
+def _owned(query, claim: DeliveryClaim):
+    return query.eq("id", claim.id).eq("attempts", claim.attempts).eq("status", "claimed")
+
+
+async def mark_sent(supabase: SupabaseClient, claim: DeliveryClaim) -> None:
+    result = await execute(
+        _owned(
+            supabase.table("message_deliveries").update(
+                {
+                    "status": "sent",
+                    "sent_at": datetime.now(timezone.utc).isoformat(),
+                    "lease_expires_at": None,
+                }
+            ),
+            claim,
+        )
+    )
+    if not result.data:
+        log.warning("delivery.claim_lost", delivery_id=claim.id, attempts=claim.attempts)
+
+
+async def mark_failed(supabase: SupabaseClient, claim: DeliveryClaim, error: str) -> None:
+    """Release a claim so a later tick can retry it (best effort)."""
+    try:
+        result = await execute(
+            _owned(
+                supabase.table("message_deliveries").update(
+                    {"status": "failed", "lease_expires_at": None, "last_error": error[:500]}
+                ),
+                claim,
+            )
+        )
+    except Exception as e:
+        # The lease expires on its own; the retry just waits longer
+        log.warning("delivery.mark_failed_failed", delivery_id=claim.id, error=str(e))
+        return
+    if not result.data:
+        log.warning("delivery.claim_lost", delivery_id=claim.id, attempts=claim.attempts)
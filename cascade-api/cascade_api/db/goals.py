@@ -5,6 +5,8 @@ from __future__ import annotations
 import structlog
 from supabase import Client as SupabaseClient
 
+from cascade_api.db.client import execute
+
 log = structlog.get_logger()
 
 
@@ -25,7 +27,7 @@ async def create_goal(
     if target_date is not None:
         row["target_date"] = target_date
 
-    result = supabase.table("goals").insert(row).execute()
+    result = await execute(supabase.table("goals").insert(row))
     log.info("goal.created", tenant_id=tenant_id, title=title)
     return result.data[0]
 
@@ -36,13 +38,12 @@ async def get_goals(
     status: str = "active",
 ) -> list[dict]:
     """Return goals filtered by status."""
-    result = (
+    result = await execute(
         supabase.table("goals")
         .select("*")
         .eq("tenant_id", tenant_id)
         .eq("status", status)
         .order("created_at", desc=True)
-        .execute()
     )
     return result.data
 
@@ -53,6 +54,6 @@ async def update_goal(
     **updates,
 ) -> dict:
     """Update a goal by ID."""
-    result = supabase.table("goals").update(updates).eq("id", goal_id).execute()
+    result = await execute(supabase.table("goals").update(updates).eq("id", goal_id))
     log.info("goal.updated", goal_id=goal_id, fields=list(updates.keys()))
     return result.data[0]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import structlog
 from supabase import Client as SupabaseClient
 
+from cascade_api.db.client import execute
 from cascade_api.steer.skill_tracker import update_skill
 
 log = structlog.get_logger()
@@ -34,7 +35,7 @@ async def create_indicator(
     if due_date is not None:
         row["due_date"] = due_date
 
-    result = supabase.table("leading_indicators").insert(row).execute()
+    result = await execute(supabase.table("leading_indicators").insert(row))
     log.info("indicator.created", tenant_id=tenant_id, title=title)
     return result.data[0]
 
@@ -45,13 +46,12 @@ async def get_indicators(
     goal_id: str,
 ) -> list[dict]:
     """Return all indicators for a goal."""
-    result = (
+    result = await execute(
         supabase.table("leading_indicators")
         .select("*")
         .eq("tenant_id", tenant_id)
         .eq("goal_id", goal_id)
         .order("created_at")
-        .execute()
     )
     return result.data
 
@@ -62,11 +62,10 @@ async def update_indicator(
     current_value: int,
 ) -> dict:
     """Update the current_value of an indicator."""
-    result = (
+    result = await execute(
         supabase.table("leading_indicators")
         .update({"current_value": current_value})
         .eq("id", indicator_id)
-        .execute()
     )
     log.info("indicator.updated", id=indicator_id, current_value=current_value)
     return result.data[0]
@@ -77,11 +76,8 @@ async def complete_indicator(
     indicator_id: str,
 ) -> dict:
     """Mark an indicator complete and bump linked skill proficiency."""
-    result = (
-        supabase.table("leading_indicators")
-        .update({"completed": True})
-        .eq("id", indicator_id)
-        .execute()
+    result = await execute(
+        supabase.table("leading_indicators").update({"completed": True}).eq("id", indicator_id)
     )
     indicator = result.data[0]
     log.info("indicator.completed", id=indicator_id)
@@ -89,12 +85,11 @@ async def complete_indicator(
     # If linked to a skill, bump proficiency by 0.1 (capped at 1.0)
     if indicator.get("skill_name") and indicator.get("tenant_id"):
         # Get current proficiency
-        user_result = (
+        user_result = await execute(
             supabase.table("user_skills")
             .select("proficiency")
             .eq("tenant_id", indicator["tenant_id"])
             .eq("skill_name", indicator["skill_name"])
-            .execute()
         )
 
         current = float(user_result.data[0]["proficiency"]) if user_result.data else 0.0
@@ -122,13 +117,12 @@ async def get_deficit(
     goal_id: str,
 ) -> list[dict]:
     """Return indicators sorted by deficit (target - current), descending."""
-    result = (
+    result = await execute(
         supabase.table("leading_indicators")
         .select("id, title, target_value, current_value, unit, skill_name, due_date")
         .eq("tenant_id", tenant_id)
         .eq("goal_id", goal_id)
         .eq("completed", False)
-        .execute()
     )
 
     items: list[dict] = []
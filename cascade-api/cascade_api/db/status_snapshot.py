@@ -0,0 +1,68 @@
+"""Progress snapshot shared by /api/status and the agent's get_status tool.
+
+The raw numbers come from the ``get_status_snapshot`` Postgres function in a
+single round trip; this module derives the trend and monthly pacing from them.
+"""
+
+from __future__ import annotations
+
+import calendar
+from datetime import date
+
+from supabase import Client as SupabaseClient
+
+from cascade_api.db.client import execute
+
+_EMPTY_WEEK = {"core_completed": 0, "core_total": 0, "flex_completed": 0, "flex_total": 0}
+
+
+def compute_trend(velocity_weeks: list[dict]) -> str:
+    """Determine if completion rate is trending up, down, or flat."""
+    if len(velocity_weeks) < 2:
+        return "flat"
+    rates = [w.get("completion_rate") or 0 for w in velocity_weeks[:3]]
+    # rates are newest-first
+    if rates[0] > rates[-1] + 5:
+        return "up"
+    elif rates[0] < rates[-1] - 5:
+        return "down"
+    return "flat"
+
+
+async def get_status_snapshot(
+    supabase: SupabaseClient,
+    tenant_id: str,
+    today: date | None = None,
+    weeks: int = 4,
+) -> dict:
+    """Velocity, week and month progress, rest debt and active adaptations."""
+    today = today or date.today()
+    result = await execute(
+        supabase.rpc(
+            "get_status_snapshot",
+            {"p_tenant_id": tenant_id, "p_today": today.isoformat(), "p_weeks": weeks},
+        )
+    )
+    raw = result.data if isinstance(result.data, dict) else {}
+
+    velocity_weeks = raw.get("velocity_weeks") or []
+    week = {**_EMPTY_WEEK, **(raw.get("week_progress") or {})}
+    core_total = week["core_total"]
+    _, days_in_month = calendar.monthrange(today.year, today.month)
+
+    return {
+        "week_progress": {
+            **week,
+            "core_rate": round(week["core_completed"] / core_total * 100, 1) if core_total else 0,
+        },
+        "velocity_trend": compute_trend(velocity_weeks),
+        "velocity_weeks": velocity_weeks,
+        "monthly_progress": {
+            "entries_count": raw.get("month_entries_count") or 0,
+            "days_elapsed": today.day,
+            "days_in_month": days_in_month,
+            "pct_elapsed": round(today.day / days_in_month * 100, 1),
+        },
+        "rest_debt_days": raw.get("rest_debt_days") or 0,
+        "active_adaptations": raw.get("active_adaptations") or [],
+    }
@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 import structlog
 from supabase import Client as SupabaseClient
 
+from cascade_api.db.client import execute
+
 log = structlog.get_logger()
 
 
@@ -34,7 +36,7 @@ async def create_task(
     if estimated_minutes is not None:
         row["estimated_minutes"] = estimated_minutes
 
-    result = supabase.table("tasks").insert(row).execute()
+    result = await execute(supabase.table("tasks").insert(row))
     log.info("task.created", tenant_id=tenant_id, title=title, category=category)
     return result.data[0]
 
@@ -45,13 +47,12 @@ async def get_week_tasks(
     week_start: str,
 ) -> list[dict]:
     """Return all tasks for a given week."""
-    result = (
+    result = await execute(
         supabase.table("tasks")
         .select("*")
         .eq("tenant_id", tenant_id)
         .eq("week_start", week_start)
         .order("sort_order")
-        .execute()
     )
     return result.data
 
@@ -61,7 +62,7 @@ async def complete_task(
     task_id: str,
 ) -> dict:
     """Mark a task as completed with a timestamp."""
-    result = (
+    result = await execute(
         supabase.table("tasks")
         .update(
             {
@@ -70,7 +71,6 @@ async def complete_task(
             }
         )
         .eq("id", task_id)
-        .execute()
     )
     log.info("task.completed", task_id=task_id)
     return result.data[0]
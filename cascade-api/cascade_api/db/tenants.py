@@ -1,20 +1,126 @@
-"""CRUD helpers for the tenants table."""
+"""CRUD helpers for the tenants table.
+
+Reads go through a short-TTL in-process cache keyed by tenant id and
+Telegram id: every inbound message looks its tenant up, and the agent loop
+reads the same row again for timezone and schedule. Code that writes to
+``tenants`` calls ``invalidate_tenant`` so this process sees the change
+immediately; other replicas see it once the TTL lapses.
+"""
 
 from __future__ import annotations
 
+import threading
+import time
+
 import structlog
 from supabase import Client as SupabaseClient
 
+from cascade_api.config import settings
+from cascade_api.db.client import execute
+
 log = structlog.get_logger()
 
 
+class TenantCache:
+    """Full tenant rows by id, with a Telegram id index. Thread-safe.
+
+    The Stripe webhook writes from a worker thread, hence the lock.
+    """
+
+    def __init__(self, ttl_s: float | None = None, max_size: int = 10_000):
+        self.ttl_s = settings.tenant_cache_ttl_s if ttl_s is None else ttl_s
+        self.max_size = max_size
+        self._rows: dict[str, tuple[float, dict]] = {}
+        self._ids_by_telegram: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, tenant_id: str) -> dict | None:
+        with self._lock:
+            return self._get(tenant_id)
+
+    def get_by_telegram_id(self, telegram_id: int) -> dict | None:
+        # One critical section, so an invalidation can't land between lookups
+        with self._lock:
+            return self._get(self._ids_by_telegram.get(telegram_id))
+
+    def put(self, row: dict) -> None:
+        if self.ttl_s <= 0 or "id" not in row:
+            return
+        with self._lock:
+            if len(self._rows) >= self.max_size:
+                self._drop(next(iter(self._rows)))
+            self._rows[row["id"]] = (time.monotonic() + self.ttl_s, dict(row))
+            if row.get("telegram_id") is not None:
+                self._ids_by_telegram[row["telegram_id"]] = row["id"]
+
+    def invalidate(self, tenant_id: str | None = None, telegram_id: int | None = None) -> None:
+        with self._lock:
+            if telegram_id is not None:
+                tenant_id = tenant_id or self._ids_by_telegram.get(telegram_id)
+                self._ids_by_telegram.pop(telegram_id, None)
+            if tenant_id is not None:
+                self._drop(tenant_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._ids_by_telegram.clear()
+
+    def _get(self, tenant_id: str | None) -> dict | None:
+        entry = self._rows.get(tenant_id) if tenant_id is not None else None
+        if entry is None or entry[0] < time.monotonic():
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return dict(entry[1])
+
+    def _drop(self, tenant_id: str) -> None:
+        entry = self._rows.pop(tenant_id, None)
+        if entry is not None:
+            self._ids_by_telegram.pop(entry[1].get("telegram_id"), None)
+
+
+_cache = TenantCache()
+
+
+def get_tenant_cache() -> TenantCache:
+    return _cache
+
+
+def invalidate_tenant(tenant_id: str | None = None, telegram_id: int | None = None) -> None:
+    """Drop a tenant from the cache after writing to its row."""
+    _cache.invalidate(tenant_id, telegram_id)
+
+
 async def get_tenant(
     supabase: SupabaseClient,
     tenant_id: str,
 ) -> dict | None:
     """Return a single tenant by ID, or None if not found."""
-    result = supabase.table("tenants").select("*").eq("id", tenant_id).execute()
-    return result.data[0] if result.data else None
+    tenant = _cache.get(tenant_id)
+    if tenant is not None:
+        return tenant
+    result = await execute(supabase.table("tenants").select("*").eq("id", tenant_id))
+    if not result.data:
+        return None
+    _cache.put(result.data[0])
+    return result.data[0]
+
+
+async def get_tenant_by_telegram_id(
+    supabase: SupabaseClient,
+    telegram_id: int,
+) -> dict | None:
+    """Return the tenant linked to a Telegram account, or None."""
+    tenant = _cache.get_by_telegram_id(telegram_id)
+    if tenant is not None:
+        return tenant
+    result = await execute(supabase.table("tenants").select("*").eq("telegram_id", telegram_id))
+    if not result.data:
+        return None
+    _cache.put(result.data[0])
+    return result.data[0]
 
 
 async def update_tenant(
@@ -23,6 +129,7 @@ async def update_tenant(
     **updates,
 ) -> dict:
     """Update a tenant by ID."""
-    result = supabase.table("tenants").update(updates).eq("id", tenant_id).execute()
+    result = await execute(supabase.table("tenants").update(updates).eq("id", tenant_id))
+    invalidate_tenant(tenant_id)
     log.info("tenant.updated", tenant_id=tenant_id, fields=list(updates.keys()))
     return result.data[0]
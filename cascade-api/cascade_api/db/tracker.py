@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-
 import structlog
 from supabase import Client as SupabaseClient
 
+from cascade_api.db.client import execute
+
 log = structlog.get_logger()
 
 
@@ -16,23 +17,22 @@ async def log_entry(
     data: dict,
 ) -> dict:
     """Upsert a tracker_entries row (merge if same tenant+date exists)."""
-    existing = (
+    existing = await execute(
         supabase.table("tracker_entries")
         .select("*")
         .eq("tenant_id", tenant_id)
         .eq("date", date_str)
-        .execute()
     )
 
     if existing.data:
         # Merge: keep existing values, overwrite with new non-None values
         row_id = existing.data[0]["id"]
         merged = {k: v for k, v in data.items() if v is not None}
-        result = supabase.table("tracker_entries").update(merged).eq("id", row_id).execute()
+        result = await execute(supabase.table("tracker_entries").update(merged).eq("id", row_id))
         log.info("tracker_entry.updated", tenant_id=tenant_id, date=date_str)
     else:
         row = {"tenant_id": tenant_id, "date": date_str, **data}
-        result = supabase.table("tracker_entries").insert(row).execute()
+        result = await execute(supabase.table("tracker_entries").insert(row))
         log.info("tracker_entry.created", tenant_id=tenant_id, date=date_str)
 
     return result.data[0]
@@ -57,7 +57,7 @@ async def get_entries(
     if end_date:
         query = query.lte("date", end_date)
 
-    result = query.execute()
+    result = await execute(query)
     return result.data
 
 
@@ -67,8 +67,21 @@ async def get_weekly_velocity(
     weeks: int = 4,
 ) -> list[dict]:
     """Call the get_weekly_velocity() Postgres function."""
-    result = supabase.rpc(
-        "get_weekly_velocity",
-        {"p_tenant_id": tenant_id, "p_weeks": weeks},
-    ).execute()
+    result = await execute(
+        supabase.rpc(
+            "get_weekly_velocity",
+            {"p_tenant_id": tenant_id, "p_weeks": weeks},
+        )
+    )
     return result.data
+
+
+async def backfill_weekly_velocity(
+    supabase: SupabaseClient,
+    tenant_id: str,
+) -> int:
+    """Rebuild a tenant's weekly_velocity rollup from tasks. Returns weeks written."""
+    result = await execute(
+        supabase.rpc("backfill_weekly_velocity", {"p_tenant_id": tenant_id}),
+    )
+    return result.data or 0
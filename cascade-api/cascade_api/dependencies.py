@@ -15,9 +15,10 @@ def get_supabase() -> SupabaseClient:
 
 
 def get_anthropic(api_key: str | None = None) -> anthropic.AsyncAnthropic:
-    """Anthropic client — BYOK per-request or fallback to server key."""
-    key = api_key or settings.anthropic_api_key
-    return anthropic.AsyncAnthropic(api_key=key)
+    """Pooled Anthropic client — BYOK per-request or fallback to server key."""
+    from cascade_api.llm.gateway import get_client
+
+    return get_client(api_key)
 
 
 @lru_cache
@@ -26,11 +27,34 @@ def get_memory_client():
     from cascade_api.memory import MemoryClient
     from cascade_api.memory.stores.supabase import SupabaseStore
     from cascade_api.memory.embedders.gemini import GeminiEmbedder
+    from cascade_api.memory.embedders.batching import BatchingEmbedder
+    from cascade_api.memory.embedders.cached import CachedEmbedder, SupabaseEmbeddingCache
     from cascade_api.memory.extractors.anthropic import AnthropicExtractor
+    from cascade_api.llm.gateway import GatewayClient
+    from cascade_api.observability.usage_ledger import current_tenant, record_embedding_call
 
-    store = SupabaseStore(get_supabase())
-    embedder = GeminiEmbedder(api_key=settings.gemini_api_key)
-    extractor = AnthropicExtractor(client=get_anthropic())
+    store = SupabaseStore(get_supabase(), search_oversample=settings.memory_search_oversample)
+    embedder = GeminiEmbedder(
+        api_key=settings.gemini_api_key,
+        output_dimensionality=settings.memory_embedding_dimensions,
+    )
+    # Cache first, so only misses wait for a batch. Batches mix tenants, so
+    # usage is recorded by the batcher rather than by GeminiEmbedder.
+    embedder = BatchingEmbedder(
+        embedder,
+        window_s=settings.embedding_batch_window_s,
+        max_batch_size=settings.embedding_batch_max,
+        max_in_flight=settings.embedding_batch_in_flight,
+        usage_hook=record_embedding_call,
+        tenant_of=current_tenant,
+    )
+    if settings.embedding_cache_size > 0:
+        embedder = CachedEmbedder(
+            embedder,
+            max_entries=settings.embedding_cache_size,
+            store=SupabaseEmbeddingCache(get_supabase()),
+        )
+    extractor = AnthropicExtractor(client=GatewayClient(call_site="memory.extract"))
     return MemoryClient(
         store=store,
         embedder=embedder,
@@ -46,7 +46,9 @@ async def analyze_impact(state: ReverseCascadeState) -> dict:
         changes_context,
     )
 
-    raw = await ask(ANALYZE_IMPACT_SYSTEM, prompt, state["api_key"])
+    raw = await ask(
+        ANALYZE_IMPACT_SYSTEM, prompt, state["api_key"], call_site="graph.analyze_impact"
+    )
 
     json_match = re.search(r"\{[\s\S]*\}", raw)
     if not json_match:
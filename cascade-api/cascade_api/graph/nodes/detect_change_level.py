@@ -26,7 +26,7 @@ async def detect_change_level(state: ReverseCascadeState) -> dict:
     cascade_files = read_cascade_files(data_dir)
 
     prompt = build_detect_level_prompt(user_request, cascade_files)
-    raw = await ask(DETECT_LEVEL_SYSTEM, prompt, api_key)
+    raw = await ask(DETECT_LEVEL_SYSTEM, prompt, api_key, call_site="graph.detect_change_level")
 
     # Parse JSON response from Claude
     json_match = re.search(r"\{[\s\S]*\}", raw)
@@ -0,0 +1,13 @@
+"""Durable background jobs on a Postgres table.
+
+    from cascade_api.jobs import enqueue
+    await enqueue("memory.extract", {"tenant_id": ..., "transcript": ...})
+
+Run workers in the API process (``job_worker_enabled``) or standalone with
+``python -m cascade_api.jobs``.
+"""
+
+from cascade_api.jobs import handlers as _handlers  # noqa: F401  (registers handlers)
+from cascade_api.jobs.queue import JobWorker, enqueue, get_handler, job_handler
+
+__all__ = ["JobWorker", "enqueue", "get_handler", "job_handler"]
@@ -0,0 +1,32 @@
+"""Standalone job worker: ``python -m cascade_api.jobs``."""
+
+from __future__ import annotations
+
+import asyncio
+import signal
+
+import structlog
+
+from cascade_api.jobs import JobWorker
+from cascade_api.observability.langfuse_client import flush_langfuse
+from cascade_api.observability.usage_ledger import get_usage_ledger
+
+log = structlog.get_logger()
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    worker = JobWorker()
+    worker.start()
+    await stop.wait()
+    await worker.stop()
+    await get_usage_ledger().flush()
+    flush_langfuse()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
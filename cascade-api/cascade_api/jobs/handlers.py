@@ -0,0 +1,64 @@
+"""Job handlers. Importing this module registers them with the queue."""
+
+from __future__ import annotations
+
+import structlog
+
+from cascade_api.config import settings
+from cascade_api.db.client import execute
+from cascade_api.jobs.queue import job_handler
+from cascade_api.observability.usage_ledger import bind_tenant
+
+log = structlog.get_logger()
+
+
+@job_handler("scheduled.daily_fanout", priority=10, timeout_s=840, max_attempts=2)
+async def daily_fanout(payload: dict) -> None:
+    """Send due morning messages. Delivery claims make a retry safe."""
+    from cascade_api.telegram.bot import create_bot
+    from cascade_api.telegram.scheduler import send_daily_messages
+
+    result = await send_daily_messages(create_bot().bot)
+    log.info("jobs.daily_fanout", **result)
+
+
+@job_handler("memory.extract", timeout_s=120)
+async def memory_extract(payload: dict) -> None:
+    from cascade_api.dependencies import get_memory_client
+
+    with bind_tenant(payload["tenant_id"]):
+        scoped = get_memory_client().for_tenant(payload["tenant_id"])
+        await scoped.extract(payload["transcript"], source_id=payload.get("source_id"))
+
+
+@job_handler("evals.score", priority=-10, timeout_s=120, max_attempts=3)
+async def evals_score(payload: dict) -> None:
+    from cascade_api.observability.evals import score_trace
+
+    # Judge calls use the server key; tenant keys are never written to the queue
+    with bind_tenant(payload.pop("tenant_id", None)):
+        await score_trace(api_key=settings.anthropic_api_key, **payload)
+
+
+@job_handler("memory.decay", priority=-5, timeout_s=600, max_attempts=3)
+async def memory_decay(payload: dict) -> None:
+    from cascade_api.dependencies import get_memory_client
+
+    updated = await get_memory_client().run_decay()
+    log.info("jobs.memory_decay", updated=updated)
+
+
+@job_handler("jobs.purge", priority=-20, timeout_s=300, max_attempts=1)
+async def purge_jobs(payload: dict) -> None:
+    from cascade_api.dependencies import get_supabase
+
+    supabase = get_supabase()
+    result = await execute(supabase.rpc("purge_finished_jobs", {}))
+    updates = await execute(supabase.rpc("purge_telegram_updates", {}))
+    embeddings = await execute(supabase.rpc("purge_embedding_cache", {}))
+    log.info(
+        "jobs.purged",
+        deleted=result.data,
+        telegram_updates=updates.data,
+        embedding_cache=embeddings.data,
+    )
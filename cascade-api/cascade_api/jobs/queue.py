@@ -0,0 +1,261 @@
+"""Postgres-backed job queue: handler registry, enqueue, and the worker.
+
+Jobs live in the ``jobs`` table (migration 016). Workers claim batches with
+``claim_jobs`` (``FOR UPDATE SKIP LOCKED``), so several workers — in the API
+process or standalone — never run the same job twice at once. A job that
+fails is retried with exponential backoff until ``max_attempts``; a worker
+that dies mid-job loses its lease and the job is picked up again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import socket
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import structlog
+
+from cascade_api.config import settings
+from cascade_api.db.client import execute
+
+log = structlog.get_logger()
+
+RETRY_BASE_S = 10.0
+RETRY_MAX_S = 3600.0
+LEASE_GRACE_S = 30  # added to a job's timeout to form its lease
+
+JobFunc = Callable[[dict], Awaitable[object]]
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    kind: str
+    func: JobFunc
+    priority: int = 0
+    timeout_s: int = 60
+    max_attempts: int = 5
+
+
+_HANDLERS: dict[str, JobSpec] = {}
+
+
+def job_handler(
+    kind: str,
+    *,
+    priority: int = 0,
+    timeout_s: int = 60,
+    max_attempts: int = 5,
+) -> Callable[[JobFunc], JobFunc]:
+    """Register ``func(payload)`` as the handler for ``kind`` jobs."""
+
+    def register(func: JobFunc) -> JobFunc:
+        _HANDLERS[kind] = JobSpec(kind, func, priority, timeout_s, max_attempts)
+        return func
+
+    return register
+
+
+def get_handler(kind: str) -> JobSpec | None:
+    return _HANDLERS.get(kind)
+
+
+def _supabase():
+    from cascade_api.dependencies import get_supabase
+
+    return get_supabase()
+
+
+async def enqueue(
+    kind: str,
+    payload: dict | None = None,
+    *,
+    dedupe_key: str | None = None,
+    delay_s: float = 0,
+    supabase=None,
+) -> int | None:
+    """Queue a job. Returns its id, or None if ``dedupe_key`` was already used."""
+    spec = _HANDLERS.get(kind)
+    if spec is None:
+        raise ValueError(f"No job handler registered for {kind!r}")
+
+    row = {
+        "kind": kind,
+        "payload": payload or {},
+        "priority": spec.priority,
+        "timeout_s": spec.timeout_s,
+        "max_attempts": spec.max_attempts,
+        "run_at": (datetime.now(timezone.utc) + timedelta(seconds=delay_s)).isoformat(),
+    }
+    table = (supabase or _supabase()).table("jobs")
+    if dedupe_key is None:
+        query = table.insert(row)
+    else:
+        query = table.upsert(
+            {**row, "dedupe_key": dedupe_key}, on_conflict="dedupe_key", ignore_duplicates=True
+        )
+    result = await execute(query)
+    job_id = result.data[0]["id"] if result.data else None
+    log.debug("jobs.enqueued", kind=kind, job_id=job_id, deduped=job_id is None)
+    return job_id
+
+
+def retry_delay_s(attempts: int) -> float:
+    """Exponential backoff with ±20% jitter so retries don't stampede."""
+    base = min(RETRY_BASE_S * 2 ** max(attempts - 1, 0), RETRY_MAX_S)
+    return base * random.uniform(0.8, 1.2)
+
+
+class JobWorker:
+    """Claims and runs jobs with bounded concurrency.
+
+    ``start()``/``stop()`` run it as a background task (e.g. in the API
+    lifespan); ``run_once()`` claims and runs a single batch.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int | None = None,
+        poll_interval_s: float | None = None,
+        worker_id: str | None = None,
+        supabase_factory: Callable | None = None,
+    ):
+        self.concurrency = concurrency or settings.job_worker_concurrency
+        self.poll_interval_s = poll_interval_s or settings.job_poll_interval_s
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._supabase_factory = supabase_factory or _supabase
+        self._running: set[asyncio.Task] = set()
+        self._loop_task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+        self.stats = {"done": 0, "retried": 0, "dead": 0}
+
+    # ── Lifecycle ────────────────────────────────────────
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._loop_task = asyncio.create_task(self.run(), name="job_worker")
+        log.info("jobs.worker_started", worker_id=self.worker_id, concurrency=self.concurrency)
+
+    async def stop(self, grace_s: float = 10.0) -> None:
+        """Stop claiming, give running jobs ``grace_s`` to finish, cancel the rest.
+
+        Cancelled jobs keep their lease and are retried once it lapses.
+        """
+        self._stopping.set()
+        if self._loop_task is not None:
+            await self._loop_task
+            self._loop_task = None
+        if self._running:
+            _, pending = await asyncio.wait(self._running, timeout=grace_s)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        log.info("jobs.worker_stopped", worker_id=self.worker_id, **self.stats)
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once(wait=False)
+            except Exception as e:
+                log.warning("jobs.claim_failed", error=str(e))
+                claimed = 0
+
+            if claimed and len(self._running) < self.concurrency:
+                continue  # more work may be ready
+            if self._running and len(self._running) >= self.concurrency:
+                await asyncio.wait(
+                    self._running, timeout=self.poll_interval_s, return_when="FIRST_COMPLETED"
+                )
+            else:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval_s)
+                except TimeoutError:
+                    pass
+
+    async def run_once(self, wait: bool = True) -> int:
+        """Claim up to the free slots and start them. Returns jobs claimed."""
+        slots = self.concurrency - len(self._running)
+        if slots <= 0:
+            return 0
+        result = await execute(
+            self._supabase_factory().rpc(
+                "claim_jobs",
+                {"p_worker": self.worker_id, "p_limit": slots, "p_grace_seconds": LEASE_GRACE_S},
+            )
+        )
+        jobs = result.data or []
+        for job in jobs:
+            task = asyncio.create_task(self._run_job(job), name=f"job_{job['kind']}_{job['id']}")
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        if wait and self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        return len(jobs)
+
+    # ── Execution ────────────────────────────────────────
+
+    async def _run_job(self, job: dict) -> None:
+        spec = _HANDLERS.get(job["kind"])
+        if spec is None:
+            await self._finish(job, "dead", error=f"no handler for {job['kind']!r}")
+            return
+
+        start = asyncio.get_running_loop().time()
+        try:
+            await asyncio.wait_for(spec.func(job.get("payload") or {}), timeout=job["timeout_s"])
+        except asyncio.CancelledError:
+            raise  # worker shutdown; the lease lapses and the job is retried
+        except Exception as e:
+            error = "timed out" if isinstance(e, TimeoutError) else str(e) or type(e).__name__
+            if job["attempts"] >= job["max_attempts"]:
+                log.error("jobs.dead", kind=job["kind"], job_id=job["id"], error=error)
+                await self._finish(job, "dead", error=error)
+            else:
+                delay = retry_delay_s(job["attempts"])
+                log.warning(
+                    "jobs.retry",
+                    kind=job["kind"],
+                    job_id=job["id"],
+                    attempt=job["attempts"],
+                    retry_in_s=round(delay),
+                    error=error,
+                )
+                await self._finish(job, "queued", error=error, delay_s=delay)
+            return
+
+        await self._finish(job, "done")
+        log.info(
+            "jobs.done",
+            kind=job["kind"],
+            job_id=job["id"],
+            duration_ms=round((asyncio.get_running_loop().time() - start) * 1000),
+        )
+
+    async def _finish(
+        self, job: dict, status: str, error: str | None = None, delay_s: float = 0
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        update: dict = {"status": status, "locked_by": None, "locked_until": None}
+        if error is not None:
+            update["last_error"] = error[:1000]
+        if status == "queued":
+            update["run_at"] = (now + timedelta(seconds=delay_s)).isoformat()
+            self.stats["retried"] += 1
+        else:
+            update["finished_at"] = now.isoformat()
+            self.stats[status] += 1
+        try:
+            # Only if we still hold the lease; otherwise another worker owns it
+            await execute(
+                self._supabase_factory()
+                .table("jobs")
+                .update(update)
+                .eq("id", job["id"])
+                .eq("locked_by", self.worker_id)
+            )
+        except Exception as e:
+            log.warning("jobs.finish_failed", job_id=job["id"], status=status, error=str(e))
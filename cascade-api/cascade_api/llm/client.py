@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import anthropic
+from cascade_api.llm.gateway import create_message
 
 
 async def ask(
@@ -11,9 +11,12 @@ async def ask(
     api_key: str,
     user_id: str | None = None,
     context: str | None = None,
+    call_site: str = "llm.ask",
 ) -> str:
-    client = anthropic.AsyncAnthropic(api_key=api_key)
-    response = await client.messages.create(
+    response = await create_message(
+        call_site=call_site,
+        api_key=api_key,
+        tenant_id=user_id,
         model="claude-sonnet-4-20250514",
         max_tokens=4096,
         system=system_prompt,
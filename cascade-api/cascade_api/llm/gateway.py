@@ -0,0 +1,239 @@
+"""LLM gateway — pooled Anthropic clients and the single entry point for model calls.
+
+Every ``anthropic.AsyncAnthropic`` owns an httpx connection pool, so building
+one per call pays a TLS handshake on every turn. The gateway keeps one client
+per API key (LRU-bounded, since BYOK keys are unbounded), configures timeouts
+and retries in one place, and records per-model latency and prompt-cache
+token usage. Every call is also written to the usage ledger.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import anthropic
+import structlog
+
+from cascade_api.config import settings
+from cascade_api.observability.metrics import HistogramFamily
+from cascade_api.observability.usage_ledger import record_llm_call
+
+log = structlog.get_logger()
+
+_clients: OrderedDict[str, anthropic.AsyncAnthropic] = OrderedDict()
+_fresh_clients: set[int] = set()  # ids of clients that have not made a request yet
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+_latency = HistogramFamily()
+_new_client_latency = HistogramFamily()
+_USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+_usage: dict[str, dict[str, int]] = {}  # model -> token totals
+
+
+def get_client(api_key: str | None = None) -> anthropic.AsyncAnthropic:
+    """Pooled Anthropic client for ``api_key`` (falls back to the server key)."""
+    key = api_key or settings.anthropic_api_key
+    with _lock:
+        client = _clients.get(key)
+        if client is not None:
+            _clients.move_to_end(key)
+            _stats["hits"] += 1
+            return client
+
+        _stats["misses"] += 1
+        client = anthropic.AsyncAnthropic(
+            api_key=key,
+            timeout=anthropic.Timeout(settings.anthropic_timeout_s, connect=5.0),
+            max_retries=settings.anthropic_max_retries,
+        )
+        _clients[key] = client
+        _fresh_clients.add(id(client))
+        # Evicted clients are not closed: a request may still be using the
+        # pool. The pool is released once the last reference goes away.
+        while len(_clients) > settings.anthropic_client_cache_size:
+            _, evicted = _clients.popitem(last=False)
+            _fresh_clients.discard(id(evicted))
+            _stats["evictions"] += 1
+        return client
+
+
+async def create_message(
+    *,
+    call_site: str,
+    api_key: str | None = None,
+    tenant_id: str | None = None,
+    round_num: int | None = None,
+    **kwargs,
+) -> anthropic.types.Message:
+    """``messages.create`` through the pooled client for ``api_key``.
+
+    ``call_site`` names the caller (e.g. ``"agent.loop"``) for logs, metrics
+    and the usage ledger; ``tenant_id`` defaults to the tenant bound with
+    ``usage_ledger.bind_tenant``. All other keyword arguments go to the
+    Anthropic SDK unchanged.
+    """
+    client = get_client(api_key)
+    new_client = _claim_fresh(client)
+    start = time.perf_counter()
+    response = None
+    try:
+        response = await client.messages.create(**kwargs)
+        return response
+    finally:
+        _observe(kwargs, call_site, start, response, new_client, tenant_id, round_num)
+
+
+@asynccontextmanager
+async def stream_message(
+    *,
+    call_site: str,
+    api_key: str | None = None,
+    tenant_id: str | None = None,
+    round_num: int | None = None,
+    **kwargs,
+) -> AsyncIterator[anthropic.AsyncMessageStream]:
+    """``messages.stream`` through the pooled client; latency covers the full stream."""
+    client = get_client(api_key)
+    new_client = _claim_fresh(client)
+    start = time.perf_counter()
+    final = None
+    try:
+        async with client.messages.stream(**kwargs) as stream:
+            yield stream
+            final = await stream.get_final_message()
+    finally:
+        _observe(kwargs, call_site, start, final, new_client, tenant_id, round_num)
+
+
+class GatewayClient:
+    """Minimal ``AsyncAnthropic`` stand-in that routes through the gateway.
+
+    For components that take a client object (e.g. the memory extractor) so
+    they get pooling and metrics without depending on this module.
+    """
+
+    def __init__(self, call_site: str, api_key: str | None = None):
+        self.messages = _GatewayMessages(call_site, api_key)
+
+
+class _GatewayMessages:
+    def __init__(self, call_site: str, api_key: str | None):
+        self._call_site = call_site
+        self._api_key = api_key
+
+    async def create(self, **kwargs) -> anthropic.types.Message:
+        return await create_message(call_site=self._call_site, api_key=self._api_key, **kwargs)
+
+
+def latency_snapshot() -> dict:
+    """Per-model latency histograms, prompt-cache usage and client-cache counters."""
+    return {
+        "latency_by_model": _latency.snapshot(),
+        "new_client_latency_by_model": _new_client_latency.snapshot(),
+        "prompt_cache_by_model": {
+            model: {**totals, "hit_rate": _cache_hit_rate(totals)}
+            for model, totals in sorted(_usage.items())
+        },
+        "client_cache": {**_stats, "size": len(_clients)},
+    }
+
+
+def reset() -> None:
+    """Drop cached clients and metrics (tests)."""
+    with _lock:
+        _clients.clear()
+        _fresh_clients.clear()
+        for k in _stats:
+            _stats[k] = 0
+        _usage.clear()
+    _latency.clear()
+    _new_client_latency.clear()
+
+
+def _claim_fresh(client) -> bool:
+    """True exactly once per client: its first request opens the connection."""
+    with _lock:
+        if id(client) in _fresh_clients:
+            _fresh_clients.discard(id(client))
+            return True
+        return False
+
+
+def _usage_counts(response) -> dict[str, int]:
+    usage = getattr(response, "usage", None)
+    counts = {}
+    for field in _USAGE_FIELDS:
+        value = getattr(usage, field, None)
+        counts[field] = value if isinstance(value, int) else 0
+    return counts
+
+
+def _record_usage(model: str, counts: dict[str, int]) -> None:
+    with _lock:
+        totals = _usage.setdefault(model, dict.fromkeys(_USAGE_FIELDS, 0))
+        for field, value in counts.items():
+            totals[field] += value
+
+
+def _cache_hit_rate(totals: dict[str, int]) -> float | None:
+    """Share of prompt tokens served from the cache."""
+    prompt = (
+        totals["input_tokens"]
+        + totals["cache_creation_input_tokens"]
+        + totals["cache_read_input_tokens"]
+    )
+    return round(totals["cache_read_input_tokens"] / prompt, 3) if prompt else None
+
+
+def _observe(
+    request: dict,
+    call_site: str,
+    start: float,
+    response,
+    new_client: bool,
+    tenant_id: str | None,
+    round_num: int | None,
+) -> None:
+    """Record latency, prompt-cache usage and a ledger row for one call."""
+    latency_ms = (time.perf_counter() - start) * 1000
+    model = request.get("model", "unknown")
+    ok = response is not None
+    counts = _usage_counts(response)
+
+    _latency.labels(model).observe(latency_ms)
+    if new_client:
+        _new_client_latency.labels(model).observe(latency_ms)
+    if ok:
+        _record_usage(model, counts)
+
+    stop_reason = getattr(response, "stop_reason", None)
+    record_llm_call(
+        provider="anthropic",
+        model=model,
+        call_site=call_site,
+        latency_ms=latency_ms,
+        ok=ok,
+        tenant_id=tenant_id,
+        round_num=round_num,
+        stop_reason=stop_reason if isinstance(stop_reason, str) else None,
+        **counts,
+    )
+    log.debug(
+        "llm.call",
+        model=model,
+        call_site=call_site,
+        latency_ms=round(latency_ms, 1),
+        ok=ok,
+        new_client=new_client,
+        **counts,
+    )
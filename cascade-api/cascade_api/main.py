@@ -12,6 +12,7 @@ from cascade_api.api.router import api_router
 from cascade_api.telegram.bot import create_bot
 from cascade_api.observability.posthog_client import get_posthog
 from cascade_api.observability.langfuse_client import flush_langfuse
+from cascade_api.observability.usage_ledger import get_usage_ledger
 
 if settings.sentry_dsn:
     sentry_sdk.init(
@@ -37,6 +38,13 @@ log = structlog.get_logger()
 
 @asynccontextmanager
 async def lifespan(app):
+    if settings.supabase_url:
+        from cascade_api.dependencies import get_memory_client
+
+        # Fails startup on DimensionMismatchError: every memory write would
+        # be rejected by the database otherwise
+        await get_memory_client().initialize()
+
     bot_app = None
     try:
         bot_app = create_bot()
@@ -62,8 +70,29 @@ async def lifespan(app):
         log.error("telegram.startup_failed", error=str(e))
         bot_app = None
     app.state.bot_app = bot_app
+
+    update_queue = None
+    if bot_app:
+        from cascade_api.telegram.update_queue import UpdateQueue
+
+        update_queue = UpdateQueue(bot_app.process_update)
+        update_queue.start()
+    app.state.update_queue = update_queue
+
+    job_worker = None
+    if settings.job_worker_enabled and settings.supabase_url:
+        from cascade_api.jobs import JobWorker
+
+        job_worker = JobWorker()
+        job_worker.start()
+
     log.info("app.started")
     yield
+    if update_queue:
+        await update_queue.stop()
+    if job_worker:
+        await job_worker.stop()
+    await get_usage_ledger().flush()
     flush_langfuse()
     ph = get_posthog()
     if ph:
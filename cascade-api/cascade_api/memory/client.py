@@ -35,6 +35,10 @@ class MemoryClient:
         return TenantScopedClient(self, tenant_id)
 
     async def initialize(self) -> None:
+        """Check the store can hold this embedder's vectors.
+
+        Raises DimensionMismatchError if the widths differ.
+        """
         await self.store.initialize(self.embedder.dimensions)
 
     async def save(
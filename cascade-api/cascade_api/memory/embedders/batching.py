@@ -0,0 +1,180 @@
+"""BatchingEmbedder — coalesce concurrent ``embed()`` calls into batch requests.
+
+Under load many tenants recall and save at once, and each ``embed()`` is
+its own single-text API request. ``BatchingEmbedder`` holds calls for a
+few milliseconds (or until ``max_batch_size`` are waiting), sends them as
+one ``embed_batch`` and resolves each caller with its own vector. Small
+``embed_batch`` calls are coalesced the same way.
+
+At most ``max_in_flight`` batches are outstanding. When the API is slow,
+calls keep collecting behind them and go out as one larger batch rather
+than queueing as many small requests.
+
+A batch mixes texts from several tenants, so usage is reported here, per
+tenant, rather than by the wrapped embedder.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from cascade_api.memory.protocols.embedder import Embedder
+
+DEFAULT_WINDOW_S = 0.005
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_MAX_IN_FLIGHT = 4  # GeminiEmbedder's default max_concurrency
+
+
+class BatchingEmbedder:
+    def __init__(
+        self,
+        embedder: Embedder,
+        *,
+        window_s: float = DEFAULT_WINDOW_S,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        usage_hook: Callable[..., None] | None = None,
+        tenant_of: Callable[[], str | None] | None = None,
+    ):
+        """
+        Args:
+            embedder: The embedder whose ``embed_batch`` receives the batches.
+            window_s: How long the first call of a batch waits for company.
+                0 disables batching.
+            max_batch_size: A batch is sent as soon as this many calls wait.
+            max_in_flight: Batches outstanding at once; further calls wait
+                for one to finish.
+            usage_hook: Optional callback invoked after each request, once
+                per tenant in it, with ``tenant_id``, ``model``, ``chars``,
+                ``latency_ms`` and ``ok`` keyword arguments.
+            tenant_of: Returns the calling tenant; read when a call is made.
+        """
+        self._embedder = embedder
+        self._window_s = window_s
+        self._max_batch_size = max_batch_size
+        self._max_in_flight = max_in_flight
+        self._usage_hook = usage_hook
+        self._tenant_of = tenant_of
+        self._in_flight = 0
+        self._pending: list[tuple[str, asyncio.Future, str | None]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.stats = {"texts": 0, "batches": 0}
+
+    @property
+    def model(self) -> str:
+        return getattr(self._embedder, "model", type(self._embedder).__name__)
+
+    @property
+    def dimensions(self) -> int:
+        return self._embedder.dimensions
+
+    async def embed(self, text: str) -> list[float]:
+        if self._window_s <= 0:
+            return (await self._embed_direct([text]))[0]
+        return await self._enqueue(text)
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Small batches are coalesced like ``embed`` calls; full ones go straight through.
+
+        Wrappers such as ``CachedEmbedder`` embed their misses with
+        ``embed_batch``, often a single text.
+        """
+        if self._window_s <= 0 or len(texts) >= self._max_batch_size:
+            return await self._embed_direct(texts)
+        return list(await asyncio.gather(*(self._enqueue(t) for t in texts)))
+
+    def snapshot(self) -> dict:
+        batches = self.stats["batches"]
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "in_flight": self._in_flight,
+            "avg_batch_size": round(self.stats["texts"] / batches, 2) if batches else None,
+        }
+
+    def _enqueue(self, text: str) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future, self._tenant()))
+        self.stats["texts"] += 1
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window_s, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # When saturated, pending calls go out as soon as a batch finishes
+        while self._pending and self._in_flight < self._max_in_flight:
+            batch = self._pending[: self._max_batch_size]
+            self._pending = self._pending[self._max_batch_size :]
+            self._in_flight += 1
+            self.stats["batches"] += 1
+            task = asyncio.create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _embed_direct(self, texts: list[str]) -> list[list[float]]:
+        return await self._embed_for(texts, [self._tenant()] * len(texts))
+
+    async def _send(self, batch: list[tuple[str, asyncio.Future, str | None]]) -> None:
+        owners: dict[str, str | None] = {}
+        for text, _, tenant_id in batch:
+            owners.setdefault(text, tenant_id)  # same text, one slot, first caller pays
+        try:
+            vectors = await self._embed_for(list(owners), list(owners.values()))
+            by_text = dict(zip(owners, vectors, strict=True))
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for text, future, _ in batch:
+                if not future.done():  # caller may have been cancelled
+                    future.set_result(list(by_text[text]))
+        finally:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.cancel()
+            self._in_flight -= 1
+            if self._pending:
+                self._flush()
+
+    async def _embed_for(self, texts: list[str], tenants: list[str | None]) -> list[list[float]]:
+        """Embed ``texts`` and report usage to the tenant each text came from."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            vectors = await self._embedder.embed_batch(texts)
+            ok = True
+            return vectors
+        finally:
+            self._report(texts, tenants, start, ok)
+
+    def _tenant(self) -> str | None:
+        return self._tenant_of() if self._tenant_of is not None else None
+
+    def _report(self, texts: list[str], tenants: list[str | None], start: float, ok: bool) -> None:
+        if self._usage_hook is None:
+            return
+        chars: dict[str | None, int] = {}
+        for text, tenant_id in zip(texts, tenants, strict=True):
+            chars[tenant_id] = chars.get(tenant_id, 0) + len(text)
+        latency_ms = (time.perf_counter() - start) * 1000
+        for tenant_id, count in chars.items():
+            try:
+                self._usage_hook(
+                    tenant_id=tenant_id,
+                    model=self.model,
+                    chars=count,
+                    latency_ms=latency_ms,
+                    ok=ok,
+                )
+            except Exception:
+                pass  # usage reporting must never break embedding
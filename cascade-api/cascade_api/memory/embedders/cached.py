@@ -0,0 +1,157 @@
+"""CachedEmbedder — content-addressed embedding cache in front of any Embedder.
+
+Recall embeds the raw query on every call and users repeat the same
+queries ("outreach progress", "energy patterns"); updates re-embed
+unchanged content. Vectors are keyed by sha256 of (model, dimensions,
+normalized text), so a cache shared between embedders or surviving a
+model or width change never serves a vector of the wrong kind.
+
+Two tiers: an in-process LRU, then an optional persistent store (see
+``SupabaseEmbeddingCache``) shared by every replica and restart.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import unicodedata
+from collections import OrderedDict
+
+from cascade_api.memory.protocols.embedder import Embedder, EmbeddingCacheStore
+
+log = logging.getLogger("cascade_memory.embedders.cached")
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+def normalize_text(text: str) -> str:
+    """Unicode NFC with whitespace runs collapsed; case is kept."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(model: str, dimensions: int, text: str) -> str:
+    payload = f"{model}\x00{dimensions}\x00{normalize_text(text)}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CachedEmbedder:
+    def __init__(
+        self,
+        embedder: Embedder,
+        *,
+        model: str | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        store: EmbeddingCacheStore | None = None,
+    ):
+        """
+        Args:
+            embedder: The embedder to call on a miss.
+            model: Part of the cache key; defaults to ``embedder.model``.
+            max_entries: In-process LRU size.
+            store: Optional persistent tier. Read or write failures are
+                logged and treated as misses.
+        """
+        self._embedder = embedder
+        self.model = model or getattr(embedder, "model", type(embedder).__name__)
+        self._max_entries = max_entries
+        self._store = store
+        self._lru: OrderedDict[str, list[float]] = OrderedDict()
+        self.stats = {"hits": 0, "store_hits": 0, "misses": 0, "store_errors": 0}
+
+    @property
+    def dimensions(self) -> int:
+        return self._embedder.dimensions
+
+    async def embed(self, text: str) -> list[float]:
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        keys = [cache_key(self.model, self.dimensions, t) for t in texts]
+        found: dict[str, list[float]] = {}
+        for key in keys:
+            vector = self._lru_get(key)
+            if vector is not None:
+                found[key] = vector
+        self.stats["hits"] += sum(key in found for key in keys)
+
+        # Identical texts in one batch are looked up and embedded once
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        if missing and self._store is not None:
+            stored = await self._store_get(list(missing))
+            self.stats["store_hits"] += sum(key in stored for key in keys)
+            for key, vector in stored.items():
+                del missing[key]
+                self._lru_put(key, vector)
+                found[key] = vector
+
+        if missing:
+            self.stats["misses"] += sum(key in missing for key in keys)
+            vectors = await self._embedder.embed_batch(list(missing.values()))
+            fresh = dict(zip(missing, vectors, strict=True))
+            for key, vector in fresh.items():
+                self._lru_put(key, vector)
+            found.update(fresh)
+            if self._store is not None:
+                await self._store_put(fresh)
+
+        return [list(found[key]) for key in keys]
+
+    def snapshot(self) -> dict:
+        return {**self.stats, "entries": len(self._lru), "max_entries": self._max_entries}
+
+    def _lru_get(self, key: str) -> list[float] | None:
+        vector = self._lru.get(key)
+        if vector is not None:
+            self._lru.move_to_end(key)
+        return vector
+
+    def _lru_put(self, key: str, vector: list[float]) -> None:
+        self._lru[key] = vector
+        self._lru.move_to_end(key)
+        if len(self._lru) > self._max_entries:
+            self._lru.popitem(last=False)
+
+    async def _store_get(self, keys: list[str]) -> dict[str, list[float]]:
+        try:
+            return await self._store.get_many(keys)
+        except Exception as e:
+            self.stats["store_errors"] += 1
+            log.warning("Embedding cache read failed: %s", e)
+            return {}
+
+    async def _store_put(self, vectors: dict[str, list[float]]) -> None:
+        try:
+            await self._store.put_many(self.model, self.dimensions, vectors)
+        except Exception as e:
+            self.stats["store_errors"] += 1
+            log.warning("Embedding cache write failed: %s", e)
+
+
+class SupabaseEmbeddingCache:
+    """Persistent tier backed by the ``embedding_cache`` table.
+
+    Requires the migration that creates ``embedding_cache``.
+    """
+
+    def __init__(self, client):
+        self._sb = client
+
+    async def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        result = await asyncio.to_thread(
+            self._sb.table("embedding_cache").select("key, embedding").in_("key", keys).execute
+        )
+        return {row["key"]: row["embedding"] for row in result.data}
+
+    async def put_many(self, model: str, dimensions: int, vectors: dict[str, list[float]]) -> None:
+        rows = [
+            {"key": key, "model": model, "dimensions": dimensions, "embedding": vector}
+            for key, vector in vectors.items()
+        ]
+        await asyncio.to_thread(
+            self._sb.table("embedding_cache")
+            .upsert(rows, on_conflict="key", ignore_duplicates=True)
+            .execute
+        )
@@ -0,0 +1,30 @@
+"""Split embedding batches to fit provider request limits."""
+
+from __future__ import annotations
+
+MAX_BATCH_ITEMS = 100  # Gemini batchEmbedContents limit
+MAX_BATCH_CHARS = 80_000  # ~20k tokens at ~4 chars/token
+
+
+def chunk_texts(
+    texts: list[str],
+    max_items: int = MAX_BATCH_ITEMS,
+    max_chars: int = MAX_BATCH_CHARS,
+) -> list[list[str]]:
+    """Consecutive chunks of ``texts``, each within both limits.
+
+    Order is preserved. A single text longer than ``max_chars`` gets a
+    chunk of its own (the provider truncates it).
+    """
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    chars = 0
+    for text in texts:
+        if current and (len(current) >= max_items or chars + len(text) > max_chars):
+            chunks.append(current)
+            current, chars = [], 0
+        current.append(text)
+        chars += len(text)
+    if current:
+        chunks.append(current)
+    return chunks
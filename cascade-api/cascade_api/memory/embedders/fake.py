@@ -4,16 +4,48 @@ from __future__ import annotations
 
 import hashlib
 
+from cascade_api.memory.embedders.chunking import MAX_BATCH_CHARS, MAX_BATCH_ITEMS, chunk_texts
+
 
 class FakeEmbedder:
-    def __init__(self, dimensions: int = 768):
+    """Batches like ``GeminiEmbedder``: ``embed`` is a one-item batch and
+    ``embed_batch`` is split into requests with the same limits.
+    ``requests`` records each simulated request's texts.
+    """
+
+    def __init__(
+        self,
+        dimensions: int = 768,
+        *,
+        max_batch_items: int = MAX_BATCH_ITEMS,
+        max_batch_chars: int = MAX_BATCH_CHARS,
+    ):
         self._dimensions = dimensions
+        self._max_batch_items = max_batch_items
+        self._max_batch_chars = max_batch_chars
+        self.requests: list[list[str]] = []
+
+    @property
+    def model(self) -> str:
+        return "fake"
 
     @property
     def dimensions(self) -> int:
         return self._dimensions
 
     async def embed(self, text: str) -> list[float]:
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        vectors = []
+        for chunk in chunk_texts(texts, self._max_batch_items, self._max_batch_chars):
+            self.requests.append(chunk)
+            vectors.extend(self._vector(t) for t in chunk)
+        return vectors
+
+    def _vector(self, text: str) -> list[float]:
         h = hashlib.sha256(text.encode()).digest()
         vec = []
         for i in range(self._dimensions):
@@ -21,6 +53,3 @@ class FakeEmbedder:
             val = (h[byte_idx] + i) % 256
             vec.append((val / 255.0) * 2 - 1)  # normalize to [-1, 1]
         return vec
-
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        return [await self.embed(t) for t in texts]
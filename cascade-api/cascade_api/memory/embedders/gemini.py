@@ -1,9 +1,31 @@
-"""GeminiEmbedder — Google Gemini embedding API (3072-dim, free tier)."""
+"""GeminiEmbedder — Google Gemini embedding API (free tier).
+
+gemini-embedding-001 is a Matryoshka model: a prefix of its 3072-dim
+vector is still a usable embedding. The API truncates when asked for
+``output_dimensionality``, but only full-width vectors come back unit
+length, so shorter ones are renormalized here.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import math
+import random
+import time
+from collections.abc import Callable
 from functools import lru_cache
 
+from cascade_api.memory.embedders.chunking import MAX_BATCH_CHARS, MAX_BATCH_ITEMS, chunk_texts
+from cascade_api.memory.errors import EmbeddingError
+
+log = logging.getLogger("cascade_memory.embedders.gemini")
+
+RETRY_STATUS_CODES = frozenset({429, 500, 503})  # quota exhausted, transient server errors
+RETRY_BASE_S = 1.0
+RETRY_MAX_S = 30.0
+NATIVE_DIMENSIONS = 3072
+
 
 @lru_cache(maxsize=1)
 def _get_client(api_key: str):
@@ -13,18 +35,122 @@ def _get_client(api_key: str):
 
 
 class GeminiEmbedder:
-    def __init__(self, api_key: str, model: str = "gemini-embedding-001"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-embedding-001",
+        usage_hook: Callable[..., None] | None = None,
+        *,
+        output_dimensionality: int = 768,
+        max_concurrency: int = 4,
+        max_retries: int = 4,
+        max_batch_items: int = MAX_BATCH_ITEMS,
+        max_batch_chars: int = MAX_BATCH_CHARS,
+    ):
+        """
+        Args:
+            usage_hook: Optional callback invoked after each API call with
+                ``model``, ``chars``, ``latency_ms`` and ``ok`` keyword
+                arguments (e.g. to record usage/cost).
+            output_dimensionality: Vector width; must match the store's
+                embedding column (``VECTOR(768)`` in the Supabase schema).
+            max_concurrency: Requests in flight at once across all callers.
+            max_retries: Retries for a request rejected for quota (429) or
+                a transient server error, with exponential backoff.
+            max_batch_items, max_batch_chars: ``embed_batch`` splits its
+                input into requests within these limits.
+        """
+        if not 0 < output_dimensionality <= NATIVE_DIMENSIONS:
+            raise ValueError(f"output_dimensionality must be 1..{NATIVE_DIMENSIONS}")
         self._api_key = api_key
+        self._output_dimensionality = output_dimensionality
         self._model = model
+        self._usage_hook = usage_hook
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._max_batch_items = max_batch_items
+        self._max_batch_chars = max_batch_chars
+
+    @property
+    def model(self) -> str:
+        return self._model
 
     @property
     def dimensions(self) -> int:
-        return 3072
+        return self._output_dimensionality
 
     async def embed(self, text: str) -> list[float]:
-        client = _get_client(self._api_key)
-        result = client.models.embed_content(model=self._model, contents=text)
-        return list(result.embeddings[0].values)
+        return (await self.embed_batch([text]))[0]
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        return [await self.embed(t) for t in texts]
+        """Embed ``texts`` in as few requests as the batch limits allow."""
+        if not texts:
+            return []
+        chunks = chunk_texts(texts, self._max_batch_items, self._max_batch_chars)
+        results = await asyncio.gather(*(self._embed_chunk(chunk) for chunk in chunks))
+        return [vector for chunk in results for vector in chunk]
+
+    async def _embed_chunk(self, texts: list[str]) -> list[list[float]]:
+        from google.genai.errors import APIError
+
+        client = _get_client(self._api_key)
+        chars = sum(len(t) for t in texts)
+        for attempt in range(self._max_retries + 1):
+            async with self._semaphore:
+                start = time.perf_counter()
+                ok = False
+                try:
+                    result = await client.aio.models.embed_content(
+                        model=self._model, contents=texts, config=self._config
+                    )
+                    ok = True
+                except APIError as e:
+                    if e.code not in RETRY_STATUS_CODES or attempt >= self._max_retries:
+                        raise
+                    error = e
+                finally:
+                    self._report(chars, start, ok)
+            if ok:
+                break
+            delay = min(RETRY_BASE_S * 2**attempt, RETRY_MAX_S) * random.uniform(0.8, 1.2)
+            log.warning(
+                "Gemini embedding %s, retrying in %.1fs (attempt %d)",
+                error.code,
+                delay,
+                attempt + 1,
+            )
+            await asyncio.sleep(delay)
+
+        vectors = [list(e.values) for e in result.embeddings]
+        if len(vectors) != len(texts):
+            raise EmbeddingError(
+                f"Gemini returned {len(vectors)} embeddings for {len(texts)} texts"
+            )
+        if self._output_dimensionality < NATIVE_DIMENSIONS:
+            vectors = [_normalize(v) for v in vectors]
+        return vectors
+
+    @property
+    def _config(self) -> dict | None:
+        if self._output_dimensionality == NATIVE_DIMENSIONS:
+            return None
+        return {"output_dimensionality": self._output_dimensionality}
+
+    def _report(self, chars: int, start: float, ok: bool) -> None:
+        if self._usage_hook is None:
+            return
+        try:
+            self._usage_hook(
+                model=self._model,
+                chars=chars,
+                latency_ms=(time.perf_counter() - start) * 1000,
+                ok=ok,
+            )
+        except Exception:
+            pass  # usage reporting must never break embedding
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    """Scale to unit length so cosine and dot-product rankings agree."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else vector
@@ -12,3 +12,13 @@ class Embedder(Protocol):
 
     @property
     def dimensions(self) -> int: ...
+
+
+class EmbeddingCacheStore(Protocol):
+    """Persistent tier for ``CachedEmbedder``, keyed by content hash."""
+
+    async def get_many(self, keys: list[str]) -> dict[str, list[float]]: ...
+
+    async def put_many(
+        self, model: str, dimensions: int, vectors: dict[str, list[float]]
+    ) -> None: ...
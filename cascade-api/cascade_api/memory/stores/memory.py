@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 
 from cascade_api.memory.errors import (
     ConcurrencyError,
+    DimensionMismatchError,
     MemoryNotFoundError,
     TenantIsolationError,
 )
@@ -49,6 +50,14 @@ class InMemoryStore:
     # ── Archival memory ──────────────────────────────────
 
     async def save(self, tenant_id: str, memory: MemoryRecord) -> str:
+        if (
+            memory.embedding
+            and self._embedding_dims is not None
+            and len(memory.embedding) != self._embedding_dims
+        ):
+            raise DimensionMismatchError(
+                f"Expected {self._embedding_dims}-dim embedding, got {len(memory.embedding)}"
+            )
         mid = str(uuid.uuid4())
         now = datetime.now(timezone.utc)
         record = MemoryRecord(
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 
 from cascade_api.memory.errors import (
     ConcurrencyError,
+    DimensionMismatchError,
     MemoryNotFoundError,
     TenantIsolationError,
 )
@@ -21,23 +23,29 @@ class SupabaseStore:
     Requires: pip install cascade-memory[supabase]
     """
 
-    def __init__(self, client):
+    def __init__(self, client, search_oversample: int = 4):
         """Initialize with a Supabase client instance.
 
         Args:
-            client: A supabase.Client (sync) instance. The store wraps
-                    its synchronous methods — Supabase Python SDK v2 is sync.
+            client: A supabase.Client (sync) instance. Supabase Python SDK v2
+                    is sync, so every query is executed in a worker thread to
+                    keep the event loop free.
+            search_oversample: ``search`` re-ranks ``count * search_oversample``
+                    nearest neighbours from the HNSW index. Higher values
+                    trade latency for recall.
         """
         self._sb = client
+        self._search_oversample = search_oversample
+
+    async def _execute(self, query):
+        """Run a built query's blocking ``execute()`` off the event loop."""
+        return await asyncio.to_thread(query.execute)
 
     # ── Core memory ──────────────────────────────────────
 
     async def get_core(self, tenant_id: str) -> tuple[str, int]:
-        result = (
-            self._sb.table("core_memories")
-            .select("content, version")
-            .eq("tenant_id", tenant_id)
-            .execute()
+        result = await self._execute(
+            self._sb.table("core_memories").select("content, version").eq("tenant_id", tenant_id)
         )
         if result.data:
             return result.data[0]["content"], result.data[0]["version"]
@@ -49,7 +57,7 @@ class SupabaseStore:
 
         if expected_version > 0:
             # Optimistic lock: only update if version matches
-            result = (
+            result = await self._execute(
                 self._sb.table("core_memories")
                 .update(
                     {
@@ -60,7 +68,6 @@ class SupabaseStore:
                 )
                 .eq("tenant_id", tenant_id)
                 .eq("version", expected_version)
-                .execute()
             )
             if not result.data:
                 raise ConcurrencyError(
@@ -68,9 +75,8 @@ class SupabaseStore:
                 )
         else:
             # First write — upsert
-            result = (
-                self._sb.table("core_memories")
-                .upsert(
+            result = await self._execute(
+                self._sb.table("core_memories").upsert(
                     {
                         "tenant_id": tenant_id,
                         "content": content,
@@ -79,7 +85,6 @@ class SupabaseStore:
                     },
                     on_conflict="tenant_id",
                 )
-                .execute()
             )
 
         log.info("core_memory.upserted tenant_id=%s length=%d", tenant_id, len(content))
@@ -101,7 +106,7 @@ class SupabaseStore:
         if memory.source_id:
             row["source_id"] = memory.source_id
 
-        result = self._sb.table("memories").insert(row).execute()
+        result = await self._execute(self._sb.table("memories").insert(row))
         log.info("memory.saved tenant_id=%s type=%s", tenant_id, memory.memory_type)
         return result.data[0]["id"]
 
@@ -109,12 +114,8 @@ class SupabaseStore:
         return [await self.save(tenant_id, m) for m in memories]
 
     async def get(self, tenant_id: str, memory_id: str) -> MemoryRecord:
-        result = (
-            self._sb.table("memories")
-            .select("*")
-            .eq("id", memory_id)
-            .eq("tenant_id", tenant_id)
-            .execute()
+        result = await self._execute(
+            self._sb.table("memories").select("*").eq("id", memory_id).eq("tenant_id", tenant_id)
         )
         if not result.data:
             raise MemoryNotFoundError(f"Memory {memory_id} not found for tenant {tenant_id}")
@@ -123,14 +124,13 @@ class SupabaseStore:
     async def list(
         self, tenant_id: str, status: str = "active", limit: int = 50
     ) -> list[MemoryRecord]:
-        result = (
+        result = await self._execute(
             self._sb.table("memories")
             .select("*")
             .eq("tenant_id", tenant_id)
             .eq("status", status)
             .order("created_at", desc=True)
             .limit(limit)
-            .execute()
         )
         return [self._row_to_record(r) for r in result.data]
 
@@ -156,12 +156,11 @@ class SupabaseStore:
         if not updates:
             return
 
-        result = (
+        result = await self._execute(
             self._sb.table("memories")
             .update(updates)
             .eq("id", memory_id)
             .eq("tenant_id", tenant_id)
-            .execute()
         )
         if not result.data:
             raise MemoryNotFoundError(f"Memory {memory_id} not found")
@@ -173,15 +172,18 @@ class SupabaseStore:
         count: int = 5,
         threshold: float = 0.5,
     ) -> list[SearchResult]:
-        result = self._sb.rpc(
-            "match_memories",
-            {
-                "query_embedding": embedding,
-                "match_tenant_id": tenant_id,
-                "match_count": count,
-                "match_threshold": threshold,
-            },
-        ).execute()
+        result = await self._execute(
+            self._sb.rpc(
+                "match_memories",
+                {
+                    "query_embedding": embedding,
+                    "match_tenant_id": tenant_id,
+                    "match_count": count,
+                    "match_threshold": threshold,
+                    "match_oversample": self._search_oversample,
+                },
+            )
+        )
 
         return [
             SearchResult(
@@ -203,20 +205,32 @@ class SupabaseStore:
 
     async def delete(self, tenant_id: str, memory_id: str) -> None:
         # Also clean up links
-        self._sb.table("memory_links").delete().eq("source_memory_id", memory_id).execute()
-        self._sb.table("memory_links").delete().eq("target_memory_id", memory_id).execute()
-        self._sb.table("memories").delete().eq("id", memory_id).eq("tenant_id", tenant_id).execute()
+        await self._execute(
+            self._sb.table("memory_links").delete().eq("source_memory_id", memory_id)
+        )
+        await self._execute(
+            self._sb.table("memory_links").delete().eq("target_memory_id", memory_id)
+        )
+        await self._execute(
+            self._sb.table("memories").delete().eq("id", memory_id).eq("tenant_id", tenant_id)
+        )
 
     async def delete_all(self, tenant_id: str) -> int:
         # Get all memory IDs first for link cleanup
-        existing = self._sb.table("memories").select("id").eq("tenant_id", tenant_id).execute()
+        existing = await self._execute(
+            self._sb.table("memories").select("id").eq("tenant_id", tenant_id)
+        )
         count = len(existing.data)
         if count > 0:
             ids = [r["id"] for r in existing.data]
             for mid in ids:
-                self._sb.table("memory_links").delete().eq("source_memory_id", mid).execute()
-                self._sb.table("memory_links").delete().eq("target_memory_id", mid).execute()
-            self._sb.table("memories").delete().eq("tenant_id", tenant_id).execute()
+                await self._execute(
+                    self._sb.table("memory_links").delete().eq("source_memory_id", mid)
+                )
+                await self._execute(
+                    self._sb.table("memory_links").delete().eq("target_memory_id", mid)
+                )
+            await self._execute(self._sb.table("memories").delete().eq("tenant_id", tenant_id))
         return count
 
     # ── Links ────────────────────────────────────────────
@@ -225,49 +239,41 @@ class SupabaseStore:
         self, tenant_id: str, source_id: str, target_id: str, link_type: str
     ) -> None:
         # Verify both memories belong to this tenant
-        source = (
-            self._sb.table("memories")
-            .select("id")
-            .eq("id", source_id)
-            .eq("tenant_id", tenant_id)
-            .execute()
+        source = await self._execute(
+            self._sb.table("memories").select("id").eq("id", source_id).eq("tenant_id", tenant_id)
         )
-        target = (
-            self._sb.table("memories")
-            .select("id")
-            .eq("id", target_id)
-            .eq("tenant_id", tenant_id)
-            .execute()
+        target = await self._execute(
+            self._sb.table("memories").select("id").eq("id", target_id).eq("tenant_id", tenant_id)
         )
         if not source.data or not target.data:
             raise TenantIsolationError(
                 "Cannot link memories across tenants or link non-existent memories"
             )
 
-        self._sb.table("memory_links").insert(
-            {
-                "tenant_id": tenant_id,
-                "source_memory_id": source_id,
-                "target_memory_id": target_id,
-                "link_type": link_type,
-            }
-        ).execute()
+        await self._execute(
+            self._sb.table("memory_links").insert(
+                {
+                    "tenant_id": tenant_id,
+                    "source_memory_id": source_id,
+                    "target_memory_id": target_id,
+                    "link_type": link_type,
+                }
+            )
+        )
 
     async def get_links(self, tenant_id: str, memory_id: str) -> list[MemoryLink]:
         # Get links where this memory is source or target
-        source_links = (
+        source_links = await self._execute(
             self._sb.table("memory_links")
             .select("*")
             .eq("tenant_id", tenant_id)
             .eq("source_memory_id", memory_id)
-            .execute()
         )
-        target_links = (
+        target_links = await self._execute(
             self._sb.table("memory_links")
             .select("*")
             .eq("tenant_id", tenant_id)
             .eq("target_memory_id", memory_id)
-            .execute()
         )
         all_links = source_links.data + target_links.data
         return [
@@ -283,23 +289,52 @@ class SupabaseStore:
     # ── Decay ────────────────────────────────────────────
 
     async def update_decay_scores(self, decay_rate: float = 0.95) -> int:
-        result = self._sb.rpc(
-            "update_memory_decay_scores",
-            {"p_decay_rate": decay_rate},
-        ).execute()
+        result = await self._execute(
+            self._sb.rpc(
+                "update_memory_decay_scores",
+                {"p_decay_rate": decay_rate},
+            )
+        )
         return result.data if isinstance(result.data, int) else 0
 
     async def touch_accessed(self, tenant_id: str, memory_ids: list[str]) -> None:
         now = datetime.now(timezone.utc).isoformat()
         for mid in memory_ids:
-            self._sb.table("memories").update({"last_accessed_at": now}).eq("id", mid).eq(
-                "tenant_id", tenant_id
-            ).execute()
+            await self._execute(
+                self._sb.table("memories")
+                .update({"last_accessed_at": now})
+                .eq("id", mid)
+                .eq("tenant_id", tenant_id)
+            )
 
     # ── Setup ────────────────────────────────────────────
 
     async def initialize(self, embedding_dimensions: int) -> None:
-        """No-op for SupabaseStore — run the SQL migration template manually."""
+        """Check the embedder against the column width the migration recorded.
+
+        Tables are not created here — run the SQL migration template
+        manually. Raises DimensionMismatchError when ``memories.embedding``
+        has a different width, since every save and search would fail.
+        """
+        try:
+            result = await self._execute(
+                self._sb.table("_cascade_memory_config")
+                .select("value")
+                .eq("key", "embedding_dimensions")
+            )
+        except Exception as e:
+            log.warning("Could not read _cascade_memory_config, skipping dimension check: %s", e)
+            return
+        if not result.data:
+            log.warning("embedding_dimensions not recorded, skipping dimension check")
+            return
+
+        column_dimensions = int(result.data[0]["value"])
+        if column_dimensions != embedding_dimensions:
+            raise DimensionMismatchError(
+                f"Embedder produces {embedding_dimensions}-dim vectors but "
+                f"memories.embedding is VECTOR({column_dimensions})"
+            )
 
     # ── Helpers ──────────────────────────────────────────
 
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import json
 
-import anthropic
 import structlog
 
+from cascade_api.llm.gateway import create_message
 from cascade_api.observability.langfuse_client import get_langfuse
 
 log = structlog.get_logger()
@@ -84,8 +84,9 @@ async def score_trace(
     try:
         prompt = build_judge_prompt(user_message, agent_response, tool_calls, is_scheduled)
 
-        client = anthropic.AsyncAnthropic(api_key=api_key)
-        response = await client.messages.create(
+        response = await create_message(
+            call_site="observability.evals",
+            api_key=api_key,
             model=JUDGE_MODEL,
             max_tokens=512,
             messages=[{"role": "user", "content": prompt}],
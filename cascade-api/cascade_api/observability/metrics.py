@@ -0,0 +1,83 @@
+"""In-process metrics — lightweight histograms exposed via /api/metrics."""
+
+from __future__ import annotations
+
+import threading
+
+# Upper bounds in milliseconds; the last bucket is open-ended
+DEFAULT_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (Prometheus-style cumulative snapshot)."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self._bounds = buckets_ms
+        self._counts = [0] * (len(buckets_ms) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, ms: float) -> None:
+        idx = next((i for i, bound in enumerate(self._bounds) if ms <= bound), len(self._bounds))
+        with self._lock:
+            self._counts[idx] += 1
+            self._count += 1
+            self._sum_ms += ms
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        if not self._count:
+            return None
+        target = q * self._count
+        seen = 0
+        for i, n in enumerate(self._counts):
+            seen += n
+            if seen >= target:
+                return float(self._bounds[i]) if i < len(self._bounds) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            count, sum_ms = self._count, self._sum_ms
+
+        cumulative, buckets = 0, {}
+        for bound, n in zip((*self._bounds, "inf"), counts, strict=True):
+            cumulative += n
+            buckets[f"le_{bound}"] = cumulative
+
+        return {
+            "count": count,
+            "avg_ms": round(sum_ms / count, 1) if count else None,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "buckets": buckets,
+        }
+
+
+class HistogramFamily:
+    """Histograms keyed by a label (e.g. model name), created on first use."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self._buckets_ms = buckets_ms
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, label: str) -> LatencyHistogram:
+        hist = self._histograms.get(label)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(label, LatencyHistogram(self._buckets_ms))
+        return hist
+
+    def snapshot(self) -> dict[str, dict]:
+        return {label: hist.snapshot() for label, hist in sorted(self._histograms.items())}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
@@ -0,0 +1,255 @@
+"""LLM usage ledger — durable per-call token, cost and latency records.
+
+Every Anthropic and Gemini call is buffered here and written to the
+``llm_usage`` table in batches, so the request path never waits on the
+insert. Tenant attribution comes from ``bind_tenant`` (a context variable,
+so it follows background tasks spawned from the request).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import structlog
+
+from cascade_api.config import settings
+
+log = structlog.get_logger()
+
+BATCH_SIZE = 50
+FLUSH_INTERVAL_S = 5.0
+MAX_BUFFER = 2000  # rows kept while the database is unreachable
+# Postgres error classes that retrying can't fix: data exception, integrity
+# violation (e.g. the tenant was deleted); PGRST1xx are malformed requests
+REJECTED_SQLSTATE_PREFIXES = ("22", "23", "PGRST1")
+
+# USD per million tokens: (input, output, cache write, cache read).
+# Matched by longest model-name prefix.
+PRICING: dict[str, tuple[float, float, float, float]] = {
+    "claude-haiku-4-5": (1.00, 5.00, 1.25, 0.10),
+    "claude-sonnet-4": (3.00, 15.00, 3.75, 0.30),
+    "claude-opus-4": (15.00, 75.00, 18.75, 1.50),
+    "gemini-embedding": (0.15, 0.0, 0.0, 0.0),
+}
+
+_tenant_id: ContextVar[str | None] = ContextVar("usage_tenant_id", default=None)
+
+
+@contextmanager
+def bind_tenant(tenant_id: str | None) -> Iterator[None]:
+    """Attribute LLM calls made inside this block (and tasks it spawns) to a tenant."""
+    token = _tenant_id.set(tenant_id)
+    try:
+        yield
+    finally:
+        _tenant_id.reset(token)
+
+
+def set_tenant(tenant_id: str | None) -> None:
+    """Attribute LLM calls for the rest of the current task to a tenant."""
+    _tenant_id.set(tenant_id)
+
+
+def current_tenant() -> str | None:
+    return _tenant_id.get()
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    cache_creation_input_tokens: int = 0,
+    cache_read_input_tokens: int = 0,
+) -> float:
+    """Cost in USD for one call; 0 for models without a price entry."""
+    prefix = max((p for p in PRICING if model.startswith(p)), key=len, default=None)
+    if prefix is None:
+        return 0.0
+    price_in, price_out, price_write, price_read = PRICING[prefix]
+    return round(
+        (
+            input_tokens * price_in
+            + output_tokens * price_out
+            + cache_creation_input_tokens * price_write
+            + cache_read_input_tokens * price_read
+        )
+        / 1_000_000,
+        6,
+    )
+
+
+class UsageLedger:
+    """Buffers usage rows and inserts them in batches."""
+
+    def __init__(
+        self,
+        supabase_factory: Callable | None = None,
+        batch_size: int = BATCH_SIZE,
+        flush_interval_s: float = FLUSH_INTERVAL_S,
+        max_buffer: int = MAX_BUFFER,
+    ):
+        self._supabase_factory = supabase_factory
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        self._max_buffer = max_buffer
+        self._buffer: list[dict] = []
+        self._timer: asyncio.Task | None = None
+        self._flushing: set[asyncio.Task] = set()
+        self.dropped = 0
+
+    def record(self, row: dict) -> None:
+        """Queue a row; flushes when the batch is full or the interval elapses."""
+        if len(self._buffer) >= self._max_buffer:
+            self._buffer.pop(0)
+            self.dropped += 1
+        self._buffer.append(row)
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop (sync context) — the next flush picks it up
+
+        if len(self._buffer) >= self._batch_size:
+            task = asyncio.create_task(self.flush())
+            self._flushing.add(task)
+            task.add_done_callback(self._flushing.discard)
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> int:
+        """Write buffered rows. Returns how many were written.
+
+        On a transient error the unwritten batches go back in the buffer.
+        A batch the database rejects is retried row by row and only the
+        offending rows are dropped, so one bad row can't block the ledger.
+        """
+        if not self._buffer:
+            return 0
+        from cascade_api.db.client import execute
+
+        rows, self._buffer = self._buffer, []
+        pending = [rows[i : i + self._batch_size] for i in range(0, len(rows), self._batch_size)]
+        written = 0
+        supabase = None
+        while pending:
+            batch = pending.pop(0)
+            try:
+                supabase = supabase or self._supabase()
+                await execute(supabase.table("llm_usage").insert(batch))
+            except Exception as e:
+                if not _rejected(e):
+                    unwritten = [row for b in [batch, *pending] for row in b]
+                    log.warning("usage_ledger.flush_failed", rows=len(unwritten), error=str(e))
+                    # Keep the rows for the next attempt, within the buffer cap
+                    self._buffer = (unwritten + self._buffer)[-self._max_buffer :]
+                    return written
+                if len(batch) > 1:
+                    pending[:0] = [[row] for row in batch]
+                else:
+                    self.dropped += 1
+                    log.warning(
+                        "usage_ledger.row_rejected",
+                        tenant_id=batch[0].get("tenant_id"),
+                        error=str(e),
+                    )
+                continue
+            written += len(batch)
+        return written
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval_s)
+        await self.flush()
+
+    def _supabase(self):
+        if self._supabase_factory is not None:
+            return self._supabase_factory()
+        from cascade_api.dependencies import get_supabase
+
+        return get_supabase()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+
+def _rejected(error: Exception) -> bool:
+    code = getattr(error, "code", None)  # postgrest APIError: SQLSTATE or PGRST code
+    return isinstance(code, str) and code.startswith(REJECTED_SQLSTATE_PREFIXES)
+
+
+@lru_cache
+def get_usage_ledger() -> UsageLedger:
+    return UsageLedger()
+
+
+def ledger_enabled() -> bool:
+    return settings.usage_ledger_enabled and bool(settings.supabase_url)
+
+
+def record_llm_call(
+    *,
+    provider: str,
+    model: str,
+    call_site: str,
+    latency_ms: float,
+    ok: bool = True,
+    tenant_id: str | None = None,
+    round_num: int | None = None,
+    stop_reason: str | None = None,
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    cache_creation_input_tokens: int = 0,
+    cache_read_input_tokens: int = 0,
+) -> None:
+    """Add one model call to the ledger (no-op when the ledger is disabled)."""
+    if not ledger_enabled():
+        return
+    get_usage_ledger().record(
+        {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "tenant_id": tenant_id or current_tenant(),
+            "provider": provider,
+            "model": model,
+            "call_site": call_site,
+            "round": round_num,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cache_creation_input_tokens": cache_creation_input_tokens,
+            "cache_read_input_tokens": cache_read_input_tokens,
+            "latency_ms": round(latency_ms),
+            "stop_reason": stop_reason,
+            "ok": ok,
+            "cost_usd": estimate_cost(
+                model,
+                input_tokens,
+                output_tokens,
+                cache_creation_input_tokens,
+                cache_read_input_tokens,
+            ),
+        }
+    )
+
+
+def record_embedding_call(
+    *,
+    model: str,
+    chars: int,
+    latency_ms: float,
+    ok: bool = True,
+    tenant_id: str | None = None,
+) -> None:
+    """Usage hook for embedders. Gemini doesn't return token counts; estimate ~4 chars/token."""
+    record_llm_call(
+        provider="gemini",
+        model=model,
+        call_site="memory.embed",
+        latency_ms=latency_ms,
+        ok=ok,
+        tenant_id=tenant_id,
+        input_tokens=chars // 4,
+    )
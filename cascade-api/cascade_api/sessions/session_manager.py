@@ -6,6 +6,7 @@ from datetime import datetime, timedelta, timezone
 
 import structlog
 
+from cascade_api.db.client import execute
 from cascade_api.dependencies import get_supabase
 
 log = structlog.get_logger()
@@ -40,7 +41,7 @@ async def create_session(thread_id: str, chat_jid: str) -> dict:
     }
 
     sb = get_supabase()
-    sb.table(TABLE).insert(row).execute()
+    await execute(sb.table(TABLE).insert(row))
 
     log.info("session_created", thread_id=thread_id, chat_jid=chat_jid)
     return row
@@ -49,14 +50,14 @@ async def create_session(thread_id: str, chat_jid: str) -> dict:
 async def get_session(thread_id: str) -> dict | None:
     """Retrieve a session by thread_id. Returns None if not found or expired."""
     sb = get_supabase()
-    resp = sb.table(TABLE).select("*").eq("thread_id", thread_id).execute()
+    resp = await execute(sb.table(TABLE).select("*").eq("thread_id", thread_id))
 
     if not resp.data:
         return None
 
     session = resp.data[0]
     if _is_expired(session["last_activity_at"]):
-        sb.table(TABLE).delete().eq("thread_id", thread_id).execute()
+        await execute(sb.table(TABLE).delete().eq("thread_id", thread_id))
         log.info("session_expired", thread_id=thread_id)
         return None
 
@@ -66,7 +67,7 @@ async def get_session(thread_id: str) -> dict | None:
 async def get_session_by_chat_jid(chat_jid: str) -> dict | None:
     """Find an active (non-expired) session for a given chat_jid."""
     sb = get_supabase()
-    resp = sb.table(TABLE).select("*").eq("chat_jid", chat_jid).execute()
+    resp = await execute(sb.table(TABLE).select("*").eq("chat_jid", chat_jid))
 
     for session in resp.data:
         if not _is_expired(session["last_activity_at"]):
@@ -79,11 +80,11 @@ async def touch_session(thread_id: str) -> None:
     """Update the last_activity timestamp for a session."""
     sb = get_supabase()
     now = datetime.now(timezone.utc).isoformat()
-    sb.table(TABLE).update({"last_activity_at": now}).eq("thread_id", thread_id).execute()
+    await execute(sb.table(TABLE).update({"last_activity_at": now}).eq("thread_id", thread_id))
 
 
 async def delete_session(thread_id: str) -> None:
     """Delete a session by thread_id."""
     sb = get_supabase()
-    sb.table(TABLE).delete().eq("thread_id", thread_id).execute()
+    await execute(sb.table(TABLE).delete().eq("thread_id", thread_id))
     log.info("session_deleted", thread_id=thread_id)
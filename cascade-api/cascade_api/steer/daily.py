@@ -8,9 +8,10 @@ from datetime import date, timedelta
 import structlog
 from supabase import Client as SupabaseClient
 
+from cascade_api.db.client import execute
 from cascade_api.db.goals import get_goals
 from cascade_api.db.indicators import get_deficit
-from cascade_api.dependencies import get_anthropic
+from cascade_api.llm.gateway import create_message
 from cascade_api.steer.skill_tracker import get_skill_gaps
 
 log = structlog.get_logger()
@@ -103,13 +104,12 @@ async def generate_daily_tasks(
 
     # Get incomplete tasks for the current week to avoid duplicates
     monday = today - timedelta(days=today.weekday())
-    existing_result = (
+    existing_result = await execute(
         supabase.table("tasks")
         .select("title")
         .eq("tenant_id", tenant_id)
         .eq("week_start", monday.isoformat())
         .eq("completed", False)
-        .execute()
     )
     existing_titles = [t["title"] for t in existing_result.data]
 
@@ -135,8 +135,10 @@ async def generate_daily_tasks(
     existing_text = "\n".join(f"- {t}" for t in existing_titles[:10]) or "None"
 
     # Ask Claude (Haiku — fast/cheap for task generation)
-    client = get_anthropic(api_key)
-    message = await client.messages.create(
+    message = await create_message(
+        call_site="steer.daily",
+        tenant_id=tenant_id,
+        api_key=api_key,
         model="claude-haiku-4-5-20251001",
         max_tokens=512,
         messages=[
@@ -7,7 +7,8 @@ import json
 import structlog
 from supabase import Client as SupabaseClient
 
-from cascade_api.dependencies import get_anthropic
+from cascade_api.db.client import execute
+from cascade_api.llm.gateway import create_message
 
 log = structlog.get_logger()
 
@@ -56,10 +57,11 @@ async def evaluate_task_roi(
             alternatives: [str]
         }
     """
-    client = get_anthropic(api_key)
-
     # Step 1: Map task to skills via Claude
-    message = await client.messages.create(
+    message = await create_message(
+        call_site="steer.evaluate",
+        tenant_id=tenant_id,
+        api_key=api_key,
         model="claude-sonnet-4-5-20250514",
         max_tokens=256,
         messages=[
@@ -78,22 +80,16 @@ async def evaluate_task_roi(
     task_skills: list[str] = json.loads(raw)
 
     # Step 2: Get expert_skills for this goal
-    expert_result = (
-        supabase.table("expert_skills")
-        .select("skill_name, weight")
-        .eq("goal_id", goal_id)
-        .execute()
+    expert_result = await execute(
+        supabase.table("expert_skills").select("skill_name, weight").eq("goal_id", goal_id)
     )
     expert_map: dict[str, float] = {
         row["skill_name"]: float(row["weight"]) for row in expert_result.data
     }
 
     # Step 3: Get user_skills
-    user_result = (
-        supabase.table("user_skills")
-        .select("skill_name, proficiency")
-        .eq("tenant_id", tenant_id)
-        .execute()
+    user_result = await execute(
+        supabase.table("user_skills").select("skill_name, proficiency").eq("tenant_id", tenant_id)
     )
     user_map: dict[str, float] = {
         row["skill_name"]: float(row["proficiency"]) for row in user_result.data
@@ -148,7 +144,10 @@ async def evaluate_task_roi(
             for g in gaps[:8]
         )
 
-        alt_message = await client.messages.create(
+        alt_message = await create_message(
+            call_site="steer.evaluate",
+            tenant_id=tenant_id,
+            api_key=api_key,
             model="claude-sonnet-4-5-20250514",
             max_tokens=512,
             messages=[
@@ -7,7 +7,8 @@ import json
 import structlog
 from supabase import Client as SupabaseClient
 
-from cascade_api.dependencies import get_anthropic
+from cascade_api.db.client import execute
+from cascade_api.llm.gateway import create_message
 
 log = structlog.get_logger()
 
@@ -50,15 +51,19 @@ async def build_expert_graph(
     Any existing expert_skills for this goal_id are cleared first.
     """
     # Fetch the goal for context
-    goal_result = supabase.table("goals").select("title, description").eq("id", goal_id).execute()
+    goal_result = await execute(
+        supabase.table("goals").select("title, description").eq("id", goal_id)
+    )
     if not goal_result.data:
         raise ValueError(f"Goal {goal_id} not found")
 
     goal = goal_result.data[0]
 
     # Ask Claude to decompose
-    client = get_anthropic(api_key)
-    message = await client.messages.create(
+    message = await create_message(
+        call_site="steer.expert_graph",
+        tenant_id=tenant_id,
+        api_key=api_key,
         model="claude-sonnet-4-5-20250514",
         max_tokens=1024,
         messages=[
@@ -87,7 +92,7 @@ async def build_expert_graph(
     )
 
     # Clear existing expert_skills for this goal
-    supabase.table("expert_skills").delete().eq("goal_id", goal_id).execute()
+    await execute(supabase.table("expert_skills").delete().eq("goal_id", goal_id))
 
     # Insert new rows
     rows = [
@@ -100,6 +105,6 @@ async def build_expert_graph(
         }
         for s in skills
     ]
-    result = supabase.table("expert_skills").insert(rows).execute()
+    result = await execute(supabase.table("expert_skills").insert(rows))
     log.info("expert_graph.saved", goal_id=goal_id, rows=len(result.data))
     return result.data
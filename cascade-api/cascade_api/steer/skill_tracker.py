@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 import structlog
 from supabase import Client as SupabaseClient
 
+from cascade_api.db.client import execute
+
 log = structlog.get_logger()
 
 
@@ -19,26 +21,23 @@ async def update_skill(
     """Upsert a user_skills row — update proficiency + last_practiced_at."""
     now = datetime.now(timezone.utc).isoformat()
 
-    existing = (
+    existing = await execute(
         supabase.table("user_skills")
         .select("id")
         .eq("tenant_id", tenant_id)
         .eq("skill_name", skill_name)
-        .execute()
     )
 
     if existing.data:
-        result = (
+        result = await execute(
             supabase.table("user_skills")
             .update({"proficiency": proficiency, "last_practiced_at": now})
             .eq("id", existing.data[0]["id"])
-            .execute()
         )
         log.info("skill.updated", skill_name=skill_name, proficiency=proficiency)
     else:
-        result = (
-            supabase.table("user_skills")
-            .insert(
+        result = await execute(
+            supabase.table("user_skills").insert(
                 {
                     "tenant_id": tenant_id,
                     "skill_name": skill_name,
@@ -46,7 +45,6 @@ async def update_skill(
                     "last_practiced_at": now,
                 }
             )
-            .execute()
         )
         log.info("skill.created", skill_name=skill_name, proficiency=proficiency)
 
@@ -63,18 +61,14 @@ async def get_skill_gaps(
     Joins expert_skills for the goal against user_skills for the tenant.
     Skills the user hasn't practiced yet default to 0 proficiency.
     """
-    expert_result = (
+    expert_result = await execute(
         supabase.table("expert_skills")
         .select("skill_name, weight, category")
         .eq("goal_id", goal_id)
-        .execute()
     )
 
-    user_result = (
-        supabase.table("user_skills")
-        .select("skill_name, proficiency")
-        .eq("tenant_id", tenant_id)
-        .execute()
+    user_result = await execute(
+        supabase.table("user_skills").select("skill_name, proficiency").eq("tenant_id", tenant_id)
     )
 
     user_map: dict[str, float] = {
@@ -109,11 +103,10 @@ async def apply_decay(
     Formula: new = max(0, proficiency - decay_rate * days_since_practice)
     Returns count of skills updated.
     """
-    result = (
+    result = await execute(
         supabase.table("user_skills")
         .select("id, proficiency, last_practiced_at")
         .eq("tenant_id", tenant_id)
-        .execute()
     )
 
     now = datetime.now(timezone.utc)
@@ -133,9 +126,11 @@ async def apply_decay(
         if new_proficiency == current:
             continue
 
-        supabase.table("user_skills").update({"proficiency": round(new_proficiency, 4)}).eq(
-            "id", row["id"]
-        ).execute()
+        await execute(
+            supabase.table("user_skills")
+            .update({"proficiency": round(new_proficiency, 4)})
+            .eq("id", row["id"])
+        )
         updated += 1
 
     log.info("skills.decay_applied", tenant_id=tenant_id, updated=updated)
@@ -11,6 +11,7 @@ from telegram.ext import Application, CommandHandler, MessageHandler, filters
 
 from cascade_api.config import settings
 from cascade_api.telegram.handlers import handle_start, handle_message
+from cascade_api.telegram.outbound import get_outbound_limiter
 
 log = structlog.get_logger()
 
@@ -21,7 +22,12 @@ def create_bot() -> Application | None:
         log.warning("telegram.no_token", msg="TELEGRAM_BOT_TOKEN not set, bot disabled")
         return None
 
-    app = Application.builder().token(settings.telegram_bot_token).build()
+    app = (
+        Application.builder()
+        .token(settings.telegram_bot_token)
+        .rate_limiter(get_outbound_limiter())
+        .build()
+    )
 
     app.add_handler(CommandHandler("start", handle_start))
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
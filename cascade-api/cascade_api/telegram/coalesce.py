@@ -0,0 +1,45 @@
+"""Merge rapid-fire text messages from one user into a single agent turn.
+
+Users often send a thought in pieces ("done with outreach", "also energy
+4", "sent 6 DMs"). Run separately, each piece costs a full agent loop and
+gets its own, sometimes contradictory, reply. ``UpdateQueue`` waits until
+a user has been quiet for the coalescing window, then passes the pending
+text messages through ``merge_updates`` so the handler sees one message.
+"""
+
+from __future__ import annotations
+
+from telegram import Update
+
+from cascade_api.agent.fast_path import match_intent
+
+MAX_MESSAGES = 10  # per merged turn
+MAX_WAIT_WINDOWS = 3  # a steady stream is cut off after this many windows
+
+
+def is_coalescible(update: Update) -> bool:
+    """Plain text from a user; commands and fast-path check-ins stay separate."""
+    message = update.message
+    if message is None or not message.text:
+        return False
+    text = message.text.strip()
+    return not text.startswith("/") and match_intent(text) is None
+
+
+def same_chat(a: Update, b: Update) -> bool:
+    return a.effective_chat is not None and b.effective_chat == a.effective_chat
+
+
+def merge_updates(updates: list[Update]) -> Update:
+    """One update carrying every message's text, newest message as the base.
+
+    Replies go to the latest message. Entities are dropped because their
+    offsets no longer line up with the joined text.
+    """
+    if len(updates) == 1:
+        return updates[0]
+    base = updates[-1]
+    data = base.to_dict()
+    data["message"]["text"] = "\n".join(u.message.text.strip() for u in updates)
+    data["message"].pop("entities", None)
+    return Update.de_json(data, base.get_bot())
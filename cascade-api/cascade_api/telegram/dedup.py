@@ -0,0 +1,84 @@
+"""Update-level idempotency for the Telegram webhook.
+
+Telegram retries an update until it gets a 200, so the same ``update_id``
+can arrive more than once. ``claim()`` returns True only for the first
+delivery: an in-memory LRU answers repeats on this replica for free, and
+the ``telegram_updates`` table (migration 017) is the source of truth
+across replicas and restarts.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+
+import structlog
+
+from cascade_api.config import settings
+from cascade_api.db.client import execute
+
+log = structlog.get_logger()
+
+
+class UpdateDeduplicator:
+    def __init__(self, capacity: int | None = None, supabase_factory: Callable | None = None):
+        self.capacity = capacity or settings.telegram_dedup_cache_size
+        self._supabase_factory = supabase_factory
+        self._seen: OrderedDict[int, None] = OrderedDict()
+        self.stats = {"claimed": 0, "duplicate_memory": 0, "duplicate_db": 0, "db_errors": 0}
+
+    async def claim(self, update_id: int) -> bool:
+        """True if this is the first delivery of ``update_id`` and it should run."""
+        if update_id in self._seen:
+            self._seen.move_to_end(update_id)
+            self.stats["duplicate_memory"] += 1
+            return False
+        self._remember(update_id)
+
+        try:
+            result = await execute(
+                self._supabase()
+                .table("telegram_updates")
+                .upsert({"update_id": update_id}, on_conflict="update_id", ignore_duplicates=True)
+            )
+        except Exception as e:
+            # Fail open: a missed duplicate is cheaper than a dropped message
+            self.stats["db_errors"] += 1
+            log.warning("telegram.dedup_failed", update_id=update_id, error=str(e))
+            self.stats["claimed"] += 1
+            return True
+
+        if not result.data:
+            self.stats["duplicate_db"] += 1
+            log.info("telegram.duplicate_update", update_id=update_id)
+            return False
+        self.stats["claimed"] += 1
+        return True
+
+    async def release(self, update_id: int) -> None:
+        """Forget a claim whose update was not processed, so a redelivery runs."""
+        self._seen.pop(update_id, None)
+        try:
+            await execute(
+                self._supabase().table("telegram_updates").delete().eq("update_id", update_id)
+            )
+        except Exception as e:
+            log.warning("telegram.dedup_release_failed", update_id=update_id, error=str(e))
+
+    def _remember(self, update_id: int) -> None:
+        self._seen[update_id] = None
+        if len(self._seen) > self.capacity:
+            self._seen.popitem(last=False)
+
+    def _supabase(self):
+        if self._supabase_factory is not None:
+            return self._supabase_factory()
+        from cascade_api.dependencies import get_supabase
+
+        return get_supabase()
+
+
+@lru_cache
+def get_update_dedup() -> UpdateDeduplicator:
+    return UpdateDeduplicator()
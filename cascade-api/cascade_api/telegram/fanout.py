@@ -0,0 +1,116 @@
+"""Bounded concurrent fan-out for scheduled sends.
+
+Runs one worker per item with at most ``concurrency`` in flight and a
+per-item timeout, so a slow or failing tenant never delays the rest.
+Workers return ``"sent"`` or ``"skipped"``; an exception or timeout counts
+as ``"failed"``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Literal, TypeVar
+
+import structlog
+
+log = structlog.get_logger()
+
+T = TypeVar("T")
+
+Outcome = Literal["sent", "skipped", "failed"]
+
+
+@dataclass
+class FanoutResult:
+    key: str
+    status: Outcome
+    duration_ms: float
+    error: str | None = None
+
+
+@dataclass
+class FanoutReport:
+    name: str
+    results: list[FanoutResult] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+    def count(self, status: Outcome) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def sent(self) -> int:
+        return self.count("sent")
+
+    @property
+    def failed(self) -> int:
+        return self.count("failed")
+
+    @property
+    def skipped(self) -> int:
+        return self.count("skipped")
+
+    def summary(self) -> dict:
+        """Counts and timings, flat enough to log or return from a cron endpoint."""
+        worked = sorted(r.duration_ms for r in self.results if r.status != "skipped")
+        return {
+            "sent": self.sent,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "duration_ms": round(self.duration_ms),
+            "p50_item_ms": round(worked[len(worked) // 2]) if worked else None,
+            "max_item_ms": round(worked[-1]) if worked else None,
+            "failures": {r.key: r.error for r in self.results if r.status == "failed"},
+        }
+
+
+async def fan_out(
+    name: str,
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[Outcome]],
+    *,
+    key: Callable[[T], str],
+    concurrency: int,
+    timeout_s: float,
+) -> FanoutReport:
+    """Run ``worker`` over ``items`` concurrently and report per-item outcomes."""
+    items = list(items)
+    report = FanoutReport(name=name)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    start = time.perf_counter()
+
+    async def run_one(item: T) -> None:
+        item_key = key(item)
+        async with semaphore:
+            item_start = time.perf_counter()
+            error = None
+            try:
+                status = await asyncio.wait_for(worker(item), timeout=timeout_s)
+            except TimeoutError:
+                status, error = "failed", f"timed out after {timeout_s:g}s"
+            except Exception as e:
+                status, error = "failed", str(e) or type(e).__name__
+            result = FanoutResult(
+                key=item_key,
+                status=status,
+                duration_ms=(time.perf_counter() - item_start) * 1000,
+                error=error,
+            )
+
+        report.results.append(result)
+        if status == "failed":
+            log.error(f"{name}.failed", key=item_key, error=error)
+        log.debug(
+            f"{name}.progress",
+            key=item_key,
+            status=status,
+            done=len(report.results),
+            total=len(items),
+            duration_ms=round(result.duration_ms),
+        )
+
+    await asyncio.gather(*(run_one(item) for item in items))
+    report.duration_ms = (time.perf_counter() - start) * 1000
+    return report
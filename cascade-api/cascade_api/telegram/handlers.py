@@ -2,23 +2,21 @@
 
 from __future__ import annotations
 
-import asyncio
-
 import structlog
 from telegram import Update
 from telegram.ext import ContextTypes
 
+from cascade_api.db.client import execute, run_sync
+from cascade_api.db.tenants import get_tenant_by_telegram_id, invalidate_tenant
 from cascade_api.dependencies import get_supabase
 from cascade_api.observability.posthog_client import track_event
 from cascade_api.config import settings
+from cascade_api.telegram.streaming import TelegramReplyStream
 from cascade_api.telegram.tokens import verify_token
 from cascade_api.utils import is_user_active
 
 log = structlog.get_logger()
 
-# Module-level set to prevent garbage collection of background tasks
-_background_tasks: set[asyncio.Task] = set()
-
 
 async def handle_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /start command — link Telegram to tenant via secure deep link token."""
@@ -35,7 +33,7 @@ async def handle_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     raw_token = context.args[0]
 
     # Verify and consume the one-time token
-    tenant_id = verify_token(supabase, raw_token)
+    tenant_id = await run_sync(verify_token, supabase, raw_token)
     if not tenant_id:
         await update.message.reply_text(
             "Invalid or expired link. Please generate a new one from the website."
@@ -43,16 +41,21 @@ async def handle_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     # Fetch tenant for user_id (needed for analytics)
-    result = supabase.table("tenants").select("*").eq("id", tenant_id).execute()
+    result = await execute(supabase.table("tenants").select("*").eq("id", tenant_id))
     tenant = result.data[0]
 
     # Link Telegram ID
-    supabase.table("tenants").update(
-        {
-            "telegram_id": telegram_id,
-            "onboarding_status": "tg_connected",
-        }
-    ).eq("id", tenant_id).execute()
+    await execute(
+        supabase.table("tenants")
+        .update(
+            {
+                "telegram_id": telegram_id,
+                "onboarding_status": "tg_connected",
+            }
+        )
+        .eq("id", tenant_id)
+    )
+    invalidate_tenant(tenant_id, telegram_id=telegram_id)
 
     track_event(tenant["user_id"], "telegram_connected", {"telegram_id": telegram_id})
 
@@ -72,14 +75,13 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     # Find tenant
-    result = supabase.table("tenants").select("*").eq("telegram_id", telegram_id).execute()
-    if not result.data:
+    tenant = await get_tenant_by_telegram_id(supabase, telegram_id)
+    if tenant is None:
         await update.message.reply_text(
             "I don't recognize this account. Sign up at our website first."
         )
         return
 
-    tenant = result.data[0]
     tenant_id = tenant["id"]
 
     if not is_user_active(tenant):
@@ -88,65 +90,77 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    # Get conversation history
-    from cascade_api.db.conversation_history import get_history, save_turn
+    from cascade_api.db.conversation_history import (
+        load_context,
+        save_turn,
+        schedule_summary_refresh,
+    )
+    from cascade_api.agent.fast_path import try_fast_path
     from cascade_api.agent.loop import run_agent
 
-    history = await get_history(supabase, tenant_id)
+    # One-word check-ins ("status", "today", ...) are answered without the agent
+    fast_reply = await try_fast_path(supabase, tenant_id, text)
+    if fast_reply is not None:
+        await update.message.reply_text(fast_reply, parse_mode="HTML")
+        await save_turn(supabase, tenant_id, "user", text)
+        await save_turn(supabase, tenant_id, "assistant", fast_reply)
+        track_event(tenant.get("user_id", tenant_id), "message_processed", {"intent": "fast_path"})
+        return
+
+    # Show a placeholder right away; the agent's reply streams into it
+    stream = TelegramReplyStream(update.message)
+    await stream.start()
 
     # Run the agent loop
     try:
+        history = await load_context(supabase, tenant_id)
+
         response_text, _updated_messages = await run_agent(
             tenant_id=tenant_id,
             user_message=text,
-            conversation_history=history,
+            conversation_history=history.messages,
+            history_summary=history.summary,
             api_key=settings.anthropic_api_key,
+            stream=stream,
         )
 
         # Save turns
         await save_turn(supabase, tenant_id, "user", text)
         await save_turn(supabase, tenant_id, "assistant", response_text)
+        schedule_summary_refresh(supabase, tenant_id, history)
 
-        # Send response with HTML formatting (split if > 4096 chars for Telegram limit)
-        if len(response_text) <= 4096:
-            await update.message.reply_text(response_text, parse_mode="HTML")
-        else:
-            for i in range(0, len(response_text), 4096):
-                await update.message.reply_text(response_text[i : i + 4096], parse_mode="HTML")
+        # Final edit with HTML formatting (split if > 4096 chars for Telegram limit)
+        await stream.finish(response_text)
 
         track_event(tenant.get("user_id", tenant_id), "message_processed", {"intent": "agent_loop"})
 
-        # Background memory extraction (fire-and-forget with proper task lifecycle)
+        # Memory extraction runs on the job queue (survives deploys and crashes)
         try:
-            from cascade_api.dependencies import get_memory_client
+            from cascade_api.jobs import enqueue
 
             # Get the conversation ID from the saved turn
-            recent = (
+            recent = await execute(
                 supabase.table("conversations")
                 .select("id")
                 .eq("tenant_id", tenant_id)
                 .eq("source", "agent_history")
                 .order("created_at", desc=True)
                 .limit(1)
-                .execute()
             )
             conv_id = recent.data[0]["id"] if recent.data else None
 
-            # Build transcript from the exchange
-            transcript = f"User: {text}\n\nAssistant: {response_text}"
-
-            scoped = get_memory_client().for_tenant(tenant_id)
-            task = asyncio.create_task(
-                scoped.extract(transcript, source_id=str(conv_id) if conv_id else None),
-                name=f"memory_extract_{tenant_id[:8]}",
+            await enqueue(
+                "memory.extract",
+                {
+                    "tenant_id": tenant_id,
+                    # Build transcript from the exchange
+                    "transcript": f"User: {text}\n\nAssistant: {response_text}",
+                    "source_id": str(conv_id) if conv_id else None,
+                },
             )
-            _background_tasks.add(task)
-            task.add_done_callback(_background_tasks.discard)
         except Exception as e:
             log.warning("memory_extraction.trigger_failed", error=str(e))
 
     except Exception as e:
         log.error("agent.failed", tenant_id=tenant_id, error=str(e))
-        await update.message.reply_text(
-            "Something went wrong. Try again, or rephrase your message."
-        )
+        await stream.fail("Something went wrong. Try again, or rephrase your message.")
@@ -0,0 +1,173 @@
+"""Outbound rate limiting for every Bot API call.
+
+Telegram allows roughly 30 messages per second per bot, one per second in
+a private chat and 20 per minute in a group. ``OutboundRateLimiter`` plugs
+into python-telegram-bot's ``rate_limiter`` hook, so replies, edits and
+scheduled sends from any bot built by ``create_bot`` share one global
+token bucket plus a bucket per chat. A 429 (``RetryAfter``) pauses the
+affected bucket and the request is retried after a jittered backoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Callable, Coroutine
+from functools import lru_cache
+from typing import Any
+
+import structlog
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+
+from cascade_api.config import settings
+from cascade_api.observability.metrics import HistogramFamily, LatencyHistogram
+from cascade_api.telegram.streaming import _retry_after_seconds
+
+log = structlog.get_logger()
+
+CHAT_BURST = 3
+GROUP_CHAT_RATE = 20 / 60  # messages per second
+MAX_CHAT_BUCKETS = 10_000  # idle buckets are pruned past this
+MAX_RETRIES = 3
+
+# Callers handle 429s on these themselves: preview edits are skipped and
+# final edits retry once (telegram/streaming.py); typing is best effort.
+NO_RETRY_ENDPOINTS = frozenset({"editMessageText", "sendChatAction"})
+
+THROTTLE_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class TokenBucket:
+    """Reservation-style token bucket: ``reserve()`` says how long to wait."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def idle(self) -> bool:
+        """Full again and not paused, so dropping it loses nothing."""
+        now = time.monotonic()
+        refilled = self._tokens + (now - self._updated) * self.rate
+        return refilled >= self.burst and self._paused_until <= now
+
+
+class OutboundRateLimiter(BaseRateLimiter[dict]):
+    def __init__(
+        self,
+        *,
+        global_rate: float | None = None,
+        chat_rate: float | None = None,
+        max_retries: int = MAX_RETRIES,
+    ):
+        global_rate = global_rate or settings.telegram_global_rate
+        self._chat_rate = chat_rate or settings.telegram_chat_rate
+        self._global = TokenBucket(global_rate, burst=global_rate)
+        self._chats: dict[int | str, TokenBucket] = {}
+        self.max_retries = max_retries
+        self.latency = HistogramFamily()
+        self.throttle = LatencyHistogram(THROTTLE_BUCKETS_MS)
+        self.stats = {"requests": 0, "throttled": 0, "retry_after": 0, "gave_up": 0}
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass  # shared across bots; nothing to release
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, bool | dict | list[dict]]],
+        args: Any,
+        kwargs: dict[str, Any],
+        endpoint: str,
+        data: dict[str, Any],
+        rate_limit_args: dict | None,
+    ) -> bool | dict | list[dict]:
+        self.stats["requests"] += 1
+        chat_id = data.get("chat_id") if endpoint != "sendChatAction" else None
+        chat = self._chat_bucket(chat_id) if chat_id is not None else None
+        retries = 0 if endpoint in NO_RETRY_ENDPOINTS else self.max_retries
+
+        attempt = 0
+        while True:
+            await self._acquire(chat)
+            start = time.perf_counter()
+            try:
+                result = await callback(*args, **kwargs)
+            except RetryAfter as e:
+                delay = _retry_after_seconds(e)
+                self.stats["retry_after"] += 1
+                # Without a chat the flood limit is bot-wide
+                (chat or self._global).pause(delay)
+                if attempt >= retries:
+                    if retries:
+                        self.stats["gave_up"] += 1
+                    raise
+                attempt += 1
+                log.warning(
+                    "telegram.retry_after",
+                    endpoint=endpoint,
+                    chat_id=chat_id,
+                    retry_after_s=delay,
+                    attempt=attempt,
+                )
+                # Jitter so requests paused together don't return together
+                await asyncio.sleep(delay * random.uniform(1.0, 1.2))
+                continue
+            finally:
+                self.latency.labels(endpoint).observe((time.perf_counter() - start) * 1000)
+            return result
+
+    async def _acquire(self, chat: TokenBucket | None) -> None:
+        # Wait for the chat first so a slow chat doesn't hold a global token
+        waited = 0.0
+        for bucket in (chat, self._global):
+            if bucket is None:
+                continue
+            wait = bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                waited += wait
+        if waited:
+            self.stats["throttled"] += 1
+            self.throttle.observe(waited * 1000)
+
+    def _chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= MAX_CHAT_BUCKETS:
+                self._chats = {k: b for k, b in self._chats.items() if not b.idle()}
+            group = isinstance(chat_id, str) or chat_id < 0  # groups, channels, @usernames
+            rate = GROUP_CHAT_RATE if group else self._chat_rate
+            bucket = self._chats[chat_id] = TokenBucket(rate, burst=CHAT_BURST)
+        return bucket
+
+    def snapshot(self) -> dict:
+        return {
+            **self.stats,
+            "chats_tracked": len(self._chats),
+            "throttle_wait": self.throttle.snapshot(),
+            "latency": self.latency.snapshot(),
+        }
+
+
+@lru_cache
+def get_outbound_limiter() -> OutboundRateLimiter:
+    """One limiter per process, shared by every bot ``create_bot`` builds."""
+    return OutboundRateLimiter()
@@ -10,16 +10,19 @@ preferred morning time. Message content varies by day type:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date, datetime, timedelta, timezone
-from zoneinfo import ZoneInfo
 
 import structlog
 from telegram import Bot
 
+from cascade_api.db import deliveries
+from cascade_api.db.client import execute
+from cascade_api.db.tenants import invalidate_tenant
 from cascade_api.dependencies import get_supabase
 from cascade_api.observability.posthog_client import track_event
+from cascade_api.telegram.fanout import fan_out
 from cascade_api.telegram.trial_manager import get_trial_actions
-from cascade_api.utils import is_user_active
 from cascade_api.config import settings
 
 log = structlog.get_logger()
@@ -30,6 +33,9 @@ DEFAULT_MORNING_MINUTE = 0
 DEFAULT_REVIEW_DAY = 0  # Sunday
 DEFAULT_TZ = "America/New_York"
 
+# Deliveries that outlived their tenant's timeout; referenced until they finish
+_deliveries_in_flight: set[asyncio.Task] = set()
+
 
 def _should_send(local_now: datetime, preferred_hour: int, preferred_minute: int) -> bool:
     """Return True if local time is at or past the preferred send time.
@@ -37,6 +43,9 @@ def _should_send(local_now: datetime, preferred_hour: int, preferred_minute: int
     No-skip logic: once the preferred time passes, the message is eligible.
     The first cron tick after the preferred time sends it.
     Idempotency (message_deliveries) prevents duplicates.
+
+    The scheduler applies this rule in SQL (``get_due_tenants``); keep the
+    two in sync.
     """
     preferred_min = preferred_hour * 60 + preferred_minute
     now_min = local_now.hour * 60 + local_now.minute
@@ -64,35 +73,25 @@ def _get_daily_message_type(today: date, review_day: int) -> str:
         return "daily"
 
 
-def _get_active_tenants(supabase) -> list[dict]:
-    """Return tenants with a telegram_id that are active (paying or in trial)."""
-    tenants = supabase.table("tenants").select("*").not_.is_("telegram_id", "null").execute().data
-    return [t for t in tenants if is_user_active(t)]
-
+async def _get_due_tenants(supabase, message_type: str, now: datetime) -> list[dict]:
+    """Return active tenants whose ``message_type`` message is due and unsent.
 
-def _already_sent(supabase, tenant_id: str, message_type: str, today: date) -> bool:
-    """Check message_deliveries for an existing record."""
-    rows = (
-        supabase.table("message_deliveries")
-        .select("id")
-        .eq("tenant_id", tenant_id)
-        .eq("message_type", message_type)
-        .eq("scheduled_for", today.isoformat())
-        .execute()
-        .data
+    Evaluated in Postgres (``get_due_tenants``): activity, each tenant's local
+    time vs. preferred time, and the message_deliveries anti-join (sent, or
+    claimed by a live worker). Rows carry ``local_date``, the tenant's
+    current date.
+    """
+    result = await execute(
+        supabase.rpc(
+            "get_due_tenants",
+            {
+                "p_message_type": message_type,
+                "p_now": now.isoformat(),
+                "p_max_attempts": deliveries.MAX_DELIVERY_ATTEMPTS,
+            },
+        )
     )
-    return len(rows) > 0
-
-
-def _record_delivery(supabase, tenant_id: str, message_type: str, today: date):
-    """Insert a delivery record (idempotent via UNIQUE constraint)."""
-    supabase.table("message_deliveries").insert(
-        {
-            "tenant_id": tenant_id,
-            "message_type": message_type,
-            "scheduled_for": today.isoformat(),
-        }
-    ).execute()
+    return result.data or []
 
 
 # ── Message builders (agent loop powered) ──────────────────────────
@@ -165,71 +164,101 @@ async def send_daily_messages(bot: Bot):
     - Monday: week overview + today's tasks
     - Review day: weekly stats + today's tasks
     - Monday + review day: both combined
+
+    Only due tenants are loaded (see ``_get_due_tenants``). They are
+    processed concurrently (``scheduled_fanout_concurrency``) with
+    a per-tenant timeout, so one slow agent run doesn't delay everyone else.
     """
     supabase = get_supabase()
     utc_now = datetime.now(timezone.utc)
-    tenants = _get_active_tenants(supabase)
-    sent = 0
-
-    for tenant in tenants:
-        tenant_id = tenant["id"]
-        telegram_id = tenant["telegram_id"]
-        tz_name = tenant.get("timezone") or DEFAULT_TZ
-
-        try:
-            tz = ZoneInfo(tz_name)
-        except (KeyError, Exception):
-            tz = ZoneInfo(DEFAULT_TZ)
-
-        local_now = utc_now.astimezone(tz)
-        today = local_now.date()
-
-        morning_h = tenant.get("morning_hour", DEFAULT_MORNING_HOUR)
-        morning_m = tenant.get("morning_minute", DEFAULT_MORNING_MINUTE)
-        review_day = tenant.get("review_day", DEFAULT_REVIEW_DAY)
-
-        if not _should_send(local_now, morning_h, morning_m):
-            continue
-
-        # Determine message type based on day
-        message_type = _get_daily_message_type(today, review_day)
-
-        if _already_sent(supabase, tenant_id, "morning", today):
-            continue
-
-        try:
-            msg = await _build_daily_message(tenant_id, today, message_type)
-            await bot.send_message(chat_id=telegram_id, text=msg, parse_mode="HTML")
-            _record_delivery(supabase, tenant_id, "morning", today)
-
-            # Increment weekly review counter when review is included
-            if message_type in ("weekly_review", "monday_review"):
-                reviews = tenant.get("completed_weekly_reviews", 0)
-                supabase.table("tenants").update(
-                    {
-                        "completed_weekly_reviews": reviews + 1,
-                    }
-                ).eq("id", tenant_id).execute()
-
-            track_event(
-                tenant.get("user_id", tenant_id),
-                "daily_message_sent",
+    tenants = await _get_due_tenants(supabase, "morning", utc_now)
+
+    report = await fan_out(
+        "scheduled",
+        tenants,
+        lambda tenant: _send_daily_message(bot, supabase, tenant),
+        key=lambda tenant: tenant["id"],
+        concurrency=settings.scheduled_fanout_concurrency,
+        timeout_s=settings.scheduled_message_timeout_s,
+    )
+    return {**report.summary(), "eligible": len(tenants)}
+
+
+async def _send_daily_message(bot: Bot, supabase, tenant: dict) -> str:
+    """Generate and send one due tenant's daily message."""
+    tenant_id = tenant["id"]
+    today = date.fromisoformat(tenant["local_date"])
+    review_day = tenant.get("review_day", DEFAULT_REVIEW_DAY)
+
+    # Determine message type based on day
+    message_type = _get_daily_message_type(today, review_day)
+
+    # Only the worker that wins the claim generates and sends
+    claim = await deliveries.claim_delivery(supabase, tenant_id, "morning", today)
+    if claim is None:
+        return "skipped"
+
+    delivery = None
+    try:
+        msg = await _build_daily_message(tenant_id, today, message_type)
+        # Once generated, finish delivering even if the tenant's timeout fires:
+        # cancelling between send and mark_sent would re-send after the lease.
+        delivery = asyncio.ensure_future(
+            _deliver_daily_message(bot, supabase, tenant, claim, message_type, msg)
+        )
+        _deliveries_in_flight.add(delivery)
+        delivery.add_done_callback(_deliveries_in_flight.discard)
+        await asyncio.shield(delivery)
+    except BaseException as e:
+        # After generation the delivery task records its own outcome; marking
+        # failed here could land after its mark_sent and cause a re-send
+        if delivery is None:
+            error = "timed out" if isinstance(e, asyncio.CancelledError) else str(e)
+            await asyncio.shield(deliveries.mark_failed(supabase, claim, error))
+        raise
+    return "sent"
+
+
+async def _deliver_daily_message(
+    bot: Bot, supabase, tenant: dict, claim: deliveries.DeliveryClaim, message_type: str, msg: str
+) -> None:
+    tenant_id = tenant["id"]
+    try:
+        await bot.send_message(chat_id=tenant["telegram_id"], text=msg, parse_mode="HTML")
+    except Exception as e:
+        await deliveries.mark_failed(supabase, claim, str(e))
+        raise
+    await deliveries.mark_sent(supabase, claim)
+
+    # Increment weekly review counter when review is included
+    if message_type in ("weekly_review", "monday_review"):
+        reviews = tenant.get("completed_weekly_reviews", 0)
+        await execute(
+            supabase.table("tenants")
+            .update(
                 {
-                    "message_type": message_type,
-                },
+                    "completed_weekly_reviews": reviews + 1,
+                }
             )
-            log.info("scheduled.sent", tenant_id=tenant_id, type=message_type)
-            sent += 1
-        except Exception as e:
-            log.error("scheduled.failed", tenant_id=tenant_id, type=message_type, error=str(e))
+            .eq("id", tenant_id)
+        )
+        invalidate_tenant(tenant_id)
 
-    return {"sent": sent, "eligible": len(tenants)}
+    track_event(
+        tenant.get("user_id", tenant_id),
+        "daily_message_sent",
+        {
+            "message_type": message_type,
+        },
+    )
+    log.info("scheduled.sent", tenant_id=tenant_id, type=message_type)
 
 
 async def run_trial_check_pull(bot: Bot):
     """Check for users who've completed 2+ weekly reviews but haven't paid.
 
-    Sends a payment nudge once. Uses message_deliveries for idempotency.
+    Sends a payment nudge once. Claims in message_deliveries make it
+    idempotent across overlapping runs.
     Deactivation is automatic via is_user_active() — no status change needed.
     """
     from cascade_api.config import settings
@@ -238,7 +267,9 @@ async def run_trial_check_pull(bot: Bot):
     utc_now = datetime.now(timezone.utc)
 
     # Get ALL tenants with telegram (not just active — we need to reach trial-ended users)
-    tenants = supabase.table("tenants").select("*").not_.is_("telegram_id", "null").execute().data
+    tenants = (
+        await execute(supabase.table("tenants").select("*").not_.is_("telegram_id", "null"))
+    ).data
 
     actions = get_trial_actions(tenants)
     processed = 0
@@ -249,9 +280,11 @@ async def run_trial_check_pull(bot: Bot):
         telegram_id = tenant["telegram_id"]
         today = utc_now.date()
 
-        if _already_sent(supabase, tenant_id, "trial_reminder", today):
+        claim = await deliveries.claim_delivery(supabase, tenant_id, "trial_reminder", today)
+        if claim is None:
             continue
 
+        sent = False
         try:
             checkout_url = (
                 f"{settings.frontend_url or 'https://cascade-flame.vercel.app'}"
@@ -265,7 +298,8 @@ async def run_trial_check_pull(bot: Bot):
                     f"{checkout_url}"
                 ),
             )
-            _record_delivery(supabase, tenant_id, "trial_reminder", today)
+            sent = True
+            await deliveries.mark_sent(supabase, claim)
             track_event(
                 tenant.get("user_id", tenant_id),
                 "payment_link_sent",
@@ -276,5 +310,7 @@ async def run_trial_check_pull(bot: Bot):
             processed += 1
         except Exception as e:
             log.error("trial_check.failed", tenant_id=tenant_id, error=str(e))
+            if not sent:  # a failed claim is retried, which would send twice
+                await deliveries.mark_failed(supabase, claim, str(e))
 
     return {"processed": processed, "actions": len(actions)}
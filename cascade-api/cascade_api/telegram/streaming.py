@@ -0,0 +1,174 @@
+"""Progressive Telegram replies for streaming agent runs.
+
+A placeholder is sent as soon as a message is accepted, then edited in place
+as the agent's text streams in. Telegram allows roughly one edit per second
+per chat, so preview edits are throttled. Previews are sent as plain text
+because a half-written reply can contain unbalanced HTML tags; the final edit
+applies HTML formatting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+
+import structlog
+from telegram import Message
+from telegram.constants import ChatAction
+from telegram.error import BadRequest, RetryAfter, TelegramError
+
+log = structlog.get_logger()
+
+PLACEHOLDER_TEXT = "…"
+EDIT_INTERVAL_S = 1.0
+TYPING_INTERVAL_S = 4.0  # Telegram clears the typing indicator after ~5s
+MAX_MESSAGE_LENGTH = 4096
+EMPTY_REPLY_TEXT = "Done."  # Telegram rejects empty messages
+
+
+class TelegramReplyStream:
+    """Streams one agent reply into a single, progressively edited message.
+
+    Implements the ``AgentStream`` callbacks expected by ``run_agent``.
+    """
+
+    def __init__(self, message: Message, edit_interval: float = EDIT_INTERVAL_S):
+        self._message = message
+        self._edit_interval = edit_interval
+        self._placeholder: Message | None = None
+        self._buffer = ""
+        self._shown = ""
+        self._last_edit = 0.0
+        self._typing_task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Send the placeholder the user sees while the agent works."""
+        try:
+            self._placeholder = await self._message.reply_text(PLACEHOLDER_TEXT)
+        except TelegramError as e:
+            # Fall back to a plain reply in finish()
+            log.warning("telegram.placeholder_failed", error=str(e))
+        self._last_edit = time.monotonic()
+
+    async def on_text(self, delta: str) -> None:
+        self._buffer += delta
+        if time.monotonic() - self._last_edit >= self._edit_interval:
+            await self._edit_preview()
+
+    async def on_tools_start(self) -> None:
+        # Text streamed before a tool call is a preamble ("Let me check…");
+        # the next round's text replaces it.
+        self._buffer = ""
+        if self._typing_task is None:
+            self._typing_task = asyncio.create_task(self._keep_typing())
+
+    async def on_tools_end(self) -> None:
+        await self._stop_typing()
+
+    async def finish(self, text: str) -> None:
+        """Replace the placeholder with the final, HTML-formatted reply."""
+        await self._stop_typing()
+        if not text.strip():
+            text = EMPTY_REPLY_TEXT
+        first, *rest = _split_message(text)
+        if self._placeholder is None:
+            await self._reply(first, parse_mode="HTML")
+        else:
+            await self._edit(first, parse_mode="HTML")
+        for chunk in rest:
+            await self._reply(chunk, parse_mode="HTML")
+
+    async def fail(self, text: str) -> None:
+        """Replace the placeholder with an error message."""
+        await self._stop_typing()
+        if self._placeholder is None:
+            await self._message.reply_text(text)
+        else:
+            await self._edit(text)
+
+    # ── Internals ────────────────────────────────────────
+
+    async def _edit_preview(self) -> None:
+        preview = self._buffer[:MAX_MESSAGE_LENGTH]
+        if self._placeholder is None or not preview.strip() or preview == self._shown:
+            return
+        try:
+            await self._placeholder.edit_text(preview)
+            self._shown = preview
+        except RetryAfter as e:
+            # Skip previews until Telegram's cooldown is over
+            self._last_edit = time.monotonic() + _retry_after_seconds(e)
+            return
+        except TelegramError as e:
+            log.debug("telegram.preview_edit_failed", error=str(e))
+        self._last_edit = time.monotonic()
+
+    async def _edit(self, text: str, parse_mode: str | None = None) -> None:
+        for attempt in range(2):
+            try:
+                await self._placeholder.edit_text(text, parse_mode=parse_mode)
+                return
+            except RetryAfter as e:
+                if attempt:
+                    raise
+                await asyncio.sleep(_retry_after_seconds(e))
+            except BadRequest as e:
+                if "not modified" in str(e).lower():
+                    return
+                if parse_mode is None:
+                    raise
+                # Malformed HTML from the model: deliver the text unformatted
+                log.warning("telegram.html_edit_failed", error=str(e))
+                await self._placeholder.edit_text(text)
+                return
+
+    async def _reply(self, text: str, parse_mode: str | None = None) -> None:
+        try:
+            await self._message.reply_text(text, parse_mode=parse_mode)
+        except BadRequest as e:
+            if parse_mode is None:
+                raise
+            # A tag can still span two chunks: send this one unformatted
+            log.warning("telegram.html_reply_failed", error=str(e))
+            await self._message.reply_text(text)
+
+    async def _keep_typing(self) -> None:
+        while True:
+            try:
+                await self._message.reply_chat_action(ChatAction.TYPING)
+            except TelegramError as e:
+                log.debug("telegram.typing_failed", error=str(e))
+            await asyncio.sleep(TYPING_INTERVAL_S)
+
+    async def _stop_typing(self) -> None:
+        if self._typing_task is None:
+            return
+        self._typing_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._typing_task
+        self._typing_task = None
+
+
+def _split_message(text: str) -> list[str]:
+    """Split text into Telegram-sized chunks, preferring line breaks.
+
+    A chunk never ends inside an HTML tag; without a line break or space
+    in range the text is cut hard.
+    """
+    chunks = []
+    while len(text) > MAX_MESSAGE_LENGTH:
+        window = text[:MAX_MESSAGE_LENGTH]
+        cut = window.rfind("\n") + 1 or window.rfind(" ") + 1 or MAX_MESSAGE_LENGTH
+        open_tag = window.rfind("<", 0, cut)
+        if open_tag > window.rfind(">", 0, cut):
+            cut = open_tag or cut
+        chunks.append(text[:cut])
+        text = text[cut:]
+    chunks.append(text)
+    return chunks
+
+
+def _retry_after_seconds(error: RetryAfter) -> float:
+    retry_after = error.retry_after
+    return retry_after.total_seconds() if hasattr(retry_after, "total_seconds") else retry_after
@@ -0,0 +1,229 @@
+"""In-process queue between the Telegram webhook and the bot application.
+
+The webhook acks Telegram as soon as an update is verified and queued; a
+pool of consumers then runs ``process_update``. Updates are keyed by the
+sending Telegram user (one user is one tenant), and each key has at most
+one update in flight, so a user's messages are handled in order while
+different users run in parallel. Text messages a user sends in quick
+succession are merged into one update (see ``telegram/coalesce.py``): a
+key whose head update can coalesce is held on a timer, outside the
+consumer pool, until the user has been quiet for the window.
+
+The queue lives in memory: updates still queued when the process stops
+are lost once ``stop()``'s drain window runs out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import structlog
+from telegram import Update
+
+from cascade_api.config import settings
+from cascade_api.observability.metrics import LatencyHistogram
+from cascade_api.telegram.coalesce import (
+    MAX_MESSAGES,
+    MAX_WAIT_WINDOWS,
+    is_coalescible,
+    merge_updates,
+    same_chat,
+)
+
+log = structlog.get_logger()
+
+# Enqueue-to-start lag is usually milliseconds; a backlog shows up in the tail
+LAG_BUCKETS_MS = (5, 25, 100, 250, 1000, 5000, 15000, 60000, 300000)
+
+
+@dataclass
+class _Queued:
+    update: Update
+    enqueued_at: float
+
+
+def update_key(update: Update) -> str:
+    """Serialization key for ``update``: the sender, else the chat."""
+    if update.effective_user:
+        return f"user:{update.effective_user.id}"
+    if update.effective_chat:
+        return f"chat:{update.effective_chat.id}"
+    return f"update:{update.update_id}"
+
+
+class UpdateQueue:
+    """Per-user FIFO queues drained by a bounded pool of consumers.
+
+    ``submit()`` never blocks; it returns False when ``max_depth`` updates
+    are already waiting, so the webhook can refuse and let Telegram retry.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[Update], Awaitable[object]],
+        *,
+        consumers: int | None = None,
+        max_depth: int | None = None,
+        coalesce_window_s: float | None = None,
+    ):
+        self._process = process
+        self.consumers = consumers or settings.telegram_update_consumers
+        self.max_depth = max_depth or settings.telegram_update_queue_max
+        self.coalesce_window_s = (
+            settings.telegram_coalesce_window_s if coalesce_window_s is None else coalesce_window_s
+        )
+        self._last_submit: dict[str, float] = {}
+        self._settling: dict[str, asyncio.TimerHandle] = {}
+        self._settled_at: dict[str, float] = {}
+        self._pending: dict[str, deque[_Queued]] = {}
+        self._ready: asyncio.Queue[str] = asyncio.Queue()  # keys with work and none in flight
+        self._in_flight: set[str] = set()
+        self._depth = 0
+        self._tasks: list[asyncio.Task] = []
+        self.lag = LatencyHistogram(LAG_BUCKETS_MS)
+        self.duration = LatencyHistogram()
+        self.stats = {"processed": 0, "failed": 0, "rejected": 0, "coalesced": 0}
+
+    # ── Producer ─────────────────────────────────────────
+
+    def submit(self, update: Update) -> bool:
+        if self._depth >= self.max_depth:
+            self.stats["rejected"] += 1
+            log.warning("telegram.update_queue_full", depth=self._depth)
+            return False
+
+        key = update_key(update)
+        queue = self._pending.setdefault(key, deque())
+        now = time.perf_counter()
+        queue.append(_Queued(update, now))
+        self._last_submit[key] = now
+        self._depth += 1
+        # A key already in flight is re-readied by its consumer when it finishes
+        if len(queue) == 1 and key not in self._in_flight:
+            self._schedule(key)
+        return True
+
+    def _schedule(self, key: str) -> None:
+        """Ready ``key``, or hold it until it has been quiet for the coalescing window."""
+        head = self._pending[key][0]
+        if self.coalesce_window_s and is_coalescible(head.update):
+            deadline = head.enqueued_at + self.coalesce_window_s * MAX_WAIT_WINDOWS
+            wait = min(self._last_submit[key] + self.coalesce_window_s, deadline)
+            wait -= time.perf_counter()
+            if wait > 0:
+                loop = asyncio.get_running_loop()
+                self._settling[key] = loop.call_later(wait, self._settled, key)
+                return
+        self._ready.put_nowait(key)
+
+    def _settled(self, key: str) -> None:
+        del self._settling[key]
+        self._settled_at[key] = time.perf_counter()
+        self._schedule(key)  # waits again if the user kept typing
+
+    # ── Lifecycle ────────────────────────────────────────
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._consume(), name=f"telegram_update_consumer_{i}")
+            for i in range(self.consumers)
+        ]
+        log.info("telegram.update_queue_started", consumers=self.consumers)
+
+    async def stop(self, drain_s: float = 10.0) -> None:
+        """Give queued and in-flight updates ``drain_s`` to finish, then cancel."""
+        deadline = time.perf_counter() + drain_s
+        while (self._depth or self._in_flight) and time.perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+        for timer in self._settling.values():
+            timer.cancel()
+        self._settling.clear()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._depth:
+            log.warning("telegram.update_queue_dropped", dropped=self._depth)
+        log.info("telegram.update_queue_stopped", **self.stats)
+
+    # ── Consumers ────────────────────────────────────────
+
+    async def _consume(self) -> None:
+        while True:
+            key = await self._ready.get()
+            queue = self._pending[key]
+            self._in_flight.add(key)
+            # The coalescing wait is deliberate, not backlog
+            since = max(queue[0].enqueued_at, self._settled_at.pop(key, 0.0))
+            self.lag.observe((time.perf_counter() - since) * 1000)
+            start = None
+            try:
+                items = self._take(queue)
+                start = time.perf_counter()
+                await self._run(items)
+            finally:
+                if start is not None:
+                    self.duration.observe((time.perf_counter() - start) * 1000)
+                self._in_flight.discard(key)
+                if queue:
+                    self._schedule(key)
+                else:
+                    del self._pending[key]
+                    self._last_submit.pop(key, None)
+
+    def _take(self, queue: deque[_Queued]) -> list[_Queued]:
+        """The head update, plus the text messages right behind it if it coalesces."""
+        items = [queue.popleft()]
+        head = items[0].update
+        if self.coalesce_window_s and is_coalescible(head):
+            while (
+                queue
+                and len(items) < MAX_MESSAGES
+                and is_coalescible(queue[0].update)
+                and same_chat(head, queue[0].update)
+            ):
+                items.append(queue.popleft())
+        self._depth -= len(items)
+        return items
+
+    async def _run(self, items: list[_Queued]) -> None:
+        update_ids = [item.update.update_id for item in items]
+        try:
+            update = merge_updates([item.update for item in items])
+            if len(items) > 1:
+                self.stats["coalesced"] += len(items) - 1
+                log.info("telegram.updates_coalesced", update_ids=update_ids)
+            await self._process(update)
+            self.stats["processed"] += 1
+        except Exception as e:
+            self.stats["failed"] += 1
+            log.error(
+                "telegram.update_failed",
+                update_ids=update_ids,
+                error=str(e) or type(e).__name__,
+            )
+
+    # ── Metrics ──────────────────────────────────────────
+
+    def snapshot(self) -> dict:
+        oldest = min(
+            (queue[0].enqueued_at for queue in self._pending.values() if queue),
+            default=None,
+        )
+        return {
+            "depth": self._depth,
+            "in_flight": len(self._in_flight),
+            "keys_waiting": self._ready.qsize(),
+            "keys_settling": len(self._settling),
+            "oldest_wait_ms": round((time.perf_counter() - oldest) * 1000)
+            if oldest is not None
+            else 0,
+            "consumers": self.consumers,
+            **self.stats,
+            "lag": self.lag.snapshot(),
+            "duration": self.duration.snapshot(),
+        }
@@ -8,6 +8,16 @@ import pytest
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(autouse=True)
+def _clear_tenant_cache():
+    """Tenant rows cached by one test must not leak into the next."""
+    from cascade_api.db.tenants import get_tenant_cache
+
+    get_tenant_cache().clear()
+    yield
+    get_tenant_cache().clear()
+
+
 @pytest.fixture
 def mock_supabase():
     """Return a MagicMock that acts like a Supabase client."""
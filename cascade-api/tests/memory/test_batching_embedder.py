@@ -0,0 +1,154 @@
+import asyncio
+from contextvars import ContextVar
+
+import pytest
+
+from cascade_api.memory.embedders.batching import BatchingEmbedder
+from cascade_api.memory.embedders.cached import CachedEmbedder
+from cascade_api.memory.embedders.fake import FakeEmbedder
+
+
+class FailingEmbedder(FakeEmbedder):
+    async def embed_batch(self, texts):
+        self.requests.append(texts)
+        raise RuntimeError("quota")
+
+
+tenant: ContextVar[str | None] = ContextVar("tenant", default=None)
+
+
+class TestBatchingEmbedder:
+    async def test_concurrent_calls_share_one_request(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = BatchingEmbedder(inner, window_s=0.01)
+
+        vectors = await asyncio.gather(*(embedder.embed(t) for t in ["a", "b", "c"]))
+
+        assert inner.requests == [["a", "b", "c"]]
+        assert vectors == [inner._vector(t) for t in ["a", "b", "c"]]
+        assert embedder.snapshot()["avg_batch_size"] == 3
+
+    async def test_full_batch_is_sent_without_waiting(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = BatchingEmbedder(inner, window_s=60, max_batch_size=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(embedder.embed(t) for t in ["a", "b", "c", "d"])), timeout=1
+        )
+
+        assert inner.requests == [["a", "b"], ["c", "d"]]
+        assert len(results) == 4
+
+    async def test_calls_collect_behind_a_saturated_batch(self):
+        release = asyncio.Event()
+
+        class SlowEmbedder(FakeEmbedder):
+            async def embed_batch(self, texts):
+                await release.wait()
+                return await super().embed_batch(texts)
+
+        inner = SlowEmbedder(dimensions=3)
+        embedder = BatchingEmbedder(inner, window_s=0.001, max_in_flight=1)
+        first = asyncio.create_task(embedder.embed("a"))
+        await asyncio.sleep(0.01)  # "a" is in flight
+        rest = [asyncio.create_task(embedder.embed(t)) for t in ["b", "c"]]
+        await asyncio.sleep(0.01)
+        assert embedder.snapshot()["pending"] == 2
+
+        release.set()
+        await asyncio.gather(first, *rest)
+
+        assert inner.requests == [["a"], ["b", "c"]]
+
+    async def test_duplicate_texts_are_embedded_once(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = BatchingEmbedder(inner, window_s=0.01)
+
+        first, second = await asyncio.gather(embedder.embed("a"), embedder.embed("a"))
+
+        assert inner.requests == [["a"]]
+        assert first == second
+        assert first is not second
+
+    async def test_failure_reaches_every_caller(self):
+        embedder = BatchingEmbedder(FailingEmbedder(dimensions=3), window_s=0.01)
+
+        results = await asyncio.gather(
+            embedder.embed("a"), embedder.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_small_batches_are_coalesced(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = BatchingEmbedder(inner, window_s=0.01, max_batch_size=10)
+
+        await asyncio.gather(embedder.embed_batch(["a", "b"]), embedder.embed("c"))
+        await embedder.embed_batch([str(i) for i in range(10)])  # full: sent directly
+
+        assert inner.requests == [["a", "b", "c"], [str(i) for i in range(10)]]
+
+    async def test_zero_window_disables_batching(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = BatchingEmbedder(inner, window_s=0)
+
+        await asyncio.gather(embedder.embed("a"), embedder.embed("b"))
+
+        assert inner.requests == [["a"], ["b"]]
+
+    async def test_cancelled_caller_does_not_break_the_batch(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = BatchingEmbedder(inner, window_s=0.01)
+
+        cancelled = asyncio.create_task(embedder.embed("a"))
+        kept = asyncio.create_task(embedder.embed("b"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await kept == inner._vector("b")
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+    async def test_cache_misses_from_concurrent_callers_are_batched(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = CachedEmbedder(BatchingEmbedder(inner, window_s=0.01))
+
+        await asyncio.gather(embedder.embed("a"), embedder.embed("b"))
+        await embedder.embed("a")
+
+        assert inner.requests == [["a", "b"]]
+        assert embedder.model == "fake"
+
+    async def test_usage_is_reported_per_tenant(self):
+        inner = FakeEmbedder(dimensions=3)
+        usage = []
+        embedder = BatchingEmbedder(
+            inner,
+            window_s=0.01,
+            usage_hook=lambda **kw: usage.append(kw),
+            tenant_of=tenant.get,
+        )
+
+        async def embed_as(tenant_id, text):
+            tenant.set(tenant_id)
+            return await embedder.embed(text)
+
+        await asyncio.gather(embed_as("t-1", "aa"), embed_as("t-2", "bbb"), embed_as("t-1", "c"))
+
+        assert inner.requests == [["aa", "bbb", "c"]]
+        assert {u["tenant_id"]: u["chars"] for u in usage} == {"t-1": 3, "t-2": 3}
+        assert all(u["ok"] and u["model"] == "fake" for u in usage)
+
+    async def test_unbatched_usage_goes_to_the_caller(self):
+        usage = []
+        embedder = BatchingEmbedder(
+            FakeEmbedder(dimensions=3),
+            window_s=0,
+            usage_hook=lambda **kw: usage.append(kw),
+            tenant_of=tenant.get,
+        )
+        tenant.set("t-1")
+
+        await embedder.embed_batch(["a", "a"])
+
+        assert [(u["tenant_id"], u["chars"]) for u in usage] == [("t-1", 2)]
@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock
+
+from cascade_api.memory.embedders.cached import (
+    CachedEmbedder,
+    SupabaseEmbeddingCache,
+    cache_key,
+    normalize_text,
+)
+from cascade_api.memory.embedders.fake import FakeEmbedder
+
+
+class DictStore:
+    def __init__(self, fail: bool = False):
+        self.rows: dict[str, list[float]] = {}
+        self.fail = fail
+
+    async def get_many(self, keys):
+        if self.fail:
+            raise RuntimeError("db down")
+        return {k: self.rows[k] for k in keys if k in self.rows}
+
+    async def put_many(self, model, dimensions, vectors):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.rows.update(vectors)
+
+
+class TestCacheKey:
+    def test_whitespace_is_normalized(self):
+        assert normalize_text("  outreach\n progress ") == "outreach progress"
+        assert cache_key("m", 3, "outreach progress") == cache_key("m", 3, " outreach  progress")
+
+    def test_model_and_dimensions_are_part_of_the_key(self):
+        keys = {cache_key("m", 3, "x"), cache_key("other", 3, "x"), cache_key("m", 4, "x")}
+        assert len(keys) == 3
+
+
+class TestCachedEmbedder:
+    async def test_repeat_query_is_served_from_memory(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = CachedEmbedder(inner)
+
+        first = await embedder.embed("energy patterns")
+        second = await embedder.embed("energy  patterns ")
+
+        assert first == second == inner._vector("energy patterns")
+        assert inner.requests == [["energy patterns"]]
+        assert embedder.stats == {"hits": 1, "store_hits": 0, "misses": 1, "store_errors": 0}
+
+    async def test_batch_embeds_only_misses_once_each(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = CachedEmbedder(inner)
+        await embedder.embed("a")
+
+        vectors = await embedder.embed_batch(["a", "b", "b", "c"])
+
+        assert inner.requests == [["a"], ["b", "c"]]
+        assert vectors == [inner._vector(t) for t in ["a", "b", "b", "c"]]
+
+    async def test_lru_evicts_least_recently_used(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = CachedEmbedder(inner, max_entries=2)
+        for text in ["a", "b", "a", "c"]:  # "b" is the oldest when "c" arrives
+            await embedder.embed(text)
+
+        await embedder.embed("a")
+        await embedder.embed("b")
+
+        assert inner.requests == [["a"], ["b"], ["c"], ["b"]]
+        assert embedder.snapshot()["entries"] == 2
+
+    async def test_persistent_tier_is_shared(self):
+        store = DictStore()
+        await CachedEmbedder(FakeEmbedder(dimensions=3), store=store).embed("a")
+
+        inner = FakeEmbedder(dimensions=3)  # e.g. another replica
+        embedder = CachedEmbedder(inner, store=store)
+        assert await embedder.embed("a") == inner._vector("a")
+        assert await embedder.embed("a") == inner._vector("a")
+
+        assert inner.requests == []
+        assert embedder.stats["store_hits"] == 1
+        assert embedder.stats["hits"] == 1
+
+    async def test_store_failures_fall_back_to_embedder(self):
+        inner = FakeEmbedder(dimensions=3)
+        embedder = CachedEmbedder(inner, store=DictStore(fail=True))
+
+        assert await embedder.embed("a") == inner._vector("a")
+        assert embedder.stats["store_errors"] == 2  # read and write
+
+    async def test_returned_vectors_are_copies(self):
+        embedder = CachedEmbedder(FakeEmbedder(dimensions=3))
+        (await embedder.embed("a")).append(9.0)
+        assert len(await embedder.embed("a")) == 3
+
+    async def test_model_and_dimensions_come_from_embedder(self):
+        embedder = CachedEmbedder(FakeEmbedder(dimensions=5))
+        assert embedder.model == "fake"
+        assert embedder.dimensions == 5
+
+
+class TestSupabaseEmbeddingCache:
+    async def test_get_many_selects_by_key(self):
+        sb = MagicMock()
+        chain = sb.table.return_value.select.return_value.in_.return_value
+        chain.execute.return_value = MagicMock(data=[{"key": "k1", "embedding": [0.5]}])
+
+        assert await SupabaseEmbeddingCache(sb).get_many(["k1", "k2"]) == {"k1": [0.5]}
+        sb.table.assert_called_with("embedding_cache")
+        sb.table.return_value.select.return_value.in_.assert_called_with("key", ["k1", "k2"])
+
+    async def test_put_many_upserts_rows(self):
+        sb = MagicMock()
+        await SupabaseEmbeddingCache(sb).put_many("m", 2, {"k1": [0.5, 0.5]})
+
+        rows = sb.table.return_value.upsert.call_args.args[0]
+        assert rows == [{"key": "k1", "model": "m", "dimensions": 2, "embedding": [0.5, 0.5]}]
+        assert sb.table.return_value.upsert.call_args.kwargs["ignore_duplicates"] is True
@@ -2,6 +2,8 @@ import pytest
 from cascade_api.memory.client import MemoryClient
 from cascade_api.memory.stores.memory import InMemoryStore
 from cascade_api.memory.embedders.fake import FakeEmbedder
+from cascade_api.memory.errors import DimensionMismatchError
+from cascade_api.memory.models import MemoryRecord
 
 
 @pytest.fixture
@@ -96,3 +98,12 @@ class TestTenantScopedClient:
         await scoped.link(id1, id2, "supports")
         links = await scoped.get_related(id1)
         assert len(links) == 1
+
+
+class TestClientInitialize:
+    async def test_passes_embedder_dimensions_to_store(self, client):
+        await client.initialize()
+        with pytest.raises(DimensionMismatchError):
+            await client.store.save(
+                "t1", MemoryRecord(id="", content="x", memory_type="fact", embedding=[1.0])
+            )
@@ -28,3 +28,9 @@ class TestFakeEmbedder:
         results = await embedder.embed_batch(["a", "b", "c"])
         assert len(results) == 3
         assert all(len(v) == 768 for v in results)
+
+    async def test_embed_batch_chunks_like_the_real_embedder(self):
+        embedder = FakeEmbedder(dimensions=8, max_batch_items=2)
+        results = await embedder.embed_batch(["a", "b", "c"])
+        assert embedder.requests == [["a", "b"], ["c"]]
+        assert results[2] == await embedder.embed("c")
@@ -1,6 +1,14 @@
+import asyncio
+import math
 import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
-from cascade_api.memory.embedders.gemini import GeminiEmbedder
+from google.genai.errors import ClientError, ServerError
+
+from cascade_api.memory.embedders import gemini
+from cascade_api.memory.embedders.chunking import chunk_texts
+from cascade_api.memory.embedders.gemini import NATIVE_DIMENSIONS, GeminiEmbedder
 
 SKIP = not os.environ.get("GEMINI_API_KEY")
 
@@ -12,14 +20,159 @@ class TestGeminiEmbedder:
         return GeminiEmbedder(api_key=os.environ["GEMINI_API_KEY"])
 
     def test_dimensions(self, embedder):
-        assert embedder.dimensions == 3072
+        assert embedder.dimensions == 768
 
     async def test_embed(self, embedder):
         vec = await embedder.embed("hello world")
-        assert len(vec) == 3072
+        assert len(vec) == 768
         assert all(isinstance(v, float) for v in vec)
+        assert math.isclose(math.hypot(*vec), 1.0, rel_tol=1e-6)
 
     async def test_embed_batch(self, embedder):
         vecs = await embedder.embed_batch(["a", "b"])
         assert len(vecs) == 2
-        assert all(len(v) == 3072 for v in vecs)
+        assert all(len(v) == 768 for v in vecs)
+
+
+# ── Batching, concurrency and retries (mocked API) ───────
+
+
+def _response(contents: list[str]):
+    return MagicMock(embeddings=[MagicMock(values=[float(len(t)), 0.0]) for t in contents])
+
+
+def _mock_client(side_effect=None):
+    client = MagicMock()
+    client.aio.models.embed_content = AsyncMock(
+        side_effect=side_effect or (lambda *, model, contents, config: _response(contents))
+    )
+    return client
+
+
+def _quota_error():
+    return ClientError(429, {"error": {"code": 429, "status": "RESOURCE_EXHAUSTED"}})
+
+
+class TestChunking:
+    def test_splits_on_item_count(self):
+        assert [len(c) for c in chunk_texts(["x"] * 5, max_items=2)] == [2, 2, 1]
+
+    def test_splits_on_total_size_and_keeps_order(self):
+        chunks = chunk_texts(["aaaa", "bb", "cccc", "d"], max_chars=6)
+        assert chunks == [["aaaa", "bb"], ["cccc", "d"]]
+
+    def test_oversized_text_gets_its_own_chunk(self):
+        assert chunk_texts(["a", "x" * 50, "b"], max_chars=10) == [["a"], ["x" * 50], ["b"]]
+
+
+class TestGeminiBatching:
+    async def test_batch_is_one_request_per_chunk(self):
+        client = _mock_client()
+        embedder = GeminiEmbedder(
+            api_key="k", output_dimensionality=NATIVE_DIMENSIONS, max_batch_items=2
+        )
+        with patch.object(gemini, "_get_client", return_value=client):
+            vectors = await embedder.embed_batch(["a", "bb", "ccc"])
+
+        assert [v[0] for v in vectors] == [1.0, 2.0, 3.0]  # order preserved
+        calls = client.aio.models.embed_content.await_args_list
+        assert [c.kwargs["contents"] for c in calls] == [["a", "bb"], ["ccc"]]
+
+    async def test_embed_is_a_single_item_batch(self):
+        client = _mock_client()
+        with patch.object(gemini, "_get_client", return_value=client):
+            embedder = GeminiEmbedder(api_key="k", output_dimensionality=NATIVE_DIMENSIONS)
+            vector = await embedder.embed("hello")
+
+        assert vector == [5.0, 0.0]
+        assert client.aio.models.embed_content.await_args.kwargs["contents"] == ["hello"]
+
+    async def test_empty_batch_makes_no_request(self):
+        client = _mock_client()
+        with patch.object(gemini, "_get_client", return_value=client):
+            assert await GeminiEmbedder(api_key="k").embed_batch([]) == []
+        client.aio.models.embed_content.assert_not_awaited()
+
+    async def test_concurrency_is_bounded(self):
+        in_flight = peak = 0
+
+        async def slow(*, model, contents, config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _response(contents)
+
+        embedder = GeminiEmbedder(api_key="k", max_concurrency=2, max_batch_items=1)
+        with patch.object(gemini, "_get_client", return_value=_mock_client(slow)):
+            await embedder.embed_batch([str(i) for i in range(6)])
+
+        assert peak == 2
+
+    async def test_quota_errors_are_retried_with_backoff(self):
+        client = _mock_client([_quota_error(), ServerError(503, {}), _response(["a"])])
+        hook = MagicMock()
+        embedder = GeminiEmbedder(
+            api_key="k", usage_hook=hook, output_dimensionality=NATIVE_DIMENSIONS
+        )
+        with (
+            patch.object(gemini, "_get_client", return_value=client),
+            patch.object(gemini.asyncio, "sleep", new_callable=AsyncMock) as sleep,
+        ):
+            assert await embedder.embed("a") == [1.0, 0.0]
+
+        assert client.aio.models.embed_content.await_count == 3
+        assert sleep.await_count == 2
+        assert sleep.await_args_list[1].args[0] > sleep.await_args_list[0].args[0]
+        assert [c.kwargs["ok"] for c in hook.call_args_list] == [False, False, True]
+
+    async def test_gives_up_after_max_retries(self):
+        client = _mock_client(_quota_error())
+        embedder = GeminiEmbedder(api_key="k", max_retries=2)
+        with (
+            patch.object(gemini, "_get_client", return_value=client),
+            patch.object(gemini.asyncio, "sleep", new_callable=AsyncMock),
+            pytest.raises(ClientError),
+        ):
+            await embedder.embed("a")
+
+        assert client.aio.models.embed_content.await_count == 3
+
+    async def test_other_client_errors_are_not_retried(self):
+        client = _mock_client(ClientError(400, {"error": {"code": 400}}))
+        with (
+            patch.object(gemini, "_get_client", return_value=client),
+            pytest.raises(ClientError),
+        ):
+            await GeminiEmbedder(api_key="k").embed("a")
+
+        assert client.aio.models.embed_content.await_count == 1
+
+
+class TestOutputDimensionality:
+    async def test_requests_reduced_width_and_renormalizes(self):
+        client = _mock_client(lambda *, model, contents, config: _response(contents))
+        embedder = GeminiEmbedder(api_key="k")
+        with patch.object(gemini, "_get_client", return_value=client):
+            vector = await embedder.embed("abc")
+
+        assert embedder.dimensions == 768
+        config = client.aio.models.embed_content.await_args.kwargs["config"]
+        assert config == {"output_dimensionality": 768}
+        assert vector == [1.0, 0.0]  # [3.0, 0.0] scaled to unit length
+
+    async def test_full_width_is_passed_through(self):
+        client = _mock_client()
+        embedder = GeminiEmbedder(api_key="k", output_dimensionality=NATIVE_DIMENSIONS)
+        with patch.object(gemini, "_get_client", return_value=client):
+            vector = await embedder.embed("abc")
+
+        assert embedder.dimensions == NATIVE_DIMENSIONS
+        assert client.aio.models.embed_content.await_args.kwargs["config"] is None
+        assert vector == [3.0, 0.0]
+
+    @pytest.mark.parametrize("dims", [0, NATIVE_DIMENSIONS + 1])
+    def test_rejects_unsupported_width(self, dims):
+        with pytest.raises(ValueError):
+            GeminiEmbedder(api_key="k", output_dimensionality=dims)
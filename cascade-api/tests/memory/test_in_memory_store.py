@@ -1,7 +1,12 @@
 import pytest
 from cascade_api.memory.stores.memory import InMemoryStore
 from cascade_api.memory.models import MemoryRecord
-from cascade_api.memory.errors import ConcurrencyError, MemoryNotFoundError, TenantIsolationError
+from cascade_api.memory.errors import (
+    ConcurrencyError,
+    DimensionMismatchError,
+    MemoryNotFoundError,
+    TenantIsolationError,
+)
 
 
 class TestCoreMemory:
@@ -97,6 +102,13 @@ class TestSearch:
         assert results[0].memory.content == "python"
         assert results[0].similarity > results[1].similarity
 
+    async def test_save_rejects_wrong_dimensions_after_initialize(self, store):
+        await store.initialize(3)
+        with pytest.raises(DimensionMismatchError):
+            await store.save(
+                "t1", MemoryRecord(id="", content="x", memory_type="fact", embedding=[1.0, 0.0])
+            )
+
     async def test_search_excludes_no_embedding(self, store):
         await store.save("t1", MemoryRecord(id="", content="no vec", memory_type="fact"))
         results = await store.search("t1", [1.0, 0.0], count=5, threshold=0.0)
@@ -4,7 +4,11 @@ import pytest
 from unittest.mock import MagicMock
 from cascade_api.memory.stores.supabase import SupabaseStore
 from cascade_api.memory.models import MemoryRecord
-from cascade_api.memory.errors import ConcurrencyError, TenantIsolationError
+from cascade_api.memory.errors import (
+    ConcurrencyError,
+    DimensionMismatchError,
+    TenantIsolationError,
+)
 
 
 def _mock_supabase():
@@ -110,6 +114,22 @@ class TestSearch:
         assert results[0].memory.content == "python"
         assert results[0].similarity == 0.95
 
+    async def test_search_passes_oversample(self):
+        sb = _mock_supabase()
+        sb.rpc.return_value.execute.return_value = MagicMock(data=[])
+        store = SupabaseStore(sb, search_oversample=8)
+        await store.search("t1", [0.1, 0.2], count=5, threshold=0.5)
+        sb.rpc.assert_called_once_with(
+            "match_memories",
+            {
+                "query_embedding": [0.1, 0.2],
+                "match_tenant_id": "t1",
+                "match_count": 5,
+                "match_threshold": 0.5,
+                "match_oversample": 8,
+            },
+        )
+
 
 class TestDelete:
     async def test_delete_calls_supabase(self):
@@ -152,3 +172,34 @@ class TestLinks:
         store = SupabaseStore(sb)
         with pytest.raises(TenantIsolationError):
             await store.add_link("t1", "m1", "m2", "related")
+
+
+class TestInitialize:
+    @staticmethod
+    def _config(sb, data):
+        chain = sb.table.return_value.select.return_value.eq.return_value
+        chain.execute.return_value = MagicMock(data=data)
+
+    async def test_matching_dimensions_pass(self):
+        sb = _mock_supabase()
+        self._config(sb, [{"value": "768"}])
+        await SupabaseStore(sb).initialize(768)
+        sb.table.assert_called_with("_cascade_memory_config")
+
+    async def test_mismatch_raises(self):
+        sb = _mock_supabase()
+        self._config(sb, [{"value": "768"}])
+        with pytest.raises(DimensionMismatchError, match="VECTOR\\(768\\)"):
+            await SupabaseStore(sb).initialize(3072)
+
+    async def test_missing_config_is_skipped(self):
+        sb = _mock_supabase()
+        self._config(sb, [])
+        await SupabaseStore(sb).initialize(3072)
+
+    async def test_unreadable_config_is_skipped(self):
+        sb = _mock_supabase()
+        sb.table.return_value.select.return_value.eq.return_value.execute.side_effect = (
+            RuntimeError("relation does not exist")
+        )
+        await SupabaseStore(sb).initialize(3072)
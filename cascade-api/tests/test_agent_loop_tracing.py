@@ -42,11 +42,11 @@ async def test_run_agent_creates_langfuse_trace(mock_deps):
 
     with (
         patch("cascade_api.agent.loop.get_supabase", return_value=mock_sb),
-        patch("cascade_api.agent.loop.anthropic.AsyncAnthropic", return_value=mock_client),
+        patch("cascade_api.llm.gateway.get_client", return_value=mock_client),
         patch(
-            "cascade_api.agent.loop.build_system_prompt",
+            "cascade_api.agent.loop.build_system_blocks",
             new_callable=AsyncMock,
-            return_value="system prompt",
+            return_value=[{"type": "text", "text": "system prompt"}],
         ),
         patch("cascade_api.agent.loop.get_langfuse", return_value=mock_langfuse),
         patch("cascade_api.agent.loop.should_eval", return_value=False),
@@ -81,11 +81,11 @@ async def test_run_agent_creates_generation_span(mock_deps):
 
     with (
         patch("cascade_api.agent.loop.get_supabase", return_value=mock_sb),
-        patch("cascade_api.agent.loop.anthropic.AsyncAnthropic", return_value=mock_client),
+        patch("cascade_api.llm.gateway.get_client", return_value=mock_client),
         patch(
-            "cascade_api.agent.loop.build_system_prompt",
+            "cascade_api.agent.loop.build_system_blocks",
             new_callable=AsyncMock,
-            return_value="system prompt",
+            return_value=[{"type": "text", "text": "system prompt"}],
         ),
         patch("cascade_api.agent.loop.get_langfuse", return_value=mock_langfuse),
         patch("cascade_api.agent.loop.should_eval", return_value=False),
@@ -113,11 +113,11 @@ async def test_run_agent_works_without_langfuse(mock_deps):
 
     with (
         patch("cascade_api.agent.loop.get_supabase", return_value=mock_sb),
-        patch("cascade_api.agent.loop.anthropic.AsyncAnthropic", return_value=mock_client),
+        patch("cascade_api.llm.gateway.get_client", return_value=mock_client),
         patch(
-            "cascade_api.agent.loop.build_system_prompt",
+            "cascade_api.agent.loop.build_system_blocks",
             new_callable=AsyncMock,
-            return_value="system prompt",
+            return_value=[{"type": "text", "text": "system prompt"}],
         ),
         patch("cascade_api.agent.loop.get_langfuse", return_value=None),
         patch("cascade_api.agent.loop.should_eval", return_value=False),
@@ -174,11 +174,11 @@ async def test_run_agent_traces_tool_calls():
 
     with (
         patch("cascade_api.agent.loop.get_supabase", return_value=mock_sb),
-        patch("cascade_api.agent.loop.anthropic.AsyncAnthropic", return_value=mock_client),
+        patch("cascade_api.llm.gateway.get_client", return_value=mock_client),
         patch(
-            "cascade_api.agent.loop.build_system_prompt",
+            "cascade_api.agent.loop.build_system_blocks",
             new_callable=AsyncMock,
-            return_value="system",
+            return_value=[{"type": "text", "text": "system"}],
         ),
         patch("cascade_api.agent.loop.get_langfuse", return_value=mock_langfuse),
         patch("cascade_api.agent.loop.should_eval", return_value=False),
@@ -205,3 +205,42 @@ async def test_run_agent_traces_tool_calls():
         span_kwargs = mock_trace.span.call_args[1]
         assert span_kwargs["name"] == "tool_recall"
         mock_tool_span.end.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_run_agent_queues_evals_instead_of_awaiting(mock_deps):
+    """Sampled traces are scored by a job worker, not on the reply path."""
+    mock_sb, mock_client, _ = mock_deps
+
+    mock_langfuse = MagicMock()
+    mock_trace = MagicMock(id="trace-1")
+    mock_langfuse.trace.return_value = mock_trace
+
+    with (
+        patch("cascade_api.agent.loop.get_supabase", return_value=mock_sb),
+        patch("cascade_api.llm.gateway.get_client", return_value=mock_client),
+        patch(
+            "cascade_api.agent.loop.build_system_blocks",
+            new_callable=AsyncMock,
+            return_value=[{"type": "text", "text": "system"}],
+        ),
+        patch("cascade_api.agent.loop.get_langfuse", return_value=mock_langfuse),
+        patch("cascade_api.agent.loop.should_eval", return_value=True),
+        patch("cascade_api.jobs.enqueue", new_callable=AsyncMock) as mock_enqueue,
+        patch("cascade_api.observability.evals.score_trace", new_callable=AsyncMock) as mock_score,
+    ):
+        from cascade_api.agent.loop import run_agent
+
+        await run_agent(
+            tenant_id="tenant-123",
+            user_message="How am I doing?",
+            conversation_history=[],
+            api_key="sk-test",
+        )
+
+    mock_score.assert_not_called()
+    kind, payload = mock_enqueue.call_args.args
+    assert kind == "evals.score"
+    assert payload["trace_id"] == "trace-1"
+    assert payload["tenant_id"] == "tenant-123"
+    assert "api_key" not in payload
@@ -0,0 +1,139 @@
+"""Tests for concurrent tool execution within one agent turn."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cascade_api.agent.loop import _group_tool_calls, _run_tool_calls
+from cascade_api.agent.tools import _EXECUTORS, READ_ONLY_TOOLS
+
+
+def _block(name: str, block_id: str | None = None, inp: dict | None = None):
+    block = MagicMock()
+    block.type = "tool_use"
+    block.name = name
+    block.id = block_id or f"id-{name}"
+    block.input = inp or {}
+    return block
+
+
+def test_read_only_tools_are_known_tools():
+    """Every read-only entry must name a real executor."""
+    assert READ_ONLY_TOOLS <= set(_EXECUTORS)
+
+
+def test_group_tool_calls_batches_consecutive_reads():
+    """Reads group together; each write is isolated and keeps its position."""
+    blocks = [
+        _block("get_tasks"),
+        _block("get_status"),
+        _block("complete_task"),
+        _block("recall"),
+        _block("add_task"),
+        _block("move_task"),
+    ]
+
+    groups = _group_tool_calls(blocks)
+
+    assert [[b.name for b in g] for g in groups] == [
+        ["get_tasks", "get_status"],
+        ["complete_task"],
+        ["recall"],
+        ["add_task"],
+        ["move_task"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reads_run_concurrently_and_results_keep_order():
+    """Independent reads overlap but tool_result blocks stay in request order."""
+
+    async def fake_execute_tool(name, inp, sb, tid, cache=None):
+        # Later calls finish first to prove ordering isn't completion order
+        await asyncio.sleep({"get_tasks": 0.15, "get_status": 0.1, "recall": 0.05}[name])
+        return json.dumps({"tool": name})
+
+    blocks = [_block("get_tasks"), _block("get_status"), _block("recall")]
+
+    with patch("cascade_api.agent.loop.execute_tool", side_effect=fake_execute_tool):
+        start = time.perf_counter()
+        outcomes = await _run_tool_calls(blocks, MagicMock(), "tenant-1")
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.25
+    assert [r["tool_use_id"] for r, _ in outcomes] == ["id-get_tasks", "id-get_status", "id-recall"]
+    assert [json.loads(r["content"])["tool"] for r, _ in outcomes] == [
+        "get_tasks",
+        "get_status",
+        "recall",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_writes_run_sequentially_in_declared_order():
+    """A write must not start until the calls before it have finished."""
+    events: list[str] = []
+
+    async def fake_execute_tool(name, inp, sb, tid, cache=None):
+        events.append(f"start:{inp['n']}")
+        await asyncio.sleep(0.01)
+        events.append(f"end:{inp['n']}")
+        return "{}"
+
+    blocks = [
+        _block("get_tasks", "a", {"n": 1}),
+        _block("complete_task", "b", {"n": 2}),
+        _block("add_task", "c", {"n": 3}),
+    ]
+
+    with patch("cascade_api.agent.loop.execute_tool", side_effect=fake_execute_tool):
+        await _run_tool_calls(blocks, MagicMock(), "tenant-1")
+
+    assert events == ["start:1", "end:1", "start:2", "end:2", "start:3", "end:3"]
+
+
+@pytest.mark.asyncio
+async def test_failed_tool_returns_error_result_without_log_entry():
+    """One failing read should not cancel its siblings."""
+
+    async def fake_execute_tool(name, inp, sb, tid, cache=None):
+        if name == "get_status":
+            raise RuntimeError("boom")
+        return "{}"
+
+    blocks = [_block("get_tasks"), _block("get_status")]
+
+    with patch("cascade_api.agent.loop.execute_tool", side_effect=fake_execute_tool):
+        outcomes = await _run_tool_calls(blocks, MagicMock(), "tenant-1")
+
+    ok, failed = outcomes
+    assert ok[1] == {"tool": "get_tasks", "input": {}, "output": "{}"}
+    assert failed[0]["is_error"] is True
+    assert "boom" in failed[0]["content"]
+    assert failed[1] is None
+
+
+@pytest.mark.asyncio
+async def test_tool_spans_record_parallel_group():
+    """Each tool gets its own span tagged with its batch."""
+    trace = MagicMock()
+
+    async def fake_execute_tool(name, inp, sb, tid, cache=None):
+        return "{}"
+
+    blocks = [_block("get_tasks"), _block("get_status"), _block("complete_task")]
+
+    with patch("cascade_api.agent.loop.execute_tool", side_effect=fake_execute_tool):
+        await _run_tool_calls(blocks, MagicMock(), "tenant-1", trace)
+
+    metadata = {c.kwargs["name"]: c.kwargs["metadata"] for c in trace.span.call_args_list}
+    assert metadata == {
+        "tool_get_tasks": {"group": 0, "parallel": True},
+        "tool_get_status": {"group": 0, "parallel": True},
+        "tool_complete_task": {"group": 1, "parallel": False},
+    }
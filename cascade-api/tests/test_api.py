@@ -104,7 +104,7 @@ class TestLogEndpoint:
 
         with (
             patch("cascade_api.api.log.get_supabase", return_value=mock_supabase),
-            patch("cascade_api.api.log.get_anthropic") as mock_get,
+            patch("cascade_api.llm.gateway.get_client") as mock_get,
         ):
             mock_client = AsyncMock()
             mock_client.messages.create = AsyncMock(return_value=mock_msg)
@@ -136,31 +136,30 @@ class TestStatusEndpoint:
         assert data["rest_debt_days"] == 0
 
     def test_status_with_tasks(self, client, mock_supabase):
-        # Mock week tasks
-        tasks_data = [
-            {"category": "core", "completed": True, "title": "Task 1"},
-            {"category": "core", "completed": True, "title": "Task 2"},
-            {"category": "core", "completed": False, "title": "Task 3"},
-            {"category": "flex", "completed": False, "title": "Flex 1"},
-        ]
-
-        call_count = 0
-
-        def mock_execute():
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            # First call is velocity, second is tasks, etc.
-            if call_count == 2:
-                result.data = tasks_data
-            else:
-                result.data = []
-            return result
-
-        mock_supabase.table.return_value.execute = mock_execute
+        # One RPC returns the whole snapshot
+        mock_supabase.rpc.return_value.execute.return_value.data = {
+            "velocity_weeks": [],
+            "week_progress": {
+                "core_completed": 2,
+                "core_total": 3,
+                "flex_completed": 0,
+                "flex_total": 1,
+            },
+            "month_entries_count": 4,
+            "rest_debt_days": 6,
+            "active_adaptations": [],
+        }
 
-        resp = client.get("/api/status", params={"tenant_id": "test-tenant"})
+        with patch("cascade_api.api.status.get_supabase", return_value=mock_supabase):
+            resp = client.get("/api/status", params={"tenant_id": "test-tenant"})
         assert resp.status_code == 200
+        data = resp.json()
+        assert data["week_progress"]["core_rate"] == 66.7
+        assert data["coaching_line"].startswith("2/3 Core tasks done.")
+        assert "Rest debt: 6 days" in data["coaching_line"]
+        mock_supabase.rpc.assert_called_once()
+        assert mock_supabase.rpc.call_args[0][0] == "get_status_snapshot"
+        mock_supabase.table.assert_not_called()
 
 
 class TestReviewEndpoint:
@@ -216,7 +215,7 @@ class TestSteerEndpoint:
 
         mock_supabase.table.return_value.execute = mock_execute
 
-        with patch("cascade_api.steer.evaluate.get_anthropic") as mock_get:
+        with patch("cascade_api.llm.gateway.get_client") as mock_get:
             mock_client = AsyncMock()
             mock_client.messages.create = AsyncMock(return_value=mock_msg)
             mock_get.return_value = mock_client
@@ -0,0 +1,141 @@
+"""Tests for token-budgeted conversation history and rolling summaries."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cascade_api.db import conversation_history
+from cascade_api.db.conversation_history import (
+    ConversationContext,
+    estimate_tokens,
+    load_context,
+    refresh_summary,
+    schedule_summary_refresh,
+)
+
+
+def _mock_supabase(rows: list[dict], summary: dict | None = None):
+    """rows are newest-first, as the history query returns them."""
+    sb = MagicMock()
+    conversations = MagicMock()
+    conversations.select.return_value.eq.return_value.eq.return_value.order.return_value.limit.return_value.execute.return_value.data = rows
+    summaries = MagicMock()
+    summaries.select.return_value.eq.return_value.execute.return_value.data = (
+        [summary] if summary else []
+    )
+    sb.table.side_effect = lambda name: {
+        "conversations": conversations,
+        "conversation_summaries": summaries,
+    }[name]
+    return sb
+
+
+def _turns(n: int, chars: int = 40) -> list[dict]:
+    """n alternating turns, ids 1..n, returned newest-first."""
+    rows = [
+        {"id": i, "role": "user" if i % 2 else "assistant", "content": f"{i}:" + "x" * chars}
+        for i in range(1, n + 1)
+    ]
+    return list(reversed(rows))
+
+
+@pytest.mark.asyncio
+async def test_packs_recent_turns_into_budget():
+    """Only the newest turns that fit the budget are returned, oldest first."""
+    rows = _turns(10, chars=400)  # ~104 tokens each
+    sb = _mock_supabase(rows)
+
+    context = await load_context(sb, "tenant-1", token_budget=350)
+
+    ids = [int(m["content"].split(":")[0]) for m in context.messages]
+    assert ids == [9, 10]  # trimmed to start on a user turn
+    assert context.messages[0]["role"] == "user"
+    assert context.oldest_included_id == 9
+
+
+@pytest.mark.asyncio
+async def test_skips_turns_already_in_summary():
+    rows = _turns(6)
+    sb = _mock_supabase(rows, {"summary": "Earlier: set Q3 goal.", "summarized_through_id": 2})
+
+    context = await load_context(sb, "tenant-1", token_budget=10_000)
+
+    assert context.summary == "Earlier: set Q3 goal."
+    assert [int(m["content"].split(":")[0]) for m in context.messages] == [3, 4, 5, 6]
+    assert context.needs_summary_refresh is False
+
+
+@pytest.mark.asyncio
+async def test_flags_refresh_when_overflow_is_large():
+    rows = _turns(20, chars=400)
+    sb = _mock_supabase(rows)
+
+    with patch.object(conversation_history.settings, "history_summary_min_tokens", 200):
+        context = await load_context(sb, "tenant-1", token_budget=300)
+
+    assert context.needs_summary_refresh is True
+
+
+@pytest.mark.asyncio
+async def test_small_overflow_does_not_trigger_refresh():
+    rows = _turns(4, chars=400)
+    sb = _mock_supabase(rows)
+
+    with patch.object(conversation_history.settings, "history_summary_min_tokens", 10_000):
+        context = await load_context(sb, "tenant-1", token_budget=250)
+
+    assert context.needs_summary_refresh is False
+
+
+def test_estimate_tokens_grows_with_length():
+    assert estimate_tokens("") < estimate_tokens("x" * 400) < estimate_tokens("x" * 4000)
+
+
+@pytest.mark.asyncio
+async def test_refresh_summary_folds_only_new_turns():
+    """The previous summary and turns after summarized_through_id go to the model."""
+    sb = MagicMock()
+    summaries = MagicMock()
+    summaries.select.return_value.eq.return_value.execute.return_value.data = [
+        {"summary": "Old summary.", "summarized_through_id": 4}
+    ]
+    conversations = MagicMock()
+    query = conversations.select.return_value.eq.return_value.eq.return_value.gt.return_value
+    query.lt.return_value.order.return_value.limit.return_value.execute.return_value.data = [
+        {"id": 5, "role": "user", "content": "I shipped the landing page."},
+        {"id": 6, "role": "assistant", "content": "Nice work."},
+    ]
+    sb.table.side_effect = lambda name: {
+        "conversations": conversations,
+        "conversation_summaries": summaries,
+    }[name]
+
+    response = MagicMock()
+    response.content = [MagicMock(text="New summary.")]
+    with patch(
+        "cascade_api.llm.gateway.create_message", new_callable=AsyncMock, return_value=response
+    ) as mock_create:
+        folded = await refresh_summary(sb, "tenant-1", before_id=7)
+
+    assert folded == 2
+    conversations.select.return_value.eq.return_value.eq.return_value.gt.assert_called_once_with(
+        "id", 4
+    )
+    query.lt.assert_called_once_with("id", 7)
+    prompt = mock_create.call_args.kwargs["messages"][0]["content"]
+    assert "Old summary." in prompt
+    assert "I shipped the landing page." in prompt
+    upserted = summaries.upsert.call_args[0][0]
+    assert upserted["summary"] == "New summary."
+    assert upserted["summarized_through_id"] == 6
+
+
+@pytest.mark.asyncio
+async def test_schedule_refresh_is_noop_when_not_needed():
+    with patch.object(conversation_history, "refresh_summary", new_callable=AsyncMock) as mock_r:
+        schedule_summary_refresh(MagicMock(), "tenant-1", ConversationContext())
+
+    mock_r.assert_not_called()
+    assert not conversation_history._background_tasks
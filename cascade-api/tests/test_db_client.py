@@ -0,0 +1,72 @@
+"""Tests for non-blocking Supabase query execution."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from cascade_api.db.client import execute, run_sync
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_query_result():
+    """execute() should return whatever the builder's execute() returns."""
+    query = MagicMock()
+    query.execute.return_value.data = [{"id": "t-1"}]
+
+    result = await execute(query)
+
+    assert result.data == [{"id": "t-1"}]
+    query.execute.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_execute_runs_off_the_event_loop():
+    """The blocking call must run in a worker thread, not the loop thread."""
+    seen = {}
+
+    def _blocking():
+        seen["thread"] = threading.current_thread().name
+        return "ok"
+
+    query = MagicMock()
+    query.execute.side_effect = _blocking
+
+    assert await execute(query) == "ok"
+    assert seen["thread"].startswith("supabase")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_overlap():
+    """Slow queries awaited together should take ~one round trip, not N."""
+
+    def _slow():
+        time.sleep(0.1)
+        return "ok"
+
+    queries = []
+    for _ in range(5):
+        q = MagicMock()
+        q.execute.side_effect = _slow
+        queries.append(q)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(execute(q) for q in queries))
+    elapsed = time.perf_counter() - start
+
+    assert results == ["ok"] * 5
+    assert elapsed < 0.35
+
+
+@pytest.mark.asyncio
+async def test_run_sync_passes_arguments():
+    """run_sync should forward positional and keyword arguments."""
+
+    def _helper(a, b, *, c):
+        return a + b + c
+
+    assert await run_sync(_helper, 1, 2, c=3) == 6
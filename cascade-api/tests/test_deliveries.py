@@ -0,0 +1,200 @@
+"""Tests for claim-based scheduled message delivery."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cascade_api.db.deliveries import DeliveryClaim, claim_delivery, mark_failed, mark_sent
+
+TENANT = {
+    "id": "t-1",
+    "telegram_id": 111,
+    "user_id": "u1",
+    "completed_weekly_reviews": 0,
+    "review_day": 0,
+    "local_date": "2026-02-26",
+}
+
+
+def _supabase(claim_id):
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value.data = (
+        [{"id": claim_id, "attempts": 1}] if claim_id else []
+    )
+    return sb
+
+
+def _update_payloads(sb) -> list[dict]:
+    return [c.args[0] for c in sb.table.return_value.update.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_claim_delivery_returns_claim_or_none():
+    sb = _supabase(42)
+    assert await claim_delivery(sb, "t-1", "morning", date(2026, 2, 26)) == DeliveryClaim(42, 1)
+    args = sb.rpc.call_args.args
+    assert args[0] == "claim_delivery"
+    assert args[1]["p_scheduled_for"] == "2026-02-26"
+
+    assert await claim_delivery(_supabase(None), "t-1", "morning", date(2026, 2, 26)) is None
+
+
+@pytest.mark.asyncio
+async def test_mark_sent_and_failed_update_status():
+    sb = MagicMock()
+    await mark_sent(sb, DeliveryClaim(42, 2))
+    await mark_failed(sb, DeliveryClaim(42, 2), "boom")
+
+    sent, failed = _update_payloads(sb)
+    assert sent["status"] == "sent" and sent["sent_at"]
+    assert failed == {"status": "failed", "lease_expires_at": None, "last_error": "boom"}
+
+
+@pytest.mark.asyncio
+async def test_completion_requires_the_current_claim():
+    sb = MagicMock()
+    update = sb.table.return_value.update.return_value
+    owned = update.eq.return_value.eq.return_value.eq.return_value
+    owned.execute.return_value.data = []  # reclaimed by another worker
+
+    with patch("cascade_api.db.deliveries.log") as log:
+        await mark_sent(sb, DeliveryClaim(42, 2))
+        await mark_failed(sb, DeliveryClaim(42, 2), "boom")
+
+    update.eq.assert_called_with("id", 42)
+    update.eq.return_value.eq.assert_called_with("attempts", 2)
+    update.eq.return_value.eq.return_value.eq.assert_called_with("status", "claimed")
+    assert [c.args[0] for c in log.warning.call_args_list] == [
+        "delivery.claim_lost",
+        "delivery.claim_lost",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mark_failed_swallows_errors():
+    sb = MagicMock()
+    owned = sb.table.return_value.update.return_value.eq.return_value.eq.return_value.eq
+    owned.return_value.execute.side_effect = RuntimeError("db down")
+    await mark_failed(sb, DeliveryClaim(42, 1), "boom")  # lease expiry covers it
+
+
+@pytest.mark.asyncio
+async def test_lost_claim_skips_generation():
+    from cascade_api.telegram.scheduler import _send_daily_message
+
+    bot = AsyncMock()
+    with patch(
+        "cascade_api.telegram.scheduler._build_daily_message", new_callable=AsyncMock
+    ) as build:
+        assert await _send_daily_message(bot, _supabase(None), TENANT) == "skipped"
+
+    build.assert_not_called()
+    bot.send_message.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_won_claim_is_marked_sent():
+    from cascade_api.telegram.scheduler import _send_daily_message
+
+    sb = _supabase(42)
+    bot = AsyncMock()
+    with (
+        patch(
+            "cascade_api.telegram.scheduler._build_daily_message",
+            new_callable=AsyncMock,
+            return_value="Your tasks",
+        ),
+        patch("cascade_api.telegram.scheduler.track_event"),
+    ):
+        assert await _send_daily_message(bot, sb, TENANT) == "sent"
+
+    bot.send_message.assert_awaited_once()
+    assert _update_payloads(sb)[0]["status"] == "sent"
+
+
+@pytest.mark.asyncio
+async def test_generation_failure_releases_claim():
+    from cascade_api.telegram.scheduler import _send_daily_message
+
+    sb = _supabase(42)
+    with (
+        patch(
+            "cascade_api.telegram.scheduler._build_daily_message",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("overloaded"),
+        ),
+        pytest.raises(RuntimeError),
+    ):
+        await _send_daily_message(AsyncMock(), sb, TENANT)
+
+    assert _update_payloads(sb) == [
+        {"status": "failed", "lease_expires_at": None, "last_error": "overloaded"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_timeout_releases_claim():
+    from cascade_api.telegram.scheduler import _send_daily_message
+
+    async def hang(*args):
+        await asyncio.sleep(10)
+
+    sb = _supabase(42)
+    with (
+        patch("cascade_api.telegram.scheduler._build_daily_message", side_effect=hang),
+        pytest.raises(TimeoutError),
+    ):
+        await asyncio.wait_for(_send_daily_message(AsyncMock(), sb, TENANT), timeout=0.02)
+
+    assert _update_payloads(sb)[0]["last_error"] == "timed out"
+
+
+@pytest.mark.asyncio
+async def test_timeout_during_send_leaves_outcome_to_delivery():
+    from cascade_api.telegram.scheduler import _send_daily_message
+
+    async def slow_send(**kwargs):
+        await asyncio.sleep(0.05)
+
+    sb = _supabase(42)
+    bot = AsyncMock()
+    bot.send_message.side_effect = slow_send
+    with (
+        patch(
+            "cascade_api.telegram.scheduler._build_daily_message",
+            new_callable=AsyncMock,
+            return_value="Your tasks",
+        ),
+        patch("cascade_api.telegram.scheduler.track_event"),
+    ):
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(_send_daily_message(bot, sb, TENANT), timeout=0.01)
+        await asyncio.sleep(0.1)  # the shielded delivery finishes
+
+    assert [p["status"] for p in _update_payloads(sb)] == ["sent"]
+
+
+@pytest.mark.asyncio
+async def test_send_failure_releases_claim():
+    from cascade_api.telegram.scheduler import _send_daily_message
+
+    sb = _supabase(42)
+    bot = AsyncMock()
+    bot.send_message.side_effect = RuntimeError("blocked")
+    with (
+        patch(
+            "cascade_api.telegram.scheduler._build_daily_message",
+            new_callable=AsyncMock,
+            return_value="Your tasks",
+        ),
+        pytest.raises(RuntimeError),
+    ):
+        await _send_daily_message(bot, sb, TENANT)
+
+    assert _update_payloads(sb) == [
+        {"status": "failed", "lease_expires_at": None, "last_error": "blocked"}
+    ]
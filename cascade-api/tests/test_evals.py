@@ -27,7 +27,7 @@ async def test_score_trace_calls_haiku_and_posts_scores():
     mock_langfuse = MagicMock()
 
     with (
-        patch("cascade_api.observability.evals.anthropic.AsyncAnthropic", return_value=mock_client),
+        patch("cascade_api.llm.gateway.get_client", return_value=mock_client),
         patch("cascade_api.observability.evals.get_langfuse", return_value=mock_langfuse),
     ):
         from cascade_api.observability.evals import score_trace
@@ -64,7 +64,7 @@ async def test_score_trace_handles_malformed_json():
     mock_client.messages.create = AsyncMock(return_value=mock_response)
 
     with (
-        patch("cascade_api.observability.evals.anthropic.AsyncAnthropic", return_value=mock_client),
+        patch("cascade_api.llm.gateway.get_client", return_value=mock_client),
         patch("cascade_api.observability.evals.get_langfuse", return_value=MagicMock()),
     ):
         from cascade_api.observability.evals import score_trace
@@ -0,0 +1,107 @@
+"""Tests for the bounded fan-out engine used by the daily cron."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cascade_api.telegram.fanout import fan_out
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    in_flight = peak = 0
+
+    async def worker(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "sent"
+
+    report = await fan_out("test", range(10), worker, key=str, concurrency=3, timeout_s=1)
+
+    assert peak == 3
+    assert report.sent == 10
+
+
+@pytest.mark.asyncio
+async def test_slow_and_failing_items_do_not_hold_up_the_rest():
+    async def worker(item):
+        if item == "slow":
+            await asyncio.sleep(10)
+        if item == "boom":
+            raise RuntimeError("agent failed")
+        return "skipped" if item == "not-due" else "sent"
+
+    report = await fan_out(
+        "test",
+        ["slow", "boom", "ok-1", "not-due", "ok-2"],
+        worker,
+        key=lambda item: item,
+        concurrency=5,
+        timeout_s=0.05,
+    )
+
+    summary = report.summary()
+    assert (summary["sent"], summary["failed"], summary["skipped"]) == (2, 2, 1)
+    assert summary["failures"] == {"slow": "timed out after 0.05s", "boom": "agent failed"}
+    assert report.duration_ms < 1000
+    assert summary["max_item_ms"] >= 50
+
+
+@pytest.mark.asyncio
+async def test_empty_fan_out():
+    report = await fan_out("test", [], AsyncMock(), key=str, concurrency=4, timeout_s=1)
+
+    assert report.summary()["p50_item_ms"] is None
+    assert report.sent == report.failed == report.skipped == 0
+
+
+@pytest.mark.asyncio
+async def test_daily_messages_run_concurrently():
+    """Tenants' agent runs overlap instead of running back to back."""
+    tenants = [
+        {
+            "id": f"t-{i}",
+            "telegram_id": i,
+            "user_id": f"u{i}",
+            "review_day": 0,
+            "local_date": "2026-02-26",
+        }
+        for i in range(6)
+    ]
+    supabase = MagicMock()
+    claim = [{"id": 7, "attempts": 1}]
+    supabase.rpc.side_effect = lambda name, params: MagicMock(
+        execute=MagicMock(
+            return_value=MagicMock(data=tenants if name == "get_due_tenants" else claim)
+        )
+    )
+
+    async def slow_build(*args):
+        await asyncio.sleep(0.05)
+        return "Your tasks today"
+
+    with (
+        patch("cascade_api.telegram.scheduler.get_supabase", return_value=supabase),
+        patch("cascade_api.telegram.scheduler.datetime") as mock_dt,
+        patch("cascade_api.telegram.scheduler._build_daily_message", side_effect=slow_build),
+        patch("cascade_api.telegram.scheduler.track_event"),
+        patch("cascade_api.telegram.scheduler.settings.scheduled_fanout_concurrency", 6),
+    ):
+        mock_dt.now.return_value = datetime(2026, 2, 26, 9, 0, tzinfo=timezone.utc)
+
+        from cascade_api.telegram.scheduler import send_daily_messages
+
+        bot = AsyncMock()
+        result = await send_daily_messages(bot)
+
+    assert result["sent"] == 6
+    assert result["eligible"] == 6
+    assert result["duration_ms"] < 250  # ~50ms when overlapped, 300ms+ when serial
+    assert bot.send_message.await_count == 6
@@ -0,0 +1,112 @@
+"""Tests for the deterministic fast path for one-word check-ins."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cascade_api.agent import fast_path
+from cascade_api.agent.fast_path import (
+    match_intent,
+    render_review,
+    render_status,
+    render_today,
+    try_fast_path,
+)
+
+
+@pytest.mark.parametrize(
+    ("message", "intent"),
+    [
+        ("status", "status"),
+        ("  Today ", "today"),
+        ("tasks?", "tasks"),
+        ("Review", "review"),
+        ("status of my outreach goal", None),
+        ("finished 2 tasks today", None),
+    ],
+)
+def test_match_intent(message, intent):
+    assert match_intent(message) == intent
+
+
+def test_render_status():
+    text = render_status(
+        {
+            "week_progress": {
+                "core_completed": 5,
+                "core_total": 9,
+                "flex_completed": 1,
+                "flex_total": 3,
+            },
+            "velocity_trend": "up",
+            "velocity_weeks": [],
+            "monthly_progress": {"entries_count": 10, "days_elapsed": 12, "days_in_month": 31},
+            "rest_debt_days": 2,
+        }
+    )
+    assert "Core: 5/9 done (56%)" in text
+    assert "Flex: 1/3 done" in text
+    assert "trending up" in text
+    assert "without a break" not in text
+
+
+def test_render_today_escapes_titles_and_marks_done():
+    text = render_today(
+        {
+            "tasks": [
+                {"title": "Send <5> DMs & follow up", "completed": True, "category": "core"},
+                {"title": "Read", "completed": False, "category": "flex"},
+            ]
+        }
+    )
+    assert "1/2 done" in text
+    assert "✓ Send &lt;5&gt; DMs &amp; follow up" in text
+    assert "• Read <i>(flex)</i>" in text
+
+
+def test_render_today_empty():
+    assert "Nothing scheduled today." in render_today({"tasks": []})
+
+
+def test_render_review_truncates_long_lists():
+    text = render_review(
+        {
+            "planned_vs_actual": {
+                "core_planned": 10,
+                "core_completed": 10,
+                "flex_planned": 0,
+                "flex_completed": 0,
+            },
+            "completion_rate": {"core_pct": 100.0, "flex_pct": 0},
+            "what_worked": [f"Task {i}" for i in range(10)],
+            "what_didnt": [],
+            "energy": {"average": None, "low_days": 0, "high_days": 0},
+        }
+    )
+    assert "Core: 10/10 (100%)" in text
+    assert "and 2 more" in text
+    assert "Open:" not in text
+    assert "Energy" not in text
+
+
+@pytest.mark.asyncio
+async def test_try_fast_path_calls_executor_directly():
+    get_tasks = AsyncMock(return_value={"tasks": [], "count": 0})
+    sb = MagicMock()
+
+    with patch.dict(fast_path.FAST_PATH_INTENTS, {"tasks": (get_tasks, fast_path.render_tasks)}):
+        reply = await try_fast_path(sb, "tenant-1", "tasks")
+
+    get_tasks.assert_awaited_once_with(sb, "tenant-1")
+    assert "No tasks planned this week." in reply
+
+
+@pytest.mark.asyncio
+async def test_try_fast_path_falls_back_on_error_or_no_match():
+    failing = AsyncMock(side_effect=RuntimeError("db down"))
+
+    with patch.dict(fast_path.FAST_PATH_INTENTS, {"status": (failing, fast_path.render_status)}):
+        assert await try_fast_path(MagicMock(), "tenant-1", "status") is None
+    assert await try_fast_path(MagicMock(), "tenant-1", "how am I doing?") is None
@@ -0,0 +1,225 @@
+"""Tests for the Postgres-backed job queue."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cascade_api.jobs import JobWorker, enqueue, get_handler
+from cascade_api.jobs import queue
+from cascade_api.jobs.queue import job_handler, retry_delay_s
+
+
+@pytest.fixture
+def handlers():
+    """Isolate the handler registry; yields a dict kind -> AsyncMock."""
+    mocks: dict[str, AsyncMock] = {}
+    with patch.dict(queue._HANDLERS):
+
+        def register(kind, side_effect=None, **spec):
+            mocks[kind] = AsyncMock(side_effect=side_effect)
+            job_handler(kind, **spec)(mocks[kind])
+            return mocks[kind]
+
+        yield register
+
+
+def _job(kind: str, attempts: int = 1, max_attempts: int = 3, timeout_s: int = 5, **payload):
+    return {
+        "id": 7,
+        "kind": kind,
+        "payload": payload,
+        "attempts": attempts,
+        "max_attempts": max_attempts,
+        "timeout_s": timeout_s,
+    }
+
+
+def _worker(jobs: list[dict]) -> tuple[JobWorker, MagicMock]:
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value.data = jobs
+    worker = JobWorker(
+        concurrency=2, poll_interval_s=0.01, worker_id="w1", supabase_factory=lambda: sb
+    )
+    return worker, sb
+
+
+def _finish_update(sb) -> dict:
+    return sb.table.return_value.update.call_args.args[0]
+
+
+def test_core_handlers_registered():
+    for kind in ("memory.extract", "evals.score", "scheduled.daily_fanout", "memory.decay"):
+        assert get_handler(kind) is not None
+    assert get_handler("scheduled.daily_fanout").priority > get_handler("evals.score").priority
+
+
+@pytest.mark.asyncio
+async def test_enqueue_uses_handler_defaults(handlers):
+    handlers("test.work", priority=3, timeout_s=9, max_attempts=2)
+    sb = MagicMock()
+    sb.table.return_value.insert.return_value.execute.return_value.data = [{"id": 11}]
+
+    assert await enqueue("test.work", {"x": 1}, supabase=sb) == 11
+    row = sb.table.return_value.insert.call_args.args[0]
+    assert (row["payload"], row["priority"], row["timeout_s"], row["max_attempts"]) == (
+        {"x": 1},
+        3,
+        9,
+        2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_dedupe_returns_none_when_already_queued(handlers):
+    handlers("test.work")
+    sb = MagicMock()
+    sb.table.return_value.upsert.return_value.execute.return_value.data = []
+
+    assert await enqueue("test.work", dedupe_key="k", supabase=sb) is None
+    kwargs = sb.table.return_value.upsert.call_args.kwargs
+    assert kwargs == {"on_conflict": "dedupe_key", "ignore_duplicates": True}
+
+
+@pytest.mark.asyncio
+async def test_enqueue_unknown_kind():
+    with pytest.raises(ValueError):
+        await enqueue("nope", supabase=MagicMock())
+
+
+def test_retry_delay_grows_and_caps():
+    assert 8 <= retry_delay_s(1) <= 12
+    assert 16 <= retry_delay_s(2) <= 24
+    assert retry_delay_s(30) <= queue.RETRY_MAX_S * 1.2
+
+
+@pytest.mark.asyncio
+async def test_successful_job_is_marked_done(handlers):
+    handler = handlers("test.ok")
+    worker, sb = _worker([_job("test.ok", tenant_id="t1")])
+
+    assert await worker.run_once() == 1
+
+    handler.assert_awaited_once_with({"tenant_id": "t1"})
+    sb.rpc.assert_called_once_with(
+        "claim_jobs", {"p_worker": "w1", "p_limit": 2, "p_grace_seconds": queue.LEASE_GRACE_S}
+    )
+    assert _finish_update(sb)["status"] == "done"
+    # Only updated while this worker still holds the lease
+    sb.table.return_value.update.return_value.eq.return_value.eq.assert_called_with(
+        "locked_by", "w1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_with_backoff(handlers):
+    handlers("test.flaky", side_effect=RuntimeError("503"))
+    worker, sb = _worker([_job("test.flaky", attempts=1, max_attempts=3)])
+
+    await worker.run_once()
+
+    update = _finish_update(sb)
+    assert update["status"] == "queued"
+    assert update["last_error"] == "503"
+    assert worker.stats["retried"] == 1
+
+
+@pytest.mark.asyncio
+async def test_job_out_of_attempts_is_dead(handlers):
+    handlers("test.flaky", side_effect=RuntimeError("503"))
+    worker, sb = _worker([_job("test.flaky", attempts=3, max_attempts=3)])
+
+    await worker.run_once()
+
+    assert _finish_update(sb)["status"] == "dead"
+
+
+@pytest.mark.asyncio
+async def test_job_timeout_counts_as_failure():
+    async def hang(payload):
+        await asyncio.sleep(10)
+
+    with patch.dict(queue._HANDLERS):
+        job_handler("test.slow")(hang)
+        worker, sb = _worker([_job("test.slow", timeout_s=0.01)])
+        await worker.run_once()
+
+    assert _finish_update(sb)["last_error"] == "timed out"
+
+
+@pytest.mark.asyncio
+async def test_unknown_kind_is_dead():
+    worker, sb = _worker([_job("gone.kind")])
+
+    await worker.run_once()
+
+    assert _finish_update(sb)["status"] == "dead"
+
+
+@pytest.mark.asyncio
+async def test_worker_loop_runs_and_stops(handlers):
+    handler = handlers("test.ok")
+    worker, sb = _worker([])
+    sb.rpc.return_value.execute.side_effect = [
+        MagicMock(data=[_job("test.ok")]),
+        *[MagicMock(data=[]) for _ in range(1000)],
+    ]
+
+    worker.start()
+    for _ in range(50):
+        if handler.await_count:
+            break
+        await asyncio.sleep(0.01)
+    await worker.stop(grace_s=1)
+
+    handler.assert_awaited_once()
+    assert worker.stats["done"] == 1
+
+
+def test_cron_daily_enqueues_deduplicated_jobs():
+    enqueue_mock = AsyncMock(side_effect=[1, None, 3])
+
+    with (
+        patch("cascade_api.jobs.enqueue", enqueue_mock),
+        patch("cascade_api.api.cron.settings.cron_secret", ""),
+    ):
+        from cascade_api.main import app
+
+        resp = TestClient(app).post("/api/cron/daily")
+
+    assert resp.json() == {"fanout_job": 1, "decay_job": None, "purge_job": 3}
+    kinds = [c.args[0] for c in enqueue_mock.call_args_list]
+    assert kinds == ["scheduled.daily_fanout", "memory.decay", "jobs.purge"]
+    assert all(c.kwargs["dedupe_key"] for c in enqueue_mock.call_args_list)
+
+
+def _record_usage(*args, **kwargs):
+    from cascade_api.observability.usage_ledger import record_llm_call
+
+    record_llm_call(provider="gemini", model="m", call_site="test", latency_ms=1)
+
+
+@pytest.mark.asyncio
+async def test_background_handlers_bill_the_tenant():
+    from cascade_api.observability import usage_ledger
+
+    ledger = MagicMock()
+    memory = MagicMock()
+    memory.for_tenant.return_value.extract = AsyncMock(side_effect=_record_usage)
+    score = AsyncMock(side_effect=_record_usage)
+    with (
+        patch.object(usage_ledger, "ledger_enabled", return_value=True),
+        patch.object(usage_ledger, "get_usage_ledger", return_value=ledger),
+        patch("cascade_api.dependencies.get_memory_client", return_value=memory),
+        patch("cascade_api.observability.evals.score_trace", score),
+    ):
+        await get_handler("memory.extract").func({"tenant_id": "t-1", "transcript": "User: hi"})
+        await get_handler("evals.score").func({"tenant_id": "t-2", "trace_id": "tr"})
+
+    tenants = [c.args[0]["tenant_id"] for c in ledger.record.call_args_list]
+    assert tenants == ["t-1", "t-2"]
+    assert "tenant_id" not in score.call_args.kwargs
+    assert usage_ledger.current_tenant() is None
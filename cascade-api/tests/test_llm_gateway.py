@@ -0,0 +1,120 @@
+"""Tests for the pooled LLM gateway."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cascade_api.llm import gateway
+
+
+@pytest.fixture(autouse=True)
+def _reset_gateway():
+    gateway.reset()
+    yield
+    gateway.reset()
+
+
+def test_get_client_reuses_client_per_key():
+    """The same API key should get the same pooled client."""
+    first = gateway.get_client("sk-a")
+    second = gateway.get_client("sk-a")
+    other = gateway.get_client("sk-b")
+
+    assert first is second
+    assert other is not first
+    stats = gateway.latency_snapshot()["client_cache"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_get_client_evicts_least_recently_used():
+    """BYOK keys beyond the cache size evict the least recently used client."""
+    with patch.object(gateway.settings, "anthropic_client_cache_size", 2):
+        a = gateway.get_client("sk-a")
+        gateway.get_client("sk-b")
+        gateway.get_client("sk-a")  # touch a so b is the LRU entry
+        gateway.get_client("sk-c")
+
+        assert gateway.get_client("sk-a") is a
+        stats = gateway.latency_snapshot()["client_cache"]
+        assert stats["evictions"] == 1
+        assert stats["size"] == 2
+
+
+def test_get_client_applies_timeout_and_retries():
+    client = gateway.get_client("sk-a")
+
+    assert client.max_retries == gateway.settings.anthropic_max_retries
+    assert client.timeout.read == gateway.settings.anthropic_timeout_s
+
+
+@pytest.mark.asyncio
+async def test_create_message_records_latency_per_model():
+    """Each call lands in its model's histogram; only the first is a new-client call."""
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(return_value="response")
+
+    with patch("cascade_api.llm.gateway.anthropic.AsyncAnthropic", return_value=mock_client):
+        for _ in range(3):
+            result = await gateway.create_message(
+                call_site="test", api_key="sk-a", model="claude-haiku-4-5-20251001", max_tokens=10
+            )
+
+    assert result == "response"
+    mock_client.messages.create.assert_awaited_with(
+        model="claude-haiku-4-5-20251001", max_tokens=10
+    )
+    snapshot = gateway.latency_snapshot()
+    assert snapshot["latency_by_model"]["claude-haiku-4-5-20251001"]["count"] == 3
+    assert snapshot["new_client_latency_by_model"]["claude-haiku-4-5-20251001"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_create_message_records_prompt_cache_usage():
+    """Cache creation/read tokens are summed per model with a hit rate."""
+    response = MagicMock()
+    response.usage = MagicMock(
+        input_tokens=100,
+        output_tokens=20,
+        cache_creation_input_tokens=0,
+        cache_read_input_tokens=300,
+    )
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(return_value=response)
+
+    with patch("cascade_api.llm.gateway.get_client", return_value=mock_client):
+        await gateway.create_message(call_site="test", model="m")
+
+    cache = gateway.latency_snapshot()["prompt_cache_by_model"]["m"]
+    assert cache["cache_read_input_tokens"] == 300
+    assert cache["output_tokens"] == 20
+    assert cache["hit_rate"] == 0.75
+
+
+@pytest.mark.asyncio
+async def test_create_message_records_failed_calls():
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(side_effect=RuntimeError("overloaded"))
+
+    with (
+        patch("cascade_api.llm.gateway.get_client", return_value=mock_client),
+        pytest.raises(RuntimeError),
+    ):
+        await gateway.create_message(call_site="test", model="m")
+
+    assert gateway.latency_snapshot()["latency_by_model"]["m"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_routes_through_create_message():
+    """GatewayClient.messages.create should behave like the SDK call."""
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(return_value="ok")
+
+    with patch("cascade_api.llm.gateway.get_client", return_value=mock_client) as mock_get:
+        client = gateway.GatewayClient(call_site="memory.extract", api_key="sk-x")
+        assert await client.messages.create(model="m", max_tokens=1) == "ok"
+
+    mock_get.assert_called_once_with("sk-x")
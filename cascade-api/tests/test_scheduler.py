@@ -80,62 +80,52 @@ def test_get_daily_message_type_monday_is_review_day():
 # ── Pull-based send tests ─────────────────────────────────────────
 
 
-def _make_supabase_mock(tenants, deliveries=None):
-    """Build a mock supabase client that returns different data per table."""
-    if deliveries is None:
-        deliveries = []
+def _make_supabase_mock(tenants, due=None, claim_id=1):
+    """Build a mock supabase client that returns different data per table and RPC.
 
+    ``claim_id`` is the delivery claim_delivery returns when this worker wins
+    the claim; None means another worker (or an earlier send) owns it.
+    """
     mock = MagicMock()
 
     def table_router(table_name):
         chain = MagicMock()
         if table_name == "tenants":
             chain.select.return_value.not_.is_.return_value.execute.return_value.data = tenants
-        elif table_name == "message_deliveries":
-            # select().eq().eq().eq().execute() for _already_sent
-            chain.select.return_value.eq.return_value.eq.return_value.eq.return_value.execute.return_value.data = deliveries
-            # insert().execute() for _record_delivery
-            chain.insert.return_value.execute.return_value = MagicMock()
         elif table_name == "tasks":
             chain.select.return_value.eq.return_value.eq.return_value.execute.return_value.data = []
         return chain
 
+    def rpc_router(name, params):
+        chain = MagicMock()
+        chain.execute.return_value.data = {
+            "get_due_tenants": due or [],
+            "claim_delivery": [{"id": claim_id, "attempts": 1}] if claim_id else [],
+        }.get(name)
+        return chain
+
     mock.table.side_effect = table_router
+    mock.rpc.side_effect = rpc_router
     return mock
 
 
 @pytest.mark.asyncio
-async def test_send_daily_messages_respects_user_preferred_time():
-    """Daily message uses per-user morning_hour/morning_minute."""
-    # UTC 14:15 = 9:15 AM ET
+async def test_send_daily_messages_sends_only_due_tenants():
+    """Due-tenant selection happens in SQL; only returned tenants are messaged."""
     utc_now = datetime(2026, 2, 26, 14, 15, tzinfo=timezone.utc)
 
-    tenants = [
+    due = [
         {
             "id": "t-early",
             "telegram_id": 111,
             "user_id": "u1",
-            "timezone": "America/New_York",
-            "subscription_status": "active",
             "completed_weekly_reviews": 0,
-            "morning_hour": 7,
-            "morning_minute": 0,
-            "review_day": 0,
-        },
-        {
-            "id": "t-late",
-            "telegram_id": 222,
-            "user_id": "u2",
-            "timezone": "America/New_York",
-            "subscription_status": "active",
-            "completed_weekly_reviews": 0,
-            "morning_hour": 10,
-            "morning_minute": 0,
             "review_day": 0,
+            "local_date": "2026-02-26",
         },
     ]
 
-    mock_supabase = _make_supabase_mock(tenants)
+    mock_supabase = _make_supabase_mock([], due=due)
     mock_bot = AsyncMock()
 
     with (
@@ -145,7 +135,7 @@ async def test_send_daily_messages_respects_user_preferred_time():
             "cascade_api.telegram.scheduler._build_daily_message",
             new_callable=AsyncMock,
             return_value="Your tasks today",
-        ),
+        ) as mock_build,
         patch("cascade_api.telegram.scheduler.track_event"),
     ):
         mock_dt.now.return_value = utc_now
@@ -156,33 +146,25 @@ async def test_send_daily_messages_respects_user_preferred_time():
 
         result = await send_daily_messages(mock_bot)
 
-    # t-early (7 AM) should have been sent (9:15 AM > 7:00 AM)
-    # t-late (10 AM) should NOT have been sent yet (9:15 AM < 10:00 AM)
+    assert mock_supabase.rpc.call_args_list[0].args == (
+        "get_due_tenants",
+        {"p_message_type": "morning", "p_now": utc_now.isoformat(), "p_max_attempts": 3},
+    )
+    assert mock_supabase.rpc.call_args_list[1].args[0] == "claim_delivery"
     assert result["sent"] == 1
     call_kwargs = mock_bot.send_message.call_args[1]
     assert call_kwargs["chat_id"] == 111
+    # The tenant's local date drives the message type
+    assert mock_build.call_args[0][1] == date(2026, 2, 26)
+    assert mock_build.call_args[0][2] == "daily"
 
 
 @pytest.mark.asyncio
-async def test_send_daily_messages_idempotent():
-    """Calling twice doesn't double-send."""
+async def test_send_daily_messages_nothing_due():
+    """Already-delivered or not-yet-due tenants aren't returned, so nothing is sent."""
     utc_now = datetime(2026, 2, 26, 12, 15, tzinfo=timezone.utc)
 
-    tenants = [
-        {
-            "id": "t-ny",
-            "telegram_id": 111,
-            "user_id": "u1",
-            "timezone": "America/New_York",
-            "subscription_status": "active",
-            "completed_weekly_reviews": 0,
-            "morning_hour": 7,
-            "morning_minute": 0,
-            "review_day": 0,
-        },
-    ]
-
-    mock_supabase = _make_supabase_mock(tenants, deliveries=[{"id": 1}])
+    mock_supabase = _make_supabase_mock([])
     mock_bot = AsyncMock()
 
     with (
@@ -200,6 +182,7 @@ async def test_send_daily_messages_idempotent():
 
     assert result["sent"] == 0
     mock_bot.send_message.assert_not_called()
+    mock_supabase.table.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -217,8 +200,8 @@ async def test_trial_check_pull_idempotent():
         },
     ]
 
-    # Already sent a trial_reminder today
-    mock_supabase = _make_supabase_mock(tenants, deliveries=[{"id": 99}])
+    # Already sent a trial_reminder today, so the claim is refused
+    mock_supabase = _make_supabase_mock(tenants, claim_id=None)
     mock_bot = AsyncMock()
 
     with (
@@ -0,0 +1,86 @@
+"""Tests for the shared status snapshot."""
+
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from cascade_api.agent.tools import _get_status
+from cascade_api.db.status_snapshot import compute_trend, get_status_snapshot
+
+
+def _supabase(payload):
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value.data = payload
+    return sb
+
+
+@pytest.mark.parametrize(
+    ("rates", "trend"),
+    [
+        ([], "flat"),
+        ([80], "flat"),
+        ([80, 60, 50], "up"),
+        ([40, 60, 70], "down"),
+        ([60, 58], "flat"),
+    ],
+)
+def test_compute_trend(rates, trend):
+    assert compute_trend([{"completion_rate": r} for r in rates]) == trend
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_one_rpc_call():
+    sb = _supabase(
+        {
+            "velocity_weeks": [{"completion_rate": 90}, {"completion_rate": 50}],
+            "week_progress": {
+                "core_completed": 1,
+                "core_total": 4,
+                "flex_completed": 1,
+                "flex_total": 2,
+            },
+            "month_entries_count": 9,
+            "rest_debt_days": 3,
+            "active_adaptations": [{"pattern_type": "energy"}],
+        }
+    )
+
+    snapshot = await get_status_snapshot(sb, "tenant-1", today=date(2026, 2, 10))
+
+    sb.rpc.assert_called_once_with(
+        "get_status_snapshot",
+        {"p_tenant_id": "tenant-1", "p_today": "2026-02-10", "p_weeks": 4},
+    )
+    sb.table.assert_not_called()
+    assert snapshot["week_progress"]["core_rate"] == 25.0
+    assert snapshot["velocity_trend"] == "up"
+    assert snapshot["monthly_progress"] == {
+        "entries_count": 9,
+        "days_elapsed": 10,
+        "days_in_month": 28,
+        "pct_elapsed": 35.7,
+    }
+    assert snapshot["rest_debt_days"] == 3
+    assert snapshot["active_adaptations"] == [{"pattern_type": "energy"}]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_for_new_tenant():
+    snapshot = await get_status_snapshot(_supabase(None), "tenant-1")
+
+    assert snapshot["week_progress"]["core_total"] == 0
+    assert snapshot["week_progress"]["core_rate"] == 0
+    assert snapshot["velocity_trend"] == "flat"
+    assert snapshot["rest_debt_days"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_status_tool_uses_snapshot():
+    result = await _get_status({}, _supabase({"rest_debt_days": 2}), "tenant-1")
+
+    assert result["rest_debt_days"] == 2
+    assert "active_adaptations" not in result
+    assert set(result) >= {"week_progress", "velocity_trend", "monthly_progress"}
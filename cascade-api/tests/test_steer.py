@@ -65,7 +65,7 @@ class TestExpertGraph:
         mock_msg = MagicMock()
         mock_msg.content = [MagicMock(type="text", text=json.dumps(skills))]
 
-        with patch("cascade_api.steer.expert_graph.get_anthropic") as mock_get:
+        with patch("cascade_api.llm.gateway.get_client") as mock_get:
             mock_client = AsyncMock()
             mock_client.messages.create = AsyncMock(return_value=mock_msg)
             mock_get.return_value = mock_client
@@ -246,7 +246,7 @@ class TestEvaluateTaskROI:
 
         mock_sb.table.return_value.select.return_value.eq.return_value.execute = mock_execute
 
-        with patch("cascade_api.steer.evaluate.get_anthropic") as mock_get:
+        with patch("cascade_api.llm.gateway.get_client") as mock_get:
             mock_client = AsyncMock()
             mock_client.messages.create = AsyncMock(return_value=task_skills_response)
             mock_get.return_value = mock_client
@@ -315,7 +315,7 @@ class TestEvaluateTaskROI:
 
         mock_sb.table.return_value.select.return_value.eq.return_value.execute = mock_execute
 
-        with patch("cascade_api.steer.evaluate.get_anthropic") as mock_get:
+        with patch("cascade_api.llm.gateway.get_client") as mock_get:
             mock_client = AsyncMock()
             mock_client.messages.create = AsyncMock(
                 side_effect=[task_skills_response, alt_response]
@@ -78,3 +78,57 @@ class TestBuildSystemPrompt:
             prompt = await build_system_prompt(mock_sb, "tenant-1", tenant)
 
         assert "Coaching Tone" in prompt
+
+
+class TestBuildSystemBlocks:
+    @pytest.mark.asyncio
+    async def test_blocks_ordered_stable_to_volatile(self):
+        """Static prompt and core memory carry breakpoints; date context does not."""
+        from cascade_api.agent.system_prompt import SYSTEM_PROMPT, build_system_blocks
+
+        tenant = {"timezone": "UTC", "morning_hour": 7, "morning_minute": 0, "review_day": 0}
+        client = _mock_memory_client("## User Profile\n- Name: Test User")
+        with patch("cascade_api.agent.system_prompt.get_memory_client", return_value=client):
+            blocks = await build_system_blocks(
+                MagicMock(), "tenant-1", tenant, scheduled_context="Send the morning plan."
+            )
+
+        static, memory, volatile = blocks
+        assert static["text"] == SYSTEM_PROMPT
+        assert static["cache_control"] == {"type": "ephemeral"}
+        assert "Test User" in memory["text"]
+        assert memory["cache_control"] == {"type": "ephemeral"}
+        assert "Date:" in volatile["text"]
+        assert "Send the morning plan." in volatile["text"]
+        assert "cache_control" not in volatile
+
+    @pytest.mark.asyncio
+    async def test_static_block_identical_across_tenants(self):
+        """The shared cache prefix must not vary by tenant or timezone."""
+        from cascade_api.agent.system_prompt import build_system_blocks
+
+        with patch(
+            "cascade_api.agent.system_prompt.get_memory_client", return_value=_mock_memory_client()
+        ):
+            a = await build_system_blocks(MagicMock(), "tenant-1", {"timezone": "UTC"})
+            b = await build_system_blocks(
+                MagicMock(), "tenant-2", {"timezone": "Asia/Tokyo", "review_day": 3}
+            )
+
+        assert a[0] == b[0]
+        assert a[2] != b[2]
+
+    @pytest.mark.asyncio
+    async def test_history_summary_in_tenant_block(self):
+        """The rolling summary rides with core memory, not the volatile block."""
+        from cascade_api.agent.system_prompt import build_system_blocks
+
+        with patch(
+            "cascade_api.agent.system_prompt.get_memory_client", return_value=_mock_memory_client()
+        ):
+            blocks = await build_system_blocks(
+                MagicMock(), "tenant-1", {}, history_summary="User committed to 5 DMs/day."
+            )
+
+        assert "User committed to 5 DMs/day." in blocks[1]["text"]
+        assert "User committed" not in blocks[2]["text"]
@@ -0,0 +1,86 @@
+"""Tests for Telegram update_id deduplication."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from cascade_api.telegram.dedup import UpdateDeduplicator
+
+
+def _mock_supabase(inserted: bool = True):
+    sb = MagicMock()
+    sb.table.return_value.upsert.return_value.execute.return_value.data = (
+        [{"update_id": 1}] if inserted else []
+    )
+    return sb
+
+
+@pytest.mark.asyncio
+async def test_first_delivery_is_claimed_in_the_table():
+    sb = _mock_supabase()
+    dedup = UpdateDeduplicator(supabase_factory=lambda: sb)
+
+    assert await dedup.claim(1) is True
+
+    sb.table.assert_called_with("telegram_updates")
+    sb.table.return_value.upsert.assert_called_once_with(
+        {"update_id": 1}, on_conflict="update_id", ignore_duplicates=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeat_on_same_replica_is_answered_from_memory():
+    sb = _mock_supabase()
+    dedup = UpdateDeduplicator(supabase_factory=lambda: sb)
+
+    await dedup.claim(1)
+    assert await dedup.claim(1) is False
+
+    assert sb.table.return_value.upsert.call_count == 1
+    assert dedup.stats["duplicate_memory"] == 1
+
+
+@pytest.mark.asyncio
+async def test_update_claimed_elsewhere_is_a_duplicate():
+    """Another replica (or a pre-restart process) already inserted the id."""
+    dedup = UpdateDeduplicator(supabase_factory=lambda: _mock_supabase(inserted=False))
+
+    assert await dedup.claim(1) is False
+    assert dedup.stats["duplicate_db"] == 1
+
+
+@pytest.mark.asyncio
+async def test_database_error_fails_open():
+    sb = MagicMock()
+    sb.table.return_value.upsert.return_value.execute.side_effect = RuntimeError("db down")
+    dedup = UpdateDeduplicator(supabase_factory=lambda: sb)
+
+    assert await dedup.claim(1) is True
+    assert dedup.stats["db_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_oldest_ids():
+    sb = _mock_supabase()
+    dedup = UpdateDeduplicator(capacity=2, supabase_factory=lambda: sb)
+
+    for update_id in (1, 2, 3):
+        await dedup.claim(update_id)
+
+    # 1 was evicted from memory, so the table is asked again
+    await dedup.claim(1)
+    assert sb.table.return_value.upsert.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_release_lets_a_redelivery_run():
+    sb = _mock_supabase()
+    dedup = UpdateDeduplicator(supabase_factory=lambda: sb)
+
+    await dedup.claim(1)
+    await dedup.release(1)
+
+    sb.table.return_value.delete.return_value.eq.assert_called_once_with("update_id", 1)
+    assert await dedup.claim(1) is True
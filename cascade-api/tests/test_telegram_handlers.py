@@ -3,6 +3,8 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 
+from cascade_api.db.conversation_history import ConversationContext
+
 
 @pytest.mark.asyncio
 async def test_start_command_links_telegram_to_tenant():
@@ -140,8 +142,49 @@ async def test_message_from_inactive_user():
 
 
 @pytest.mark.asyncio
-async def test_status_message_routes_through_agent():
-    """Sending 'status' should route through the agent loop."""
+async def test_status_message_uses_fast_path():
+    """Sending 'status' should be answered by the fast path without the agent loop."""
+    mock_supabase = MagicMock()
+    mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [
+        {
+            "id": "tenant-1",
+            "user_id": "auth-123",
+            "telegram_id": 12345,
+            "completed_weekly_reviews": 0,
+            "subscription_status": "none",
+        }
+    ]
+
+    with (
+        patch("cascade_api.telegram.handlers.get_supabase", return_value=mock_supabase),
+        patch(
+            "cascade_api.agent.fast_path.try_fast_path",
+            new_callable=AsyncMock,
+            return_value="<b>This week</b>",
+        ),
+        patch("cascade_api.db.conversation_history.save_turn", new_callable=AsyncMock) as mock_save,
+        patch("cascade_api.agent.loop.run_agent", new_callable=AsyncMock) as mock_agent,
+        patch("cascade_api.telegram.handlers.track_event"),
+    ):
+        from cascade_api.telegram.handlers import handle_message
+
+        update = MagicMock()
+        update.effective_user.id = 12345
+        update.message.text = "status"
+        update.message.reply_text = AsyncMock()
+
+        context = MagicMock()
+
+        await handle_message(update, context)
+
+        mock_agent.assert_not_called()
+        update.message.reply_text.assert_awaited_once_with("<b>This week</b>", parse_mode="HTML")
+        assert [c.args[2] for c in mock_save.await_args_list] == ["user", "assistant"]
+
+
+@pytest.mark.asyncio
+async def test_status_message_falls_back_to_agent():
+    """If the fast path can't answer, 'status' should route through the agent loop."""
     mock_supabase = MagicMock()
     mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [
         {
@@ -156,9 +199,14 @@ async def test_status_message_routes_through_agent():
     with (
         patch("cascade_api.telegram.handlers.get_supabase", return_value=mock_supabase),
         patch(
-            "cascade_api.db.conversation_history.get_history",
+            "cascade_api.agent.fast_path.try_fast_path",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(
+            "cascade_api.db.conversation_history.load_context",
             new_callable=AsyncMock,
-            return_value=[],
+            return_value=ConversationContext(),
         ),
         patch("cascade_api.db.conversation_history.save_turn", new_callable=AsyncMock),
         patch(
@@ -166,7 +214,7 @@ async def test_status_message_routes_through_agent():
             new_callable=AsyncMock,
             return_value=("Here's your status.", []),
         ) as mock_agent,
-        patch("cascade_api.dependencies.get_memory_client", side_effect=Exception("skip")),
+        patch("cascade_api.jobs.enqueue", new_callable=AsyncMock) as mock_enqueue,
         patch("cascade_api.telegram.handlers.track_event"),
     ):
         from cascade_api.telegram.handlers import handle_message
@@ -183,6 +231,14 @@ async def test_status_message_routes_through_agent():
         mock_agent.assert_called_once()
         assert mock_agent.call_args.kwargs["user_message"] == "status"
         update.message.reply_text.assert_called_once()
+        # The placeholder is edited into the final reply
+        placeholder = update.message.reply_text.return_value
+        placeholder.edit_text.assert_awaited_with("Here's your status.", parse_mode="HTML")
+        # Memory extraction is handed to the job queue
+        mock_enqueue.assert_awaited_once()
+        kind, payload = mock_enqueue.await_args.args[:2]
+        assert kind == "memory.extract"
+        assert payload["transcript"] == "User: status\n\nAssistant: Here's your status."
 
 
 @pytest.mark.asyncio
@@ -202,9 +258,9 @@ async def test_log_message_routes_through_agent():
     with (
         patch("cascade_api.telegram.handlers.get_supabase", return_value=mock_supabase),
         patch(
-            "cascade_api.db.conversation_history.get_history",
+            "cascade_api.db.conversation_history.load_context",
             new_callable=AsyncMock,
-            return_value=[],
+            return_value=ConversationContext(),
         ),
         patch("cascade_api.db.conversation_history.save_turn", new_callable=AsyncMock),
         patch(
@@ -212,7 +268,7 @@ async def test_log_message_routes_through_agent():
             new_callable=AsyncMock,
             return_value=("Got it. Logged.", []),
         ) as mock_agent,
-        patch("cascade_api.dependencies.get_memory_client", side_effect=Exception("skip")),
+        patch("cascade_api.jobs.enqueue", new_callable=AsyncMock) as mock_enqueue,
         patch("cascade_api.telegram.handlers.track_event"),
     ):
         from cascade_api.telegram.handlers import handle_message
@@ -228,4 +284,12 @@ async def test_log_message_routes_through_agent():
 
         mock_agent.assert_called_once()
         assert "sent 5 DMs" in mock_agent.call_args.kwargs["user_message"]
+        # Memory extraction is queued, not run inline
+        kind, payload = mock_enqueue.call_args.args
+        assert kind == "memory.extract"
+        assert payload["tenant_id"] == "tenant-1"
+        assert "Got it. Logged." in payload["transcript"]
         update.message.reply_text.assert_called_once()
+        # The placeholder is edited into the final reply
+        placeholder = update.message.reply_text.return_value
+        placeholder.edit_text.assert_awaited_with("Got it. Logged.", parse_mode="HTML")
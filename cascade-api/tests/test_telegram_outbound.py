@@ -0,0 +1,134 @@
+"""Tests for the outbound Bot API rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from telegram.error import RetryAfter
+
+from cascade_api.telegram import outbound
+from cascade_api.telegram.outbound import OutboundRateLimiter, TokenBucket
+
+
+async def _send(limiter, callback, endpoint="sendMessage", chat_id=42):
+    return await limiter.process_request(
+        callback, (), {}, endpoint, {"chat_id": chat_id, "text": "hi"}, None
+    )
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_paused_bucket_waits_out_the_pause():
+    bucket = TokenBucket(rate=10, burst=5)
+    bucket.pause(2.0)
+
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_per_chat_limit_throttles_one_chat_only():
+    limiter = OutboundRateLimiter(global_rate=1000, chat_rate=1)
+    callback = AsyncMock(return_value=True)
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    with patch.object(outbound.asyncio, "sleep", fake_sleep):
+        for _ in range(outbound.CHAT_BURST):
+            await _send(limiter, callback, chat_id=1)
+        await _send(limiter, callback, chat_id=2)  # other chats are unaffected
+        assert sleeps == []
+        await _send(limiter, callback, chat_id=1)
+
+    assert len(sleeps) == 1 and sleeps[0] == pytest.approx(1.0, abs=0.05)
+    assert limiter.stats["throttled"] == 1
+    assert callback.await_count == outbound.CHAT_BURST + 2
+
+
+@pytest.mark.asyncio
+async def test_group_chats_get_the_slower_rate():
+    limiter = OutboundRateLimiter(global_rate=1000, chat_rate=1)
+
+    assert limiter._chat_bucket(-100).rate == outbound.GROUP_CHAT_RATE
+    assert limiter._chat_bucket(7).rate == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured_and_retried():
+    limiter = OutboundRateLimiter(global_rate=1000, chat_rate=1000)
+    callback = AsyncMock(side_effect=[RetryAfter(3), {"message_id": 1}])
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    with patch.object(outbound.asyncio, "sleep", fake_sleep):
+        result = await _send(limiter, callback)
+
+    assert result == {"message_id": 1}
+    assert callback.await_count == 2
+    assert 3.0 <= sleeps[0] <= 3.6  # jittered backoff
+    assert limiter.stats["retry_after"] == 1
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries():
+    limiter = OutboundRateLimiter(global_rate=1000, chat_rate=1000, max_retries=2)
+    callback = AsyncMock(side_effect=RetryAfter(1))
+
+    with patch.object(outbound.asyncio, "sleep", AsyncMock()):
+        with pytest.raises(RetryAfter):
+            await _send(limiter, callback)
+
+    assert callback.await_count == 3
+    assert limiter.stats["gave_up"] == 1
+
+
+@pytest.mark.asyncio
+async def test_edits_are_not_retried_by_the_limiter():
+    """The reply stream skips previews on 429 instead of waiting."""
+    limiter = OutboundRateLimiter(global_rate=1000, chat_rate=1000)
+    callback = AsyncMock(side_effect=RetryAfter(5))
+
+    with pytest.raises(RetryAfter):
+        await _send(limiter, callback, endpoint="editMessageText")
+
+    assert callback.await_count == 1
+    # ...but later requests to that chat still wait out the cooldown
+    assert limiter._chat_bucket(42).reserve() > 4
+
+
+@pytest.mark.asyncio
+async def test_latency_is_recorded_per_endpoint():
+    limiter = OutboundRateLimiter(global_rate=1000, chat_rate=1000)
+    await _send(limiter, AsyncMock(return_value=True))
+
+    snapshot = limiter.snapshot()
+    assert snapshot["latency"]["sendMessage"]["count"] == 1
+    assert snapshot["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_global_limit_applies_across_chats():
+    limiter = OutboundRateLimiter(global_rate=2, chat_rate=1000)
+    callback = AsyncMock(return_value=True)
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    with patch.object(outbound.asyncio, "sleep", fake_sleep):
+        await asyncio.gather(*(_send(limiter, callback, chat_id=i) for i in range(3)))
+
+    assert len(sleeps) == 1 and sleeps[0] == pytest.approx(0.5, abs=0.05)
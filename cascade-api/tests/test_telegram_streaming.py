@@ -0,0 +1,239 @@
+"""Tests for progressive Telegram replies and streaming run_agent."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from telegram.error import BadRequest, RetryAfter
+
+from cascade_api.telegram.streaming import (
+    EMPTY_REPLY_TEXT,
+    PLACEHOLDER_TEXT,
+    TelegramReplyStream,
+)
+
+
+def _message():
+    placeholder = MagicMock()
+    placeholder.edit_text = AsyncMock()
+    message = MagicMock()
+    message.reply_text = AsyncMock(return_value=placeholder)
+    message.reply_chat_action = AsyncMock()
+    return message, placeholder
+
+
+@pytest.mark.asyncio
+async def test_start_sends_placeholder():
+    message, _ = _message()
+    stream = TelegramReplyStream(message)
+
+    await stream.start()
+
+    message.reply_text.assert_awaited_once_with(PLACEHOLDER_TEXT)
+
+
+@pytest.mark.asyncio
+async def test_text_deltas_are_throttled():
+    """Deltas inside one edit interval should not each trigger an edit."""
+    message, placeholder = _message()
+    stream = TelegramReplyStream(message, edit_interval=0.0)
+    await stream.start()
+
+    await stream.on_text("Hello")
+    await stream.on_text(", world")
+    assert placeholder.edit_text.await_count == 2
+    assert placeholder.edit_text.await_args.args == ("Hello, world",)
+
+    throttled = TelegramReplyStream(message, edit_interval=60.0)
+    await throttled.start()
+    placeholder.edit_text.reset_mock()
+    for chunk in ("a", "b", "c"):
+        await throttled.on_text(chunk)
+    placeholder.edit_text.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_finish_edits_placeholder_with_html():
+    message, placeholder = _message()
+    stream = TelegramReplyStream(message)
+    await stream.start()
+
+    await stream.finish("<b>Done</b>")
+
+    placeholder.edit_text.assert_awaited_with("<b>Done</b>", parse_mode="HTML")
+    message.reply_text.assert_awaited_once()  # only the placeholder
+
+
+@pytest.mark.asyncio
+async def test_finish_splits_long_replies():
+    message, placeholder = _message()
+    stream = TelegramReplyStream(message)
+    await stream.start()
+
+    await stream.finish("x" * 5000)
+
+    assert placeholder.edit_text.await_args.args == ("x" * 4096,)
+    message.reply_text.assert_awaited_with("x" * 904, parse_mode="HTML")
+
+
+@pytest.mark.asyncio
+async def test_finish_splits_on_line_breaks_outside_tags():
+    message, placeholder = _message()
+    stream = TelegramReplyStream(message)
+    await stream.start()
+    first_line = "a" * 3000 + "\n"
+    second_line = "b" * 1200 + " <b>bold</b>"
+
+    await stream.finish(first_line + second_line)
+
+    assert placeholder.edit_text.await_args.args == (first_line,)
+    message.reply_text.assert_awaited_with(second_line, parse_mode="HTML")
+
+    await stream.finish("x" * 4094 + "<b>bold</b>")
+
+    assert placeholder.edit_text.await_args.args == ("x" * 4094,)
+    message.reply_text.assert_awaited_with("<b>bold</b>", parse_mode="HTML")
+
+
+@pytest.mark.asyncio
+async def test_finish_sends_extra_chunks_as_plain_text_on_bad_html():
+    message, _ = _message()
+    stream = TelegramReplyStream(message)
+    await stream.start()
+    message.reply_text.side_effect = [BadRequest("Can't parse entities"), None]
+
+    await stream.finish("<i>" + "x" * 5000 + "</i>")
+
+    assert message.reply_text.await_args_list[-1].args == ("x" * 907 + "</i>",)
+    assert message.reply_text.await_args_list[-1].kwargs == {}
+
+
+@pytest.mark.asyncio
+async def test_finish_replaces_an_empty_reply():
+    message, placeholder = _message()
+    stream = TelegramReplyStream(message)
+    await stream.start()
+
+    await stream.finish("  ")
+
+    placeholder.edit_text.assert_awaited_with(EMPTY_REPLY_TEXT, parse_mode="HTML")
+
+
+@pytest.mark.asyncio
+async def test_finish_falls_back_to_plain_text_on_bad_html():
+    message, placeholder = _message()
+    placeholder.edit_text.side_effect = [BadRequest("Can't parse entities"), None]
+    stream = TelegramReplyStream(message)
+    await stream.start()
+
+    await stream.finish("<b>unclosed")
+
+    assert placeholder.edit_text.await_args_list[-1].args == ("<b>unclosed",)
+    assert placeholder.edit_text.await_args_list[-1].kwargs == {}
+
+
+@pytest.mark.asyncio
+async def test_finish_handles_bad_html_after_retry_after():
+    message, placeholder = _message()
+    placeholder.edit_text.side_effect = [
+        RetryAfter(0),
+        BadRequest("Can't parse entities"),
+        None,
+    ]
+    stream = TelegramReplyStream(message)
+    await stream.start()
+
+    await stream.finish("<b>unclosed")
+
+    assert placeholder.edit_text.await_count == 3
+    assert placeholder.edit_text.await_args_list[-1].args == ("<b>unclosed",)
+    assert placeholder.edit_text.await_args_list[-1].kwargs == {}
+
+
+@pytest.mark.asyncio
+async def test_typing_action_runs_during_tools():
+    message, _ = _message()
+    stream = TelegramReplyStream(message)
+    await stream.start()
+
+    await stream.on_tools_start()
+    await asyncio.sleep(0)
+    await stream.on_tools_end()
+
+    message.reply_chat_action.assert_awaited()
+    assert stream._typing_task is None
+
+
+class _FakeStream:
+    """Minimal async context manager mimicking AsyncMessageStream."""
+
+    def __init__(self, deltas, final):
+        self._deltas = deltas
+        self._final = final
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        async def gen():
+            for d in self._deltas:
+                event = MagicMock()
+                event.type = "text"
+                event.text = d
+                yield event
+
+        return gen()
+
+    async def get_final_message(self):
+        return self._final
+
+
+@pytest.mark.asyncio
+async def test_run_agent_streams_text_deltas():
+    """With a stream, run_agent should use messages.stream and forward deltas."""
+    mock_sb = MagicMock()
+    mock_sb.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [{}]
+
+    text_block = MagicMock()
+    text_block.type = "text"
+    text_block.text = "Hi there"
+    final = MagicMock()
+    final.content = [text_block]
+    final.usage = MagicMock(input_tokens=1, output_tokens=1)
+    final.stop_reason = "end_turn"
+
+    mock_client = MagicMock()
+    mock_client.messages.stream = MagicMock(return_value=_FakeStream(["Hi", " there"], final))
+    mock_client.messages.create = AsyncMock()
+
+    agent_stream = MagicMock()
+    agent_stream.on_text = AsyncMock()
+
+    with (
+        patch("cascade_api.agent.loop.get_supabase", return_value=mock_sb),
+        patch("cascade_api.llm.gateway.get_client", return_value=mock_client),
+        patch(
+            "cascade_api.agent.loop.build_system_blocks",
+            new_callable=AsyncMock,
+            return_value=[{"type": "text", "text": "system prompt"}],
+        ),
+        patch("cascade_api.agent.loop.get_langfuse", return_value=None),
+    ):
+        from cascade_api.agent.loop import run_agent
+
+        text, _ = await run_agent(
+            tenant_id="tenant-1",
+            user_message="hello",
+            conversation_history=[],
+            api_key="sk-test",
+            stream=agent_stream,
+        )
+
+    assert text == "Hi there"
+    mock_client.messages.create.assert_not_called()
+    assert [c.args[0] for c in agent_stream.on_text.await_args_list] == ["Hi", " there"]
@@ -17,6 +17,16 @@ def mock_bot_app():
     return bot_app
 
 
+@pytest.fixture(autouse=True)
+def mock_dedup():
+    """Every update is a first delivery unless a test says otherwise."""
+    dedup = MagicMock()
+    dedup.claim = AsyncMock(return_value=True)
+    dedup.release = AsyncMock()
+    with patch("cascade_api.api.telegram_webhook.get_update_dedup", return_value=dedup):
+        yield dedup
+
+
 @pytest.fixture
 def client_with_secret(mock_bot_app):
     """TestClient with webhook secret configured and bot_app in app.state."""
@@ -28,6 +38,7 @@ def client_with_secret(mock_bot_app):
         from cascade_api.main import app
 
         app.state.bot_app = mock_bot_app
+        app.state.update_queue = None
         yield TestClient(app)
 
 
@@ -42,6 +53,7 @@ def client_no_secret(mock_bot_app):
         from cascade_api.main import app
 
         app.state.bot_app = mock_bot_app
+        app.state.update_queue = None
         yield TestClient(app)
 
 
@@ -128,3 +140,57 @@ class TestWebhookEndpoint:
             )
 
             assert resp.status_code == 503
+
+
+class TestWebhookQueueing:
+    def test_update_is_queued_not_processed_inline(self, client_no_secret, mock_bot_app):
+        """With a running queue the webhook acks without waiting for the bot."""
+        from cascade_api.main import app
+
+        queue = MagicMock()
+        queue.submit.return_value = True
+        app.state.update_queue = queue
+        try:
+            with patch("cascade_api.api.telegram_webhook.Update") as MockUpdate:
+                mock_update = MagicMock()
+                MockUpdate.de_json.return_value = mock_update
+
+                resp = client_no_secret.post("/api/telegram/webhook", json=SAMPLE_UPDATE)
+        finally:
+            app.state.update_queue = None
+
+        assert resp.status_code == 200
+        queue.submit.assert_called_once_with(mock_update)
+        mock_bot_app.process_update.assert_not_called()
+
+    def test_duplicate_update_is_acked_without_processing(
+        self, client_no_secret, mock_bot_app, mock_dedup
+    ):
+        """A redelivered update_id gets a 200 but never reaches the bot."""
+        mock_dedup.claim.return_value = False
+        with patch("cascade_api.api.telegram_webhook.Update") as MockUpdate:
+            MockUpdate.de_json.return_value = MagicMock(update_id=123456)
+
+            resp = client_no_secret.post("/api/telegram/webhook", json=SAMPLE_UPDATE)
+
+        assert resp.status_code == 200
+        mock_dedup.claim.assert_awaited_once_with(123456)
+        mock_bot_app.process_update.assert_not_called()
+
+    def test_full_queue_returns_503(self, client_no_secret, mock_bot_app, mock_dedup):
+        """A backlogged queue refuses the update so Telegram redelivers it."""
+        from cascade_api.main import app
+
+        queue = MagicMock()
+        queue.submit.return_value = False
+        app.state.update_queue = queue
+        try:
+            with patch("cascade_api.api.telegram_webhook.Update"):
+                resp = client_no_secret.post("/api/telegram/webhook", json=SAMPLE_UPDATE)
+        finally:
+            app.state.update_queue = None
+
+        assert resp.status_code == 503
+        mock_bot_app.process_update.assert_not_called()
+        # Released so Telegram's redelivery is processed
+        mock_dedup.release.assert_awaited_once()
@@ -0,0 +1,138 @@
+"""Tests for the TTL tenant cache in front of the tenants table."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cascade_api.db import tenants
+from cascade_api.db.tenants import (
+    TenantCache,
+    get_tenant,
+    get_tenant_by_telegram_id,
+    invalidate_tenant,
+    update_tenant,
+)
+
+TENANT = {"id": "tenant-1", "telegram_id": 12345, "timezone": "Europe/Berlin"}
+
+
+def _mock_supabase(row: dict | None = TENANT):
+    sb = MagicMock()
+    sb.table.return_value.select.return_value.eq.return_value.execute.return_value.data = (
+        [row] if row else []
+    )
+    sb.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [row]
+    return sb
+
+
+def _selects(sb) -> int:
+    return sb.table.return_value.select.return_value.eq.return_value.execute.call_count
+
+
+@pytest.mark.asyncio
+async def test_lookup_by_telegram_id_also_serves_lookup_by_id():
+    """The message handler's lookup warms the agent loop's lookup."""
+    sb = _mock_supabase()
+
+    assert await get_tenant_by_telegram_id(sb, 12345) == TENANT
+    assert await get_tenant(sb, "tenant-1") == TENANT
+    assert await get_tenant_by_telegram_id(sb, 12345) == TENANT
+
+    assert _selects(sb) == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_tenant_is_not_cached():
+    sb = _mock_supabase(row=None)
+
+    assert await get_tenant_by_telegram_id(sb, 999) is None
+    assert await get_tenant_by_telegram_id(sb, 999) is None
+
+    assert _selects(sb) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_a_fresh_read():
+    sb = _mock_supabase()
+    await get_tenant(sb, "tenant-1")
+
+    invalidate_tenant("tenant-1")
+    await get_tenant_by_telegram_id(sb, 12345)
+
+    assert _selects(sb) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_tenant_invalidates():
+    sb = _mock_supabase()
+    await get_tenant(sb, "tenant-1")
+
+    await update_tenant(sb, "tenant-1", timezone="Asia/Tokyo")
+    await get_tenant(sb, "tenant-1")
+
+    assert _selects(sb) == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    cache = TenantCache(ttl_s=30)
+    with patch.object(tenants.time, "monotonic", return_value=1000.0):
+        cache.put(TENANT)
+        assert cache.get("tenant-1") == TENANT
+    with patch.object(tenants.time, "monotonic", return_value=1031.0):
+        assert cache.get("tenant-1") is None
+
+
+def test_cached_rows_are_copies():
+    cache = TenantCache(ttl_s=30)
+    cache.put(TENANT)
+
+    cache.get("tenant-1")["timezone"] = "mutated"
+
+    assert cache.get("tenant-1")["timezone"] == "Europe/Berlin"
+
+
+def test_relinking_telegram_drops_the_old_mapping():
+    cache = TenantCache(ttl_s=30)
+    cache.put(TENANT)
+
+    cache.invalidate("tenant-1")
+
+    assert cache.get_by_telegram_id(12345) is None
+
+
+def test_zero_ttl_disables_caching():
+    cache = TenantCache(ttl_s=0)
+    cache.put(TENANT)
+
+    assert cache.get("tenant-1") is None
+
+
+def test_oldest_entry_is_evicted_at_capacity():
+    cache = TenantCache(ttl_s=30, max_size=2)
+    for i in range(3):
+        cache.put({"id": f"t{i}", "telegram_id": i})
+
+    assert cache.get("t0") is None
+    assert cache.get_by_telegram_id(0) is None
+    assert cache.get("t2") is not None
+
+
+def test_telegram_lookup_holds_the_lock_across_both_reads():
+    cache = TenantCache(ttl_s=60)
+    cache.put(TENANT)
+    lock_held = []
+
+    class Index(dict):
+        def get(self, key, default=None):
+            lock_held.append(cache._lock.locked())
+            return super().get(key, default)
+
+    cache._ids_by_telegram = Index(cache._ids_by_telegram)
+
+    assert cache.get_by_telegram_id(12345) == TENANT
+    assert cache.get_by_telegram_id(999) is None
+    assert lock_held == [True, True]
+    assert cache.stats == {"hits": 1, "misses": 1}
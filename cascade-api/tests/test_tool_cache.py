@@ -0,0 +1,114 @@
+"""Tests for turn-scoped tool result memoization."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cascade_api.agent.tools import _EXECUTORS, INVALIDATES, ToolCache, execute_tool, is_read_only
+
+
+def _counting_run(result: str = "{}"):
+    calls = {"n": 0}
+
+    async def run():
+        calls["n"] += 1
+        return result
+
+    return run, calls
+
+
+def test_invalidation_map_covers_known_writes_only():
+    for write, reads in INVALIDATES.items():
+        assert write in _EXECUTORS and not is_read_only(write)
+        assert all(is_read_only(r) for r in reads)
+
+
+@pytest.mark.asyncio
+async def test_repeat_read_is_served_from_cache():
+    cache = ToolCache()
+    run, calls = _counting_run('{"tasks": []}')
+
+    first = await cache.get_or_run("get_tasks", {"day": "monday", "week": None}, run)
+    second = await cache.get_or_run("get_tasks", {"week": None, "day": "monday"}, run)
+
+    assert first == second == '{"tasks": []}'
+    assert calls["n"] == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "invalidations": 0}
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_only_affected_reads():
+    cache = ToolCache()
+    tasks_run, tasks_calls = _counting_run()
+    goals_run, goals_calls = _counting_run()
+    write_run, _ = _counting_run()
+
+    await cache.get_or_run("get_tasks", {}, tasks_run)
+    await cache.get_or_run("get_goals", {}, goals_run)
+    await cache.get_or_run("complete_task", {"task_id": "t1"}, write_run)
+    await cache.get_or_run("get_tasks", {}, tasks_run)
+    await cache.get_or_run("get_goals", {}, goals_run)
+
+    assert tasks_calls["n"] == 2  # refreshed after the write
+    assert goals_calls["n"] == 1  # untouched by complete_task
+
+
+@pytest.mark.asyncio
+async def test_unlisted_write_clears_everything():
+    cache = ToolCache()
+    run, calls = _counting_run()
+    await cache.get_or_run("get_goals", {}, run)
+
+    with patch.dict(INVALIDATES, {}, clear=True):
+        await cache.get_or_run("update_goal", {"goal_id": "g"}, _counting_run()[0])
+
+    await cache.get_or_run("get_goals", {}, run)
+    assert calls["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_reads_share_one_execution():
+    cache = ToolCache()
+    calls = {"n": 0}
+
+    async def slow():
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        return "{}"
+
+    await asyncio.gather(*(cache.get_or_run("get_status", {}, slow) for _ in range(3)))
+
+    assert calls["n"] == 1
+    assert cache.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_read_is_not_cached():
+    cache = ToolCache()
+    attempts = {"n": 0}
+
+    async def flaky():
+        attempts["n"] += 1
+        if attempts["n"] == 1:
+            raise RuntimeError("timeout")
+        return "{}"
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_run("get_status", {}, flaky)
+    assert await cache.get_or_run("get_status", {}, flaky) == "{}"
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_uses_cache():
+    cache = ToolCache()
+    executor = AsyncMock(return_value={"goals": []})
+
+    with patch.dict("cascade_api.agent.tools._EXECUTORS", {"get_goals": executor}):
+        await execute_tool("get_goals", {}, MagicMock(), "tenant-1", cache=cache)
+        await execute_tool("get_goals", {}, MagicMock(), "tenant-1", cache=cache)
+        await execute_tool("get_goals", {}, MagicMock(), "tenant-1")  # uncached path
+
+    assert executor.await_count == 2
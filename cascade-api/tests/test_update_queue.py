@@ -0,0 +1,235 @@
+"""Tests for the per-user Telegram update queue."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from telegram import Bot, Update
+
+from cascade_api.telegram.update_queue import UpdateQueue, update_key
+
+
+def _update(update_id: int, user_id: int | None):
+    update = MagicMock()
+    update.update_id = update_id
+    update.effective_user = MagicMock(id=user_id) if user_id is not None else None
+    update.effective_chat = MagicMock(id=-100)
+    update.message = None  # not a text message, so never coalesced
+    return update
+
+
+async def _drain(queue: UpdateQueue) -> None:
+    for _ in range(200):
+        if not queue.snapshot()["depth"] and not queue.snapshot()["in_flight"]:
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_update_key_prefers_sender_over_chat():
+    assert update_key(_update(1, 42)) == "user:42"
+    assert update_key(_update(2, None)) == "chat:-100"
+
+
+@pytest.mark.asyncio
+async def test_one_user_is_processed_in_order_one_at_a_time():
+    seen: list[int] = []
+    in_flight = peak = 0
+
+    async def process(update):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        seen.append(update.update_id)
+        in_flight -= 1
+
+    queue = UpdateQueue(process, consumers=4, max_depth=100)
+    queue.start()
+    for i in range(5):
+        assert queue.submit(_update(i, user_id=7))
+    await _drain(queue)
+    await queue.stop(drain_s=0)
+
+    assert seen == [0, 1, 2, 3, 4]
+    assert peak == 1
+    assert queue.stats["processed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_different_users_run_in_parallel():
+    started = asyncio.Event()
+    release = asyncio.Event()
+    running: set[int] = set()
+
+    async def process(update):
+        running.add(update.effective_user.id)
+        if len(running) == 2:
+            started.set()
+        await release.wait()
+
+    queue = UpdateQueue(process, consumers=4, max_depth=100)
+    queue.start()
+    queue.submit(_update(1, user_id=1))
+    queue.submit(_update(2, user_id=2))
+
+    await asyncio.wait_for(started.wait(), timeout=1)
+    assert queue.snapshot()["in_flight"] == 2
+    release.set()
+    await _drain(queue)
+    await queue.stop(drain_s=0)
+
+
+@pytest.mark.asyncio
+async def test_failure_is_counted_and_next_update_still_runs():
+    seen: list[int] = []
+
+    async def process(update):
+        if update.update_id == 1:
+            raise RuntimeError("handler blew up")
+        seen.append(update.update_id)
+
+    queue = UpdateQueue(process, consumers=2, max_depth=100)
+    queue.start()
+    queue.submit(_update(1, user_id=7))
+    queue.submit(_update(2, user_id=7))
+    await _drain(queue)
+    await queue.stop(drain_s=0)
+
+    assert seen == [2]
+    assert queue.stats == {"processed": 1, "failed": 1, "rejected": 0, "coalesced": 0}
+
+
+@pytest.mark.asyncio
+async def test_submit_refuses_when_full():
+    async def process(update):
+        pass
+
+    queue = UpdateQueue(process, consumers=1, max_depth=2)  # not started: nothing drains
+
+    assert queue.submit(_update(1, user_id=1))
+    assert queue.submit(_update(2, user_id=2))
+    assert not queue.submit(_update(3, user_id=3))
+
+    snapshot = queue.snapshot()
+    assert snapshot["depth"] == 2
+    assert snapshot["keys_waiting"] == 2
+    assert snapshot["rejected"] == 1
+    assert snapshot["oldest_wait_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_lag_is_recorded_per_update():
+    async def process(update):
+        pass
+
+    queue = UpdateQueue(process, consumers=1, max_depth=10)
+    queue.submit(_update(1, user_id=1))
+    queue.submit(_update(2, user_id=2))
+    queue.start()
+    await _drain(queue)
+    await queue.stop(drain_s=0)
+
+    assert queue.lag.count == 2
+    assert queue.snapshot()["duration"]["count"] == 2
+
+
+def _text_update(update_id: int, text: str, user_id: int = 7) -> Update:
+    data = {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "from": {"id": user_id, "is_bot": False, "first_name": "Test"},
+            "chat": {"id": user_id, "type": "private"},
+            "date": 1700000000,
+            "text": text,
+        },
+    }
+    return Update.de_json(data, Bot("123:test"))
+
+
+@pytest.mark.asyncio
+async def test_rapid_texts_are_merged_into_one_update():
+    processed: list[Update] = []
+
+    async def process(update):
+        processed.append(update)
+
+    queue = UpdateQueue(process, consumers=2, max_depth=100, coalesce_window_s=0.05)
+    queue.start()
+    queue.submit(_text_update(1, "done with outreach"))
+    await asyncio.sleep(0.01)
+    queue.submit(_text_update(2, "also energy 4"))
+    queue.submit(_text_update(3, "sent 6 DMs"))
+    await asyncio.sleep(0.2)
+    await _drain(queue)
+    await queue.stop(drain_s=0)
+
+    assert len(processed) == 1
+    assert processed[0].message.text == "done with outreach\nalso energy 4\nsent 6 DMs"
+    assert processed[0].update_id == 3  # replies go to the latest message
+    assert queue.stats["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_texts_outside_the_window_run_separately():
+    processed: list[str] = []
+
+    async def process(update):
+        processed.append(update.message.text)
+
+    queue = UpdateQueue(process, consumers=2, max_depth=100, coalesce_window_s=0.02)
+    queue.start()
+    queue.submit(_text_update(1, "first"))
+    await asyncio.sleep(0.1)
+    queue.submit(_text_update(2, "second"))
+    await asyncio.sleep(0.1)
+    await _drain(queue)
+    await queue.stop(drain_s=0)
+
+    assert processed == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_commands_and_check_ins_are_not_merged():
+    processed: list[str] = []
+
+    async def process(update):
+        processed.append(update.message.text)
+
+    queue = UpdateQueue(process, consumers=1, max_depth=100, coalesce_window_s=0.05)
+    queue.submit(_text_update(1, "status"))
+    queue.submit(_text_update(2, "/start abc"))
+    queue.submit(_text_update(3, "sent 6 DMs"))
+    queue.submit(_text_update(4, "energy 4"))
+    queue.start()
+    await asyncio.sleep(0.2)
+    await _drain(queue)
+    await queue.stop(drain_s=0)
+
+    assert processed == ["status", "/start abc", "sent 6 DMs\nenergy 4"]
+
+
+@pytest.mark.asyncio
+async def test_coalescing_wait_does_not_hold_a_consumer():
+    processed: list[int] = []
+
+    async def process(update):
+        processed.append(update.update_id)
+
+    queue = UpdateQueue(process, consumers=1, max_depth=100, coalesce_window_s=0.2)
+    queue.start()
+    queue.submit(_text_update(1, "done with outreach", user_id=7))
+    queue.submit(_update(2, user_id=8))
+    await asyncio.sleep(0.05)
+
+    assert processed == [2]  # user 7 is still settling
+    assert queue.snapshot()["keys_settling"] == 1
+
+    await asyncio.sleep(0.3)
+    await _drain(queue)
+    await queue.stop(drain_s=0)
+
+    assert processed == [2, 1]
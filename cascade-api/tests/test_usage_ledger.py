@@ -0,0 +1,169 @@
+"""Tests for the LLM usage ledger."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cascade_api.llm import gateway
+from cascade_api.observability import usage_ledger
+from cascade_api.observability.usage_ledger import (
+    UsageLedger,
+    bind_tenant,
+    estimate_cost,
+    record_llm_call,
+)
+
+
+def test_estimate_cost_uses_longest_prefix_and_cache_prices():
+    # Haiku 4.5: $1/M input, $5/M output, $0.10/M cache read
+    cost = estimate_cost(
+        "claude-haiku-4-5-20251001",
+        input_tokens=1_000_000,
+        output_tokens=100_000,
+        cache_read_input_tokens=1_000_000,
+    )
+    assert cost == pytest.approx(1.0 + 0.5 + 0.1)
+    assert estimate_cost("unknown-model", input_tokens=1000) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_ledger_flushes_in_batches():
+    sb = MagicMock()
+    ledger = UsageLedger(supabase_factory=lambda: sb, batch_size=3, flush_interval_s=60)
+
+    for i in range(3):
+        ledger.record({"n": i})
+    await asyncio.sleep(0)  # let the batch flush task run
+    await asyncio.sleep(0)
+
+    sb.table.assert_called_with("llm_usage")
+    sb.table.return_value.insert.assert_called_once_with([{"n": 0}, {"n": 1}, {"n": 2}])
+    assert ledger.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_ledger_keeps_rows_when_insert_fails():
+    sb = MagicMock()
+    sb.table.return_value.insert.return_value.execute.side_effect = RuntimeError("down")
+    ledger = UsageLedger(supabase_factory=lambda: sb, batch_size=10, flush_interval_s=60)
+    ledger.record({"n": 1})
+
+    assert await ledger.flush() == 0
+    assert ledger.pending == 1
+    ledger._timer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_record_llm_call_uses_bound_tenant():
+    ledger = MagicMock()
+    with (
+        patch.object(usage_ledger, "ledger_enabled", return_value=True),
+        patch.object(usage_ledger, "get_usage_ledger", return_value=ledger),
+        bind_tenant("tenant-9"),
+    ):
+        record_llm_call(
+            provider="anthropic",
+            model="claude-sonnet-4-6",
+            call_site="agent.loop",
+            latency_ms=812.4,
+            round_num=2,
+            input_tokens=1000,
+            output_tokens=200,
+        )
+
+    row = ledger.record.call_args[0][0]
+    assert row["tenant_id"] == "tenant-9"
+    assert row["round"] == 2
+    assert row["latency_ms"] == 812
+    assert row["cost_usd"] == pytest.approx(0.003 + 0.003)
+
+
+@pytest.mark.asyncio
+async def test_gateway_records_every_call():
+    """create_message should write one ledger row with tokens and stop reason."""
+    gateway.reset()
+    response = MagicMock()
+    response.stop_reason = "end_turn"
+    response.usage = MagicMock(
+        input_tokens=50,
+        output_tokens=10,
+        cache_creation_input_tokens=0,
+        cache_read_input_tokens=400,
+    )
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(return_value=response)
+
+    with (
+        patch("cascade_api.llm.gateway.get_client", return_value=mock_client),
+        patch("cascade_api.llm.gateway.record_llm_call") as mock_record,
+    ):
+        await gateway.create_message(
+            call_site="observability.evals", tenant_id="tenant-1", model="claude-haiku-4-5"
+        )
+
+    kwargs = mock_record.call_args.kwargs
+    assert kwargs["call_site"] == "observability.evals"
+    assert kwargs["tenant_id"] == "tenant-1"
+    assert kwargs["stop_reason"] == "end_turn"
+    assert kwargs["cache_read_input_tokens"] == 400
+    assert kwargs["ok"] is True
+    gateway.reset()
+
+
+@pytest.mark.asyncio
+async def test_ledger_rebuffers_only_unwritten_batches():
+    sb = MagicMock()
+    sb.table.return_value.insert.return_value.execute.side_effect = [
+        MagicMock(),
+        RuntimeError("down"),
+    ]
+    ledger = UsageLedger(supabase_factory=lambda: sb, batch_size=2, flush_interval_s=60)
+    for i in range(4):
+        ledger._buffer.append({"n": i})
+
+    assert await ledger.flush() == 2
+    assert ledger._buffer == [{"n": 2}, {"n": 3}]
+
+
+@pytest.mark.asyncio
+async def test_ledger_drops_only_rejected_rows():
+    from postgrest.exceptions import APIError
+
+    fk_violation = APIError({"code": "23503", "message": "violates foreign key constraint"})
+
+    def insert(rows):
+        query = MagicMock()
+        bad = any(r.get("tenant_id") == "deleted" for r in rows)
+        query.execute.side_effect = fk_violation if bad else None
+        return query
+
+    sb = MagicMock()
+    sb.table.return_value.insert.side_effect = insert
+    ledger = UsageLedger(supabase_factory=lambda: sb, batch_size=3, flush_interval_s=60)
+    ledger._buffer = [{"n": 0}, {"n": 1, "tenant_id": "deleted"}, {"n": 2}, {"n": 3}]
+
+    assert await ledger.flush() == 3
+    assert ledger.pending == 0
+    assert ledger.dropped == 1
+
+
+def test_usage_rollups_validate_tenant_id():
+    from fastapi.testclient import TestClient
+
+    from cascade_api.main import app
+
+    sb = MagicMock()
+    tenant_id = "0b7e6f7e-5f0a-4d8e-9a43-6a1d2c3b4e5f"
+    with (
+        patch("cascade_api.dependencies.get_supabase", return_value=sb),
+        patch("cascade_api.api.cron.settings.cron_secret", ""),
+    ):
+        client = TestClient(app)
+        assert client.get("/api/metrics/usage?tenant_id=not-a-uuid").status_code == 422
+        resp = client.get(f"/api/metrics/usage?tenant_id={tenant_id}")
+
+    assert resp.status_code == 200
+    assert sb.rpc.call_args_list[0].args[1]["p_tenant_id"] == tenant_id
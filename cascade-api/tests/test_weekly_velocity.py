@@ -0,0 +1,46 @@
+"""Tests for the weekly velocity rollup backfill job."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from cascade_api.db.tracker import backfill_weekly_velocity
+
+
+@pytest.mark.asyncio
+async def test_backfill_calls_rpc_per_tenant():
+    sb = MagicMock()
+    sb.rpc.return_value.execute.return_value.data = 12
+
+    assert await backfill_weekly_velocity(sb, "tenant-1") == 12
+    sb.rpc.assert_called_once_with("backfill_weekly_velocity", {"p_tenant_id": "tenant-1"})
+
+
+def test_cron_backfill_counts_weeks_and_failures():
+    sb = MagicMock()
+    sb.table.return_value.select.return_value.execute.return_value.data = [
+        {"id": "t1"},
+        {"id": "t2"},
+        {"id": "t3"},
+    ]
+    sb.rpc.return_value.execute.side_effect = [
+        MagicMock(data=4),
+        RuntimeError("lock timeout"),
+        MagicMock(data=2),
+    ]
+
+    with (
+        patch("cascade_api.dependencies.get_supabase", return_value=sb),
+        patch("cascade_api.api.cron.settings.cron_secret", "s3cret"),
+    ):
+        from cascade_api.main import app
+
+        client = TestClient(app)
+        assert client.post("/api/cron/backfill-velocity").status_code == 403
+        resp = client.post("/api/cron/backfill-velocity", headers={"X-Cron-Secret": "s3cret"})
+
+    assert resp.status_code == 200
+    assert resp.json() == {"tenants": 3, "weeks": 6, "failed": 1}
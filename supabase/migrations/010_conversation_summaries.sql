@@ -0,0 +1,22 @@
+-- ============================================================
+-- 010: Rolling conversation summaries
+-- ============================================================
+-- One row per tenant. Agent-history turns older than the recent token
+-- budget are folded into `summary` by a background job; everything up to
+-- and including `summarized_through_id` is covered.
+
+CREATE TABLE conversation_summaries (
+  tenant_id UUID PRIMARY KEY REFERENCES tenants(id) ON DELETE CASCADE,
+  summary TEXT NOT NULL DEFAULT '',
+  summarized_through_id BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE conversation_summaries ENABLE ROW LEVEL SECURITY;
+CREATE POLICY tenant_isolation_conversation_summaries ON conversation_summaries
+  FOR ALL USING (tenant_id IN (SELECT id FROM tenants WHERE user_id = auth.uid()));
+
+-- Recent agent history is read newest-first by id on every turn
+CREATE INDEX IF NOT EXISTS idx_conversations_agent_history
+  ON conversations(tenant_id, id DESC)
+  WHERE source = 'agent_history';
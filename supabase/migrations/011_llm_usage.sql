@@ -0,0 +1,88 @@
+-- ============================================================
+-- 011: LLM usage ledger — one row per model call
+-- ============================================================
+-- Written in batches by cascade_api.observability.usage_ledger. Service
+-- role only (RLS on, no policies).
+
+CREATE TABLE llm_usage (
+  id BIGSERIAL PRIMARY KEY,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  tenant_id UUID REFERENCES tenants(id) ON DELETE SET NULL,
+  provider TEXT NOT NULL CHECK (provider IN ('anthropic', 'gemini')),
+  model TEXT NOT NULL,
+  call_site TEXT NOT NULL,          -- e.g. agent.loop, observability.evals, memory.extract
+  round SMALLINT,                   -- agent tool-use round, when applicable
+  input_tokens INTEGER NOT NULL DEFAULT 0,
+  output_tokens INTEGER NOT NULL DEFAULT 0,
+  cache_creation_input_tokens INTEGER NOT NULL DEFAULT 0,
+  cache_read_input_tokens INTEGER NOT NULL DEFAULT 0,
+  latency_ms INTEGER NOT NULL,
+  stop_reason TEXT,
+  ok BOOLEAN NOT NULL DEFAULT TRUE,
+  cost_usd NUMERIC(12, 6) NOT NULL DEFAULT 0
+);
+
+CREATE INDEX idx_llm_usage_tenant_time ON llm_usage(tenant_id, created_at DESC);
+CREATE INDEX idx_llm_usage_call_site_time ON llm_usage(call_site, created_at DESC);
+
+ALTER TABLE llm_usage ENABLE ROW LEVEL SECURITY;
+
+-- ============================================================
+-- Rollups
+-- ============================================================
+
+-- Per-tenant daily cost (UTC days). p_tenant_id NULL = all tenants.
+CREATE OR REPLACE FUNCTION llm_cost_daily(
+  p_since DATE DEFAULT (CURRENT_DATE - 30),
+  p_tenant_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+  tenant_id UUID,
+  day DATE,
+  calls BIGINT,
+  input_tokens BIGINT,
+  output_tokens BIGINT,
+  cache_read_input_tokens BIGINT,
+  cost_usd NUMERIC
+)
+LANGUAGE sql STABLE AS $$
+  SELECT
+    u.tenant_id,
+    (u.created_at AT TIME ZONE 'UTC')::date AS day,
+    COUNT(*) AS calls,
+    SUM(u.input_tokens) AS input_tokens,
+    SUM(u.output_tokens) AS output_tokens,
+    SUM(u.cache_read_input_tokens) AS cache_read_input_tokens,
+    SUM(u.cost_usd) AS cost_usd
+  FROM llm_usage u
+  WHERE u.created_at >= p_since
+    AND (p_tenant_id IS NULL OR u.tenant_id = p_tenant_id)
+  GROUP BY u.tenant_id, day
+  ORDER BY day DESC, cost_usd DESC;
+$$;
+
+-- Latency percentiles per call site and model over a trailing window.
+CREATE OR REPLACE FUNCTION llm_latency_by_call_site(
+  p_since TIMESTAMPTZ DEFAULT (NOW() - INTERVAL '7 days')
+)
+RETURNS TABLE (
+  call_site TEXT,
+  model TEXT,
+  calls BIGINT,
+  error_rate NUMERIC,
+  p50_ms DOUBLE PRECISION,
+  p95_ms DOUBLE PRECISION
+)
+LANGUAGE sql STABLE AS $$
+  SELECT
+    u.call_site,
+    u.model,
+    COUNT(*) AS calls,
+    ROUND(AVG(CASE WHEN u.ok THEN 0 ELSE 1 END)::numeric, 4) AS error_rate,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY u.latency_ms) AS p50_ms,
+    percentile_cont(0.95) WITHIN GROUP (ORDER BY u.latency_ms) AS p95_ms
+  FROM llm_usage u
+  WHERE u.created_at >= p_since
+  GROUP BY u.call_site, u.model
+  ORDER BY p95_ms DESC;
+$$;
@@ -0,0 +1,58 @@
+-- ============================================================
+-- 012: Status snapshot in one round trip
+-- ============================================================
+-- Everything /api/status and the agent's get_status tool need: velocity,
+-- this week's task counts, this month's entry count, the rest-debt streak
+-- and active adaptations. Replaces five sequential queries (one of them an
+-- unbounded tracker_entries scan) with one call.
+--
+-- p_today is passed by the API so "this week" matches the caller's date.
+
+CREATE OR REPLACE FUNCTION get_status_snapshot(
+  p_tenant_id UUID,
+  p_today DATE DEFAULT CURRENT_DATE,
+  p_weeks INTEGER DEFAULT 4
+)
+RETURNS JSONB
+LANGUAGE sql STABLE AS $$
+  WITH week AS (
+    SELECT
+      COUNT(*) FILTER (WHERE t.category = 'core' AND t.completed) AS core_completed,
+      COUNT(*) FILTER (WHERE t.category = 'core') AS core_total,
+      COUNT(*) FILTER (WHERE t.category = 'flex' AND t.completed) AS flex_completed,
+      COUNT(*) FILTER (WHERE t.category = 'flex') AS flex_total
+    FROM tasks t
+    WHERE t.tenant_id = p_tenant_id
+      AND t.week_start = p_today - (EXTRACT(ISODOW FROM p_today)::int - 1)
+  ),
+  -- Consecutive days with an entry, counting back from today (max 14).
+  -- Each probe is an index lookup on idx_tracker_tenant_date.
+  streak AS (
+    SELECT COALESCE(MIN(d.i), 14) AS days
+    FROM generate_series(0, 13) AS d(i)
+    WHERE NOT EXISTS (
+      SELECT 1 FROM tracker_entries e
+      WHERE e.tenant_id = p_tenant_id AND e.date = p_today - d.i
+    )
+  )
+  SELECT jsonb_build_object(
+    'velocity_weeks', COALESCE(
+      (SELECT jsonb_agg(to_jsonb(v) ORDER BY v.week_start DESC)
+       FROM get_weekly_velocity(p_tenant_id, p_weeks) v),
+      '[]'::jsonb
+    ),
+    'week_progress', (SELECT to_jsonb(w) FROM week w),
+    'month_entries_count', (
+      SELECT COUNT(*) FROM tracker_entries e
+      WHERE e.tenant_id = p_tenant_id
+        AND e.date >= date_trunc('month', p_today)::date
+    ),
+    'rest_debt_days', (SELECT days FROM streak),
+    'active_adaptations', COALESCE(
+      (SELECT jsonb_agg(to_jsonb(a) ORDER BY a.detected_at DESC)
+       FROM adaptations a
+       WHERE a.tenant_id = p_tenant_id AND a.active),
+      '[]'::jsonb
+    )
+  );
+$$;
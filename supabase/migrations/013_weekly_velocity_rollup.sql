@@ -0,0 +1,174 @@
+-- ============================================================
+-- 013: Weekly velocity rollup
+-- ============================================================
+-- get_weekly_velocity() used to GROUP BY every task a tenant ever had, so
+-- /api/status, /api/plan and the get_status tool got slower with account
+-- age. Per-week counts now live in weekly_velocity, kept current by a
+-- trigger on tasks; the RPC reads the newest p_weeks rows.
+--
+-- Existing tenants are backfilled at the end of this migration, before the
+-- new RPC is read. POST /api/cron/backfill-velocity re-runs the backfill per
+-- tenant (idempotent) to repair any drift.
+
+CREATE TABLE weekly_velocity (
+  tenant_id UUID NOT NULL REFERENCES tenants(id) ON DELETE CASCADE,
+  week_start DATE NOT NULL,
+  core_completed INTEGER NOT NULL DEFAULT 0,
+  core_total INTEGER NOT NULL DEFAULT 0,
+  flex_completed INTEGER NOT NULL DEFAULT 0,
+  flex_total INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+  PRIMARY KEY (tenant_id, week_start)
+);
+
+ALTER TABLE weekly_velocity ENABLE ROW LEVEL SECURITY;
+CREATE POLICY tenant_isolation_weekly_velocity ON weekly_velocity
+  FOR ALL USING (tenant_id IN (SELECT id FROM tenants WHERE user_id = auth.uid()));
+
+-- ============================================================
+-- Trigger maintenance
+-- ============================================================
+
+-- Add (p_sign = 1) or remove (p_sign = -1) one task from its week's counts.
+-- Takes the tenant's velocity lock, held until commit, so a backfill never
+-- runs between a task write and its delta.
+CREATE OR REPLACE FUNCTION _weekly_velocity_apply(
+  p_tenant_id UUID,
+  p_week_start DATE,
+  p_category TEXT,
+  p_completed BOOLEAN,
+  p_sign INTEGER
+)
+RETURNS VOID
+LANGUAGE plpgsql AS $$
+DECLARE
+  v_core_done INTEGER := CASE WHEN p_category = 'core' AND p_completed THEN p_sign ELSE 0 END;
+  v_core      INTEGER := CASE WHEN p_category = 'core' THEN p_sign ELSE 0 END;
+  v_flex_done INTEGER := CASE WHEN p_category = 'flex' AND p_completed THEN p_sign ELSE 0 END;
+  v_flex      INTEGER := CASE WHEN p_category = 'flex' THEN p_sign ELSE 0 END;
+BEGIN
+  PERFORM pg_advisory_xact_lock(hashtext(p_tenant_id::text));
+
+  INSERT INTO weekly_velocity AS w
+    (tenant_id, week_start, core_completed, core_total, flex_completed, flex_total)
+  VALUES (p_tenant_id, p_week_start, v_core_done, v_core, v_flex_done, v_flex)
+  ON CONFLICT (tenant_id, week_start) DO UPDATE SET
+    core_completed = w.core_completed + EXCLUDED.core_completed,
+    core_total     = w.core_total + EXCLUDED.core_total,
+    flex_completed = w.flex_completed + EXCLUDED.flex_completed,
+    flex_total     = w.flex_total + EXCLUDED.flex_total,
+    updated_at     = NOW();
+
+  -- A week with no tasks left disappears, matching the old GROUP BY
+  DELETE FROM weekly_velocity
+  WHERE tenant_id = p_tenant_id
+    AND week_start = p_week_start
+    AND core_total <= 0
+    AND flex_total <= 0;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION tasks_weekly_velocity_trigger()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM _weekly_velocity_apply(OLD.tenant_id, OLD.week_start, OLD.category, OLD.completed, -1);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    PERFORM _weekly_velocity_apply(NEW.tenant_id, NEW.week_start, NEW.category, NEW.completed, 1);
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER tasks_weekly_velocity_insert_delete
+  AFTER INSERT OR DELETE ON tasks
+  FOR EACH ROW EXECUTE FUNCTION tasks_weekly_velocity_trigger();
+
+-- Title/sort/schedule edits don't touch the counts
+CREATE TRIGGER tasks_weekly_velocity_update
+  AFTER UPDATE OF tenant_id, week_start, category, completed ON tasks
+  FOR EACH ROW
+  WHEN (
+    OLD.tenant_id IS DISTINCT FROM NEW.tenant_id
+    OR OLD.week_start IS DISTINCT FROM NEW.week_start
+    OR OLD.category IS DISTINCT FROM NEW.category
+    OR OLD.completed IS DISTINCT FROM NEW.completed
+  )
+  EXECUTE FUNCTION tasks_weekly_velocity_trigger();
+
+-- ============================================================
+-- Backfill
+-- ============================================================
+
+-- Recompute one tenant's rollup from tasks. Returns the number of weeks.
+CREATE OR REPLACE FUNCTION backfill_weekly_velocity(p_tenant_id UUID)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+  v_weeks INTEGER;
+BEGIN
+  -- Serialize with concurrent task writes for this tenant, including
+  -- inserts into a new week, so no trigger delta lands between the recount
+  -- and the replace. Writers that got the lock first have committed by now,
+  -- and the statements below see their tasks.
+  PERFORM pg_advisory_xact_lock(hashtext(p_tenant_id::text));
+
+  DELETE FROM weekly_velocity WHERE tenant_id = p_tenant_id;
+
+  INSERT INTO weekly_velocity
+    (tenant_id, week_start, core_completed, core_total, flex_completed, flex_total)
+  SELECT
+    t.tenant_id,
+    t.week_start,
+    COUNT(*) FILTER (WHERE t.category = 'core' AND t.completed),
+    COUNT(*) FILTER (WHERE t.category = 'core'),
+    COUNT(*) FILTER (WHERE t.category = 'flex' AND t.completed),
+    COUNT(*) FILTER (WHERE t.category = 'flex')
+  FROM tasks t
+  WHERE t.tenant_id = p_tenant_id
+  GROUP BY t.tenant_id, t.week_start;
+
+  GET DIAGNOSTICS v_weeks = ROW_COUNT;
+  RETURN v_weeks;
+END;
+$$;
+
+-- ============================================================
+-- Read path: same signature and columns as 001
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION get_weekly_velocity(
+  p_tenant_id UUID,
+  p_weeks INTEGER DEFAULT 4
+)
+RETURNS TABLE (
+  week_start DATE,
+  core_completed BIGINT,
+  core_total BIGINT,
+  flex_completed BIGINT,
+  flex_total BIGINT,
+  completion_rate NUMERIC
+)
+LANGUAGE sql STABLE
+AS $$
+  SELECT
+    w.week_start,
+    w.core_completed::BIGINT,
+    w.core_total::BIGINT,
+    w.flex_completed::BIGINT,
+    w.flex_total::BIGINT,
+    ROUND(w.core_completed::NUMERIC / NULLIF(w.core_total, 0) * 100, 1) AS completion_rate
+  FROM weekly_velocity w
+  WHERE w.tenant_id = p_tenant_id
+  ORDER BY w.week_start DESC
+  LIMIT p_weeks;
+$$;
+
+-- ============================================================
+-- Backfill existing tenants
+-- ============================================================
+
+SELECT backfill_weekly_velocity(id) FROM tenants;
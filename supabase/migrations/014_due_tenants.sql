@@ -0,0 +1,62 @@
+-- ============================================================
+-- 014: Due-tenant selection for the scheduler
+-- ============================================================
+-- The daily cron used to load every Telegram-linked tenant, filter
+-- is_user_active / preferred time in Python and check message_deliveries
+-- once per tenant. get_due_tenants() does all of that in one query and
+-- returns only tenants whose message should go out now.
+--
+-- Local time is computed once per distinct timezone, then tenants are
+-- range-scanned per zone on (timezone, morning_hour, morning_minute).
+-- Unknown timezone names fall back to America/New_York, as in Python.
+
+CREATE INDEX IF NOT EXISTS idx_tenants_schedule
+  ON tenants(timezone, morning_hour, morning_minute)
+  WHERE telegram_id IS NOT NULL;
+
+-- Anti-join probe: (tenant_id, message_type, scheduled_for) is already
+-- covered by the UNIQUE constraint from 005.
+
+CREATE OR REPLACE FUNCTION get_due_tenants(
+  p_message_type TEXT DEFAULT 'morning',
+  p_now TIMESTAMPTZ DEFAULT NOW()
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  telegram_id BIGINT,
+  completed_weekly_reviews INTEGER,
+  review_day SMALLINT,
+  local_date DATE
+)
+LANGUAGE sql STABLE AS $$
+  WITH zones AS (
+    SELECT
+      t.timezone,
+      p_now AT TIME ZONE COALESCE(z.name, 'America/New_York') AS local_ts
+    FROM (
+      SELECT DISTINCT timezone FROM tenants WHERE telegram_id IS NOT NULL
+    ) t
+    LEFT JOIN pg_timezone_names z ON z.name = t.timezone
+  )
+  SELECT
+    t.id,
+    t.user_id,
+    t.telegram_id,
+    t.completed_weekly_reviews,
+    t.review_day,
+    z.local_ts::date AS local_date
+  FROM zones z
+  JOIN tenants t
+    ON t.timezone = z.timezone
+   AND t.telegram_id IS NOT NULL
+   AND (t.morning_hour, t.morning_minute)
+       <= (EXTRACT(HOUR FROM z.local_ts)::int, EXTRACT(MINUTE FROM z.local_ts)::int)
+  WHERE is_tenant_active(t)
+    AND NOT EXISTS (
+      SELECT 1 FROM message_deliveries d
+      WHERE d.tenant_id = t.id
+        AND d.message_type = p_message_type
+        AND d.scheduled_for = z.local_ts::date
+    );
+$$;
@@ -0,0 +1,103 @@
+-- ============================================================
+-- 015: Claim-based message delivery
+-- ============================================================
+-- "Check message_deliveries, then insert after sending" let two cron ticks
+-- (or two replicas) both generate and send the same message. A delivery is
+-- now claimed first, atomically; only the claimant sends.
+--
+--   claimed -> sent      normal path
+--   claimed -> failed    error; retried on a later tick
+--   claimed (lease expired) worker died; retried on a later tick
+--
+-- Retries stop after p_max_attempts.
+
+ALTER TABLE message_deliveries
+  ADD COLUMN status TEXT NOT NULL DEFAULT 'sent'
+    CHECK (status IN ('claimed', 'sent', 'failed')),
+  ADD COLUMN lease_expires_at TIMESTAMPTZ,
+  ADD COLUMN attempts SMALLINT NOT NULL DEFAULT 1,
+  ADD COLUMN last_error TEXT;
+
+-- sent_at is set when the message actually goes out
+ALTER TABLE message_deliveries ALTER COLUMN sent_at DROP NOT NULL;
+ALTER TABLE message_deliveries ALTER COLUMN sent_at DROP DEFAULT;
+
+-- Returns the delivery id when the caller won the claim, NULL otherwise.
+CREATE OR REPLACE FUNCTION claim_delivery(
+  p_tenant_id UUID,
+  p_message_type TEXT,
+  p_scheduled_for DATE,
+  p_lease_seconds INTEGER DEFAULT 300,
+  p_max_attempts INTEGER DEFAULT 3
+)
+RETURNS BIGINT
+LANGUAGE sql VOLATILE AS $$
+  INSERT INTO message_deliveries AS d
+    (tenant_id, message_type, scheduled_for, status, lease_expires_at, sent_at)
+  VALUES (
+    p_tenant_id, p_message_type, p_scheduled_for, 'claimed',
+    NOW() + make_interval(secs => p_lease_seconds), NULL
+  )
+  ON CONFLICT (tenant_id, message_type, scheduled_for) DO UPDATE SET
+    status = 'claimed',
+    lease_expires_at = EXCLUDED.lease_expires_at,
+    attempts = d.attempts + 1,
+    last_error = NULL
+  WHERE d.attempts < p_max_attempts
+    AND (d.status = 'failed' OR (d.status = 'claimed' AND d.lease_expires_at < NOW()))
+  RETURNING d.id;
+$$;
+
+-- Due tenants now also skip deliveries that are claimed (lease live) or
+-- out of attempts; failed and expired claims come back around.
+DROP FUNCTION IF EXISTS get_due_tenants(TEXT, TIMESTAMPTZ);
+
+CREATE OR REPLACE FUNCTION get_due_tenants(
+  p_message_type TEXT DEFAULT 'morning',
+  p_now TIMESTAMPTZ DEFAULT NOW(),
+  p_max_attempts INTEGER DEFAULT 3
+)
+RETURNS TABLE (
+  id UUID,
+  user_id UUID,
+  telegram_id BIGINT,
+  completed_weekly_reviews INTEGER,
+  review_day SMALLINT,
+  local_date DATE
+)
+LANGUAGE sql STABLE AS $$
+  WITH zones AS (
+    SELECT
+      t.timezone,
+      p_now AT TIME ZONE COALESCE(z.name, 'America/New_York') AS local_ts
+    FROM (
+      SELECT DISTINCT timezone FROM tenants WHERE telegram_id IS NOT NULL
+    ) t
+    LEFT JOIN pg_timezone_names z ON z.name = t.timezone
+  )
+  SELECT
+    t.id,
+    t.user_id,
+    t.telegram_id,
+    t.completed_weekly_reviews,
+    t.review_day,
+    z.local_ts::date AS local_date
+  FROM zones z
+  JOIN tenants t
+    ON t.timezone = z.timezone
+   AND t.telegram_id IS NOT NULL
+   AND (t.morning_hour, t.morning_minute)
+       <= (EXTRACT(HOUR FROM z.local_ts)::int, EXTRACT(MINUTE FROM z.local_ts)::int)
+  WHERE is_tenant_active(t)
+    AND NOT EXISTS (
+      SELECT 1 FROM message_deliveries d
+      WHERE d.tenant_id = t.id
+        AND d.message_type = p_message_type
+        AND d.scheduled_for = z.local_ts::date
+        AND (
+          d.status = 'sent'
+          OR (d.status = 'claimed' AND d.lease_expires_at >= p_now)
+          OR d.attempts >= p_max_attempts
+        )
+    );
+$$;
@@ -0,0 +1,91 @@
+-- ============================================================
+-- 016: Background job queue
+-- ============================================================
+-- Durable replacement for fire-and-forget asyncio tasks (memory
+-- extraction, eval scoring, daily fan-out, memory decay). Workers claim
+-- with FOR UPDATE SKIP LOCKED, so any number of in-process or standalone
+-- workers can share the table. See cascade_api/jobs.
+--
+--   queued -> running -> done
+--                     -> queued (retry with backoff, run_at in the future)
+--                     -> dead   (out of attempts)
+--
+-- A running job whose lease (locked_until) lapses is picked up again,
+-- which counts as an attempt.
+
+CREATE TABLE jobs (
+  id BIGSERIAL PRIMARY KEY,
+  kind TEXT NOT NULL,                 -- handler name, e.g. memory.extract
+  payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+  priority SMALLINT NOT NULL DEFAULT 0,  -- higher runs first
+  status TEXT NOT NULL DEFAULT 'queued'
+    CHECK (status IN ('queued', 'running', 'done', 'dead')),
+  run_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  attempts SMALLINT NOT NULL DEFAULT 0,
+  max_attempts SMALLINT NOT NULL DEFAULT 5,
+  timeout_s INTEGER NOT NULL DEFAULT 60,
+  locked_by TEXT,
+  locked_until TIMESTAMPTZ,
+  last_error TEXT,
+  dedupe_key TEXT UNIQUE,             -- optional; second enqueue is a no-op
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  finished_at TIMESTAMPTZ
+);
+
+CREATE INDEX idx_jobs_ready ON jobs(priority DESC, run_at) WHERE status = 'queued';
+CREATE INDEX idx_jobs_leases ON jobs(locked_until) WHERE status = 'running';
+CREATE INDEX idx_jobs_finished ON jobs(finished_at) WHERE status IN ('done', 'dead');
+
+ALTER TABLE jobs ENABLE ROW LEVEL SECURITY;  -- service role only
+
+-- Claim up to p_limit runnable jobs for p_worker. Each job's lease is its
+-- own timeout plus p_grace_seconds.
+CREATE OR REPLACE FUNCTION claim_jobs(
+  p_worker TEXT,
+  p_limit INTEGER DEFAULT 1,
+  p_grace_seconds INTEGER DEFAULT 30
+)
+RETURNS SETOF jobs
+LANGUAGE plpgsql VOLATILE AS $$
+BEGIN
+  -- Lapsed leases with no attempts left are dead, not retried
+  UPDATE jobs
+  SET status = 'dead',
+      last_error = COALESCE(last_error, 'lease expired'),
+      finished_at = NOW()
+  WHERE status = 'running'
+    AND locked_until < NOW()
+    AND attempts >= max_attempts;
+
+  RETURN QUERY
+  WITH picked AS (
+    SELECT j.id
+    FROM jobs j
+    WHERE (j.status = 'queued' AND j.run_at <= NOW())
+       OR (j.status = 'running' AND j.locked_until < NOW())
+    ORDER BY j.priority DESC, j.run_at
+    LIMIT p_limit
+    FOR UPDATE SKIP LOCKED
+  )
+  UPDATE jobs j
+  SET status = 'running',
+      locked_by = p_worker,
+      locked_until = NOW() + make_interval(secs => j.timeout_s + p_grace_seconds),
+      attempts = j.attempts + 1
+  FROM picked
+  WHERE j.id = picked.id
+  RETURNING j.*;
+END;
+$$;
+
+-- Retention for finished jobs (run daily by the jobs.purge job)
+CREATE OR REPLACE FUNCTION purge_finished_jobs(p_keep INTERVAL DEFAULT INTERVAL '7 days')
+RETURNS INTEGER
+LANGUAGE sql VOLATILE AS $$
+  WITH gone AS (
+    DELETE FROM jobs
+    WHERE status IN ('done', 'dead') AND finished_at < NOW() - p_keep
+    RETURNING 1
+  )
+  SELECT COUNT(*)::int FROM gone;
+$$;
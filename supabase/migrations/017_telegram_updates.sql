@@ -0,0 +1,30 @@
+-- ============================================================
+-- 017: Telegram update deduplication
+-- ============================================================
+-- Telegram redelivers an update when the webhook is slow or fails, and
+-- each delivery would otherwise run the agent again (duplicate turns,
+-- double-applied log_progress, double LLM spend). The webhook inserts the
+-- update_id here before processing; a conflicting insert means another
+-- request or replica already took it. See cascade_api/telegram/dedup.py.
+
+CREATE TABLE telegram_updates (
+  update_id BIGINT PRIMARY KEY,
+  received_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_telegram_updates_received ON telegram_updates(received_at);
+
+ALTER TABLE telegram_updates ENABLE ROW LEVEL SECURITY;  -- service role only
+
+-- Telegram stops redelivering after 24 hours; keep a margin, then purge
+-- (run daily by the jobs.purge job)
+CREATE OR REPLACE FUNCTION purge_telegram_updates(p_keep INTERVAL DEFAULT INTERVAL '3 days')
+RETURNS INTEGER
+LANGUAGE sql VOLATILE AS $$
+  WITH gone AS (
+    DELETE FROM telegram_updates
+    WHERE received_at < NOW() - p_keep
+    RETURNING 1
+  )
+  SELECT COUNT(*)::int FROM gone;
+$$;
@@ -0,0 +1,87 @@
+-- ============================================================
+-- 018: Two-phase memory search
+-- ============================================================
+-- match_memories ordered by similarity * decay * confidence. pgvector can
+-- only use the HNSW index for ORDER BY embedding <=> q, so every recall
+-- computed the distance to all of a tenant's active memories.
+--
+-- Phase one now pulls match_count * match_oversample nearest candidates by
+-- raw distance (index-assisted); phase two applies the threshold and ranks
+-- those candidates by decay and confidence. A memory that is close but
+-- outside the candidate set is no longer considered, so raise
+-- match_oversample if recall suffers (benchmarks/bench_memory_recall.py).
+--
+-- Ranking now uses (0.3 + 0.7 * decay_score), matching the memory
+-- package's SQL template and SearchResult.rank_score, so a fully decayed
+-- memory keeps 30% of its weight instead of dropping to zero.
+
+DROP FUNCTION IF EXISTS match_memories(VECTOR(768), UUID, INTEGER, FLOAT);
+
+CREATE OR REPLACE FUNCTION match_memories(
+  query_embedding VECTOR(768),
+  match_tenant_id UUID,
+  match_count INTEGER DEFAULT 5,
+  match_threshold FLOAT DEFAULT 0.5,
+  match_oversample INTEGER DEFAULT 4
+)
+RETURNS TABLE (
+  id UUID,
+  content TEXT,
+  memory_type TEXT,
+  tags TEXT[],
+  confidence REAL,
+  decay_score REAL,
+  similarity FLOAT,
+  created_at TIMESTAMPTZ,
+  last_confirmed_at TIMESTAMPTZ
+)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  candidate_count INTEGER := GREATEST(match_count * GREATEST(match_oversample, 1), 1);
+BEGIN
+  -- The HNSW scan yields at most ef_search rows; size it to the candidate set.
+  -- pgvector rejects values above 1000, so larger requests scan with 1000.
+  PERFORM set_config('hnsw.ef_search', LEAST(GREATEST(candidate_count, 40), 1000)::text, true);
+  -- pgvector >= 0.8: keep scanning when the tenant filter drops rows
+  BEGIN
+    PERFORM set_config('hnsw.iterative_scan', 'relaxed_order', true);
+  EXCEPTION WHEN OTHERS THEN
+    NULL;
+  END;
+
+  RETURN QUERY
+  WITH candidates AS (
+    SELECT
+      m.id,
+      m.content,
+      m.memory_type,
+      m.tags,
+      m.confidence,
+      m.decay_score,
+      m.embedding <=> query_embedding AS distance,
+      m.created_at,
+      m.last_confirmed_at
+    FROM memories m
+    WHERE m.tenant_id = match_tenant_id
+      AND m.status = 'active'
+      AND m.embedding IS NOT NULL
+    ORDER BY m.embedding <=> query_embedding
+    LIMIT candidate_count
+  )
+  SELECT
+    c.id,
+    c.content,
+    c.memory_type,
+    c.tags,
+    c.confidence,
+    c.decay_score,
+    (1 - c.distance)::float AS similarity,
+    c.created_at,
+    c.last_confirmed_at
+  FROM candidates c
+  WHERE 1 - c.distance > match_threshold
+  ORDER BY (1 - c.distance) * (0.3 + 0.7 * c.decay_score) * c.confidence DESC
+  LIMIT match_count;
+END;
+$$;
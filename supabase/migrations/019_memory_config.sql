@@ -0,0 +1,22 @@
+-- ============================================================
+-- 019: Record the memory embedding width
+-- ============================================================
+-- memories.embedding is VECTOR(768) (009), but nothing stopped the app
+-- from being configured with a different embedder width; every insert
+-- and match_memories call would then fail at runtime. The memory
+-- package's SQL template records the width in _cascade_memory_config and
+-- SupabaseStore.initialize checks it at startup, raising
+-- DimensionMismatchError on a mismatch. This brings the app schema in
+-- line with the template.
+
+CREATE TABLE IF NOT EXISTS _cascade_memory_config (
+  key TEXT PRIMARY KEY,
+  value TEXT NOT NULL,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE _cascade_memory_config ENABLE ROW LEVEL SECURITY;  -- service role only
+
+INSERT INTO _cascade_memory_config (key, value)
+VALUES ('embedding_dimensions', '768')
+ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = NOW();
@@ -0,0 +1,34 @@
+-- ============================================================
+-- 020: Persistent embedding cache
+-- ============================================================
+-- Memory recall embeds the query on every call and users repeat the same
+-- queries; each miss is a 100-300 ms Gemini request. CachedEmbedder
+-- (cascade_api/memory/embedders/cached.py) keeps an in-process LRU and
+-- falls back to this table, shared by every replica and restart. The key
+-- is sha256(model, dimensions, normalized text), so rows written by
+-- another model or width are never served.
+
+CREATE TABLE embedding_cache (
+  key TEXT PRIMARY KEY,
+  model TEXT NOT NULL,
+  dimensions INTEGER NOT NULL,
+  embedding REAL[] NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_embedding_cache_created ON embedding_cache(created_at);
+
+ALTER TABLE embedding_cache ENABLE ROW LEVEL SECURITY;  -- service role only
+
+-- Entries are cheap to recompute; drop old ones so one-off texts don't
+-- accumulate (run daily by the jobs.purge job)
+CREATE OR REPLACE FUNCTION purge_embedding_cache(p_keep INTERVAL DEFAULT INTERVAL '90 days')
+RETURNS INTEGER
+LANGUAGE sql VOLATILE AS $$
+  WITH gone AS (
+    DELETE FROM embedding_cache
+    WHERE created_at < NOW() - p_keep
+    RETURNING 1
+  )
+  SELECT COUNT(*)::int FROM gone;
+$$;
@@ -0,0 +1,37 @@
+-- ============================================================
+-- 021: Claim tokens for message deliveries
+-- ============================================================
+-- claim_delivery (015) reuses a row once its lease expires, but completion
+-- updated by id alone: a worker whose lease had lapsed could mark the row
+-- failed while the new owner was sending, or sent while the new send was
+-- still in flight. claim_delivery now also returns the row's attempts
+-- count, and mark_sent / mark_failed only update a row still claimed
+-- with that count (cascade_api/db/deliveries.py).
+
+DROP FUNCTION IF EXISTS claim_delivery(UUID, TEXT, DATE, INTEGER, INTEGER);
+
+-- Returns one row (id, attempts) when the caller won the claim, none otherwise.
+CREATE OR REPLACE FUNCTION claim_delivery(
+  p_tenant_id UUID,
+  p_message_type TEXT,
+  p_scheduled_for DATE,
+  p_lease_seconds INTEGER DEFAULT 300,
+  p_max_attempts INTEGER DEFAULT 3
+)
+RETURNS TABLE (id BIGINT, attempts SMALLINT)
+LANGUAGE sql VOLATILE AS $$
+  INSERT INTO message_deliveries AS d
+    (tenant_id, message_type, scheduled_for, status, lease_expires_at, sent_at)
+  VALUES (
+    p_tenant_id, p_message_type, p_scheduled_for, 'claimed',
+    NOW() + make_interval(secs => p_lease_seconds), NULL
+  )
+  ON CONFLICT (tenant_id, message_type, scheduled_for) DO UPDATE SET
+    status = 'claimed',
+    lease_expires_at = EXCLUDED.lease_expires_at,
+    attempts = d.attempts + 1,
+    last_error = NULL
+  WHERE d.attempts < p_max_attempts
+    AND (d.status = 'failed' OR (d.status = 'claimed' AND d.lease_expires_at < NOW()))
+  RETURNING d.id, d.attempts;
+$$;